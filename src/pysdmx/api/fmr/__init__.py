@@ -1,19 +1,28 @@
 """Retrieve metadata from an FMR instance."""
 
+import asyncio
 from enum import Enum
+from importlib.util import find_spec
+import re
+import time
+from types import TracebackType
 from typing import (
     Any,
+    Dict,
     Literal,
     NoReturn,
     Optional,
     Sequence,
     Tuple,
+    Type,
     Union,
 )
+from urllib.parse import parse_qs
 
 import httpx
-from msgspec.json import decode
+import msgspec
 
+from pysdmx.api.fmr.cache import Cache, CacheEntry
 from pysdmx.api.fmr.reader import Deserializer
 from pysdmx.api.qb import (
     ApiVersion,
@@ -70,6 +79,31 @@ class DataflowDetails(Enum):
 
 API_VERSION = ApiVersion.V2_0_0
 
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_CONCURRENCY = 10
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20
+)
+DEFAULT_CACHE_TTL = 300.0
+
+# Versions that may resolve to different artefacts over time
+WILDCARD_VERSION = re.compile(r"[+~*]|latest")
+# Both SDMX-JSON and Fusion-JSON flag final artefacts with isFinal
+FINAL_FLAG = re.compile(rb'"isFinal"\s*:\s*(true|false)')
+# References only pulling in artefacts used by the requested ones. Other
+# references (e.g. parents or all) may return artefacts created later on.
+FINAL_REFERENCES = frozenset(
+    r.value
+    for r in (
+        StructureReference.NONE,
+        StructureReference.CHILDREN,
+        StructureReference.DESCENDANTS,
+        StructureReference.CODELIST,
+        StructureReference.CONCEPT_SCHEME,
+        StructureReference.VALUE_LIST,
+    )
+)
+
 
 class __BaseRegistryClient:
     __schema_q = [DataflowDetails.ALL, DataflowDetails.SCHEMA]
@@ -80,8 +114,19 @@ class __BaseRegistryClient:
         api_endpoint: str,
         fmt: Format = Format.SDMX_JSON,
         pem: Optional[str] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool = False,
+        cache: Optional[Cache] = None,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
     ):
         """Instantiate a new client against the target endpoint."""
+        if http2 and find_spec("h2") is None:
+            raise Invalid(
+                "Missing dependency",
+                "HTTP/2 support requires the h2 package. It can be installed "
+                "with `pip install httpx[http2]`.",
+            )
         if api_endpoint.endswith("/"):
             api_endpoint = api_endpoint[0:-1]
         self.api_endpoint = api_endpoint
@@ -101,9 +146,109 @@ class __BaseRegistryClient:
             "Accept": self.format.value,
             "Accept-Encoding": "gzip, deflate",
         }
+        self.timeout = timeout
+        self.limits = limits
+        self.http2 = http2
+        self.cache = cache
+        self.cache_ttl = cache_ttl
+
+    def _client_options(self) -> Dict[str, Any]:
+        return {
+            "verify": self.ssl_context,
+            "timeout": self.timeout,
+            "limits": self.limits,
+            "http2": self.http2,
+        }
 
-    def _out(self, response: bytes, typ: Deserializer, *params: Any) -> Any:
-        return decode(response, type=typ).to_model(*params)
+    def _headers(self, is_ref_meta: bool) -> Dict[str, str]:
+        if is_ref_meta and self.format == Format.SDMX_JSON:
+            h = self.headers.copy()
+            h["Accept"] = "application/vnd.sdmx.metadata+json;version=2.0.0"
+            return h
+        return self.headers
+
+    def _cache_key(self, url: str, headers: Dict[str, str]) -> str:
+        # The same URL returns different content depending on the format
+        return f"{headers['Accept']} {url}"
+
+    def _cached(self, key: str) -> Optional[CacheEntry]:
+        return self.cache.get(key) if self.cache is not None else None
+
+    def _is_fresh(self, entry: CacheEntry) -> bool:
+        return entry.final or time.time() - entry.stored < self.cache_ttl
+
+    def _revalidation_headers(
+        self, headers: Dict[str, str], entry: Optional[CacheEntry]
+    ) -> Dict[str, str]:
+        if entry is None or not (entry.etag or entry.last_modified):
+            return headers
+        h = headers.copy()
+        if entry.etag:
+            h["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            h["If-Modified-Since"] = entry.last_modified
+        return h
+
+    def _is_final(self, url: str, content: bytes) -> bool:
+        path, _, query = url.partition("?")
+        path = path[len(self.api_endpoint) :]
+        # Schema queries also return the constraints attached to the
+        # structure, which may be added later on.
+        if not path.startswith("/structure/") or WILDCARD_VERSION.search(path):
+            return False
+        refs = parse_qs(query).get("references", [])
+        if any(r not in FINAL_REFERENCES for r in refs):
+            return False
+        flags = FINAL_FLAG.findall(content)
+        return bool(flags) and all(f == b"true" for f in flags)
+
+    def _response(
+        self,
+        key: str,
+        url: str,
+        response: httpx.Response,
+        entry: Optional[CacheEntry],
+    ) -> bytes:
+        if response.status_code == 304 and entry is not None:
+            content = entry.content
+            entry = msgspec.structs.replace(entry, stored=time.time())
+        else:
+            response.raise_for_status()
+            content = response.content
+            if self.cache is None:
+                return content
+            entry = CacheEntry(
+                content,
+                time.time(),
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+                self._is_final(url, content),
+            )
+        if self.cache is not None:
+            self.cache.set(key, entry)
+        return content
+
+    def _fallback(
+        self,
+        e: Union[httpx.RequestError, httpx.HTTPStatusError],
+        entry: Optional[CacheEntry],
+    ) -> bytes:
+        # Stale content is preferred over errors caused by the service
+        unavailable = (
+            isinstance(e, httpx.RequestError) or e.response.status_code >= 500
+        )
+        if entry is not None and unavailable:
+            return entry.content
+        self._error(e)
+
+    def _out(
+        self,
+        response: Union[bytes, memoryview],
+        typ: Deserializer,
+        *params: Any,
+    ) -> Any:
+        # Any buffer (e.g. a memoryview of the response) is decoded in place
+        return self.deser.decoder(typ).decode(response).to_model(*params)
 
     def _error(
         self,
@@ -282,6 +427,10 @@ class RegistryClient(__BaseRegistryClient):
     """A client to be used to retrieve metadata from the FMR.
 
     With this client, metadata will be retrieved in a synchronous fashion.
+
+    Connections to the service are pooled and kept alive between requests.
+    They are released when calling ``close()``, or when leaving the ``with``
+    block, if the client is used as a context manager.
     """
 
     def __init__(
@@ -289,6 +438,11 @@ class RegistryClient(__BaseRegistryClient):
         api_endpoint: str,
         format: Format = Format.SDMX_JSON,
         pem: Optional[str] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool = False,
+        cache: Optional[Cache] = None,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
     ):
         """Instantiate a new client against the target endpoint.
 
@@ -299,24 +453,76 @@ class RegistryClient(__BaseRegistryClient):
             pem: In case the service exposed a certificate created
                 by an unknown certificate authority, you can pass
                 a pem file for this authority using this parameter.
+            timeout: The timeout (in seconds) of the requests sent
+                to the service.
+            limits: The limits of the connection pool (maximum number
+                of connections, of keep-alive connections, etc.).
+            http2: Whether HTTP/2 should be used, if supported by the
+                service. This requires the h2 package.
+            cache: Where to keep the responses returned by the service,
+                e.g. a ``MemoryCache``, a ``DiskCache`` or a combination
+                of both (``TieredCache``). Responses are not cached
+                by default.
+            cache_ttl: How long (in seconds) cached responses can be used
+                without checking with the service whether they are still
+                valid. Responses only containing final artefacts, queried
+                using an explicit version and without including parents or
+                other referencing artefacts, are always valid. When the
+                service cannot be reached, cached responses are used
+                regardless of their age.
+        """
+        super().__init__(
+            api_endpoint,
+            format,
+            pem,
+            timeout,
+            limits,
+            http2,
+            cache,
+            cache_ttl,
+        )
+        self.__client: Optional[httpx.Client] = None
+
+    def __enter__(self) -> "RegistryClient":
+        """Use the client as a context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Close the connections when leaving the context."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the connections to the service.
+
+        The client can still be used afterwards, in which case new
+        connections will be opened.
         """
-        super().__init__(api_endpoint, format, pem)
+        if self.__client is not None:
+            self.__client.close()
+            self.__client = None
+
+    def __get_client(self) -> httpx.Client:
+        if self.__client is None or self.__client.is_closed:
+            self.__client = httpx.Client(**self._client_options())
+        return self.__client
 
     def __fetch(self, url: str, is_ref_meta: bool = False) -> bytes:
-        with httpx.Client(verify=self.ssl_context) as client:
-            try:
-                if is_ref_meta and self.format == Format.SDMX_JSON:
-                    h = self.headers.copy()
-                    h["Accept"] = (
-                        "application/vnd.sdmx.metadata+json;version=2.0.0"
-                    )
-                else:
-                    h = self.headers
-                r = client.get(url, headers=h)
-                r.raise_for_status()
-                return r.content
-            except (httpx.RequestError, httpx.HTTPStatusError) as e:
-                self._error(e)
+        h = self._headers(is_ref_meta)
+        key = self._cache_key(url, h)
+        entry = self._cached(key)
+        if entry is not None and self._is_fresh(entry):
+            return entry.content
+        client = self.__get_client()
+        try:
+            r = client.get(url, headers=self._revalidation_headers(h, entry))
+            return self._response(key, url, r, entry)
+        except (httpx.RequestError, httpx.HTTPStatusError) as e:
+            return self._fallback(e, entry)
 
     def __get_hierarchies_for_flow(
         self, agency: str, flow: str, version: str
@@ -629,6 +835,10 @@ class AsyncRegistryClient(__BaseRegistryClient):
     """A client to be used to retrieve metadata from the FMR.
 
     With this client, metadata will be retrieved in a asynchronous fashion.
+
+    Connections to the service are pooled and kept alive between requests.
+    They are released when calling ``aclose()``, or when leaving the
+    ``async with`` block, if the client is used as a context manager.
     """
 
     def __init__(
@@ -636,6 +846,11 @@ class AsyncRegistryClient(__BaseRegistryClient):
         api_endpoint: str,
         format: Format = Format.SDMX_JSON,
         pem: Optional[str] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool = False,
+        cache: Optional[Cache] = None,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
     ):
         """Instantiate a new client against the target endpoint.
 
@@ -646,27 +861,88 @@ class AsyncRegistryClient(__BaseRegistryClient):
             pem: In case the service exposed a certificate created
                 by an unknown certificate authority, you can pass
                 a pem file for this authority using this parameter.
+            timeout: The timeout (in seconds) of the requests sent
+                to the service.
+            limits: The limits of the connection pool (maximum number
+                of connections, of keep-alive connections, etc.).
+            http2: Whether HTTP/2 should be used, if supported by the
+                service. This requires the h2 package.
+            cache: Where to keep the responses returned by the service,
+                e.g. a ``MemoryCache``, a ``DiskCache`` or a combination
+                of both (``TieredCache``). Responses are not cached
+                by default.
+            cache_ttl: How long (in seconds) cached responses can be used
+                without checking with the service whether they are still
+                valid. Responses only containing final artefacts, queried
+                using an explicit version and without including parents or
+                other referencing artefacts, are always valid. When the
+                service cannot be reached, cached responses are used
+                regardless of their age.
         """
-        super().__init__(api_endpoint, format, pem)
+        super().__init__(
+            api_endpoint,
+            format,
+            pem,
+            timeout,
+            limits,
+            http2,
+            cache,
+            cache_ttl,
+        )
+        self.__client: Optional[httpx.AsyncClient] = None
+        self.__loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def __aenter__(self) -> "AsyncRegistryClient":
+        """Use the client as an asynchronous context manager."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Close the connections when leaving the context."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the connections to the service.
+
+        The client can still be used afterwards, in which case new
+        connections will be opened.
+        """
+        if self.__client is not None:
+            await self.__client.aclose()
+            self.__client = None
+            self.__loop = None
+
+    def __get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if (
+            self.__client is None
+            or self.__client.is_closed
+            or self.__loop is not loop
+        ):
+            # Pooled connections are bound to the event loop that opened
+            # them, hence they cannot be reused by another event loop.
+            self.__client = httpx.AsyncClient(**self._client_options())
+            self.__loop = loop
+        return self.__client
 
     async def __fetch(self, url: str, is_ref_meta: bool = False) -> bytes:
-        async with httpx.AsyncClient(
-            verify=self.ssl_context,
-            timeout=10.0,
-        ) as client:
-            try:
-                if is_ref_meta and self.format == Format.SDMX_JSON:
-                    h = self.headers.copy()
-                    h["Accept"] = (
-                        "application/vnd.sdmx.metadata+json;version=2.0.0"
-                    )
-                else:
-                    h = self.headers
-                r = await client.get(url, headers=h)
-                r.raise_for_status()
-                return r.content
-            except (httpx.RequestError, httpx.HTTPStatusError) as e:
-                self._error(e)
+        h = self._headers(is_ref_meta)
+        key = self._cache_key(url, h)
+        entry = self._cached(key)
+        if entry is not None and self._is_fresh(entry):
+            return entry.content
+        client = self.__get_client()
+        try:
+            r = await client.get(
+                url, headers=self._revalidation_headers(h, entry)
+            )
+            return self._response(key, url, r, entry)
+        except (httpx.RequestError, httpx.HTTPStatusError) as e:
+            return self._fallback(e, entry)
 
     async def __get_hierarchies_for_flow(
         self, agency: str, flow: str, version: str
@@ -813,18 +1089,75 @@ class AsyncRegistryClient(__BaseRegistryClient):
             if isinstance(context, SchemaContext)
             else SchemaContext(context)
         )
+        url = super()._schema_url(c, agency, id, version)
+        schema_q = self.__fetch(f"{self.api_endpoint}{url}")
         if c == SchemaContext.DATAFLOW:
-            ha = await self.__get_hierarchies_for_flow(agency, id, version)
+            hq = self.__get_hierarchies_for_flow(agency, id, version)
         elif c == SchemaContext.PROVISION_AGREEMENT:
-            ha = await self.__get_hierarchies_for_pra(agency, id, version)
+            hq = self.__get_hierarchies_for_pra(agency, id, version)
         else:
-            ha = ()
-        url = super()._schema_url(c, agency, id, version)
-        r = await self.__fetch(f"{self.api_endpoint}{url}")
+            hq = None
+        if hq is not None:
+            # The two queries are independent and are sent concurrently
+            ha, r = await asyncio.gather(hq, schema_q)
+        else:
+            ha, r = (), await schema_q
         return super()._out(
             r, self.deser.schema, c.value, agency, id, version, ha
         )
 
+    async def get_schemas(
+        self,
+        contexts: Sequence[
+            Tuple[
+                Union[
+                    SchemaContext,
+                    Literal["dataflow", "datastructure", "provisionagreement"],
+                ],
+                str,
+                str,
+                str,
+            ]
+        ],
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> Sequence[Schema]:
+        """Get the schemas matching the supplied parameters.
+
+        The schemas are retrieved concurrently.
+
+        Args:
+            contexts: The (context, agency, id, version) tuples identifying
+                the schemas to be retrieved. See ``get_schema`` for details.
+            max_concurrency: The maximum number of schemas that can be
+                retrieved at the same time.
+
+        Returns:
+            The requested schemas, in the order of the supplied contexts.
+
+        Raises:
+            Invalid: If the maximum concurrency is not a positive integer.
+        """
+        if max_concurrency < 1:
+            raise Invalid(
+                "Invalid concurrency",
+                "The maximum concurrency must be a positive integer.",
+            )
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch_schema(
+            context: Union[
+                SchemaContext,
+                Literal["dataflow", "datastructure", "provisionagreement"],
+            ],
+            agency: str,
+            id: str,
+            version: str,
+        ) -> Schema:
+            async with semaphore:
+                return await self.get_schema(context, agency, id, version)
+
+        return await asyncio.gather(*(fetch_schema(*c) for c in contexts))
+
     async def get_dataflow_details(
         self,
         agency: str,
@@ -855,18 +1188,16 @@ class AsyncRegistryClient(__BaseRegistryClient):
         """
         d = DataflowDetails(detail) if isinstance(detail, str) else detail
         sq, dr = super()._df_details(d)
+        url = super()._dataflow_details_url(agency, id, version, dr)
+        flow_q = self.__fetch(f"{self.api_endpoint}{url}")
         if sq:
-            schema = await self.get_schema(
-                "dataflow",
-                agency,
-                id,
-                version,
+            # The schema and the dataflow are retrieved concurrently
+            schema, out = await asyncio.gather(
+                self.get_schema("dataflow", agency, id, version), flow_q
             )
             cmps = schema.components
         else:
-            cmps = None
-        url = super()._dataflow_details_url(agency, id, version, dr)
-        out = await self.__fetch(f"{self.api_endpoint}{url}")
+            cmps, out = None, await flow_q
         return super()._out(
             out, self.deser.dataflow, cmps, agency, id, version
         )
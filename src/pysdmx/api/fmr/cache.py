@@ -0,0 +1,203 @@
+"""Caches for the responses returned by the FMR."""
+
+from collections import OrderedDict
+import hashlib
+import os
+from pathlib import Path
+import tempfile
+from threading import Lock
+from typing import Optional, Protocol, runtime_checkable, Union
+
+import msgspec
+
+from pysdmx.errors import Invalid
+
+
+class CacheEntry(msgspec.Struct, frozen=True):
+    """A response returned by the service.
+
+    Attributes:
+        content: The body of the response.
+        stored: When the response was received or last revalidated
+            (seconds since the epoch).
+        etag: The ETag of the response, if any.
+        last_modified: The Last-Modified header of the response, if any.
+        final: Whether the response only contains final artefacts, which
+            cannot change anymore.
+    """
+
+    content: bytes
+    stored: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    final: bool = False
+
+
+@runtime_checkable
+class Cache(Protocol):
+    """Stores the responses returned by the service."""
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Returns the entry stored under the key, if any."""
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Stores the entry under the key."""
+
+
+class MemoryCache:
+    """An in-memory cache, evicting the least recently used entries."""
+
+    def __init__(self, maxsize: int = 256):
+        """Instantiate a new in-memory cache.
+
+        Args:
+            maxsize: The maximum number of entries kept in memory.
+
+        Raises:
+            Invalid: If the maximum size is not a positive integer.
+        """
+        if maxsize < 1:
+            raise Invalid(
+                "Invalid cache size",
+                "The maximum size of the cache must be a positive integer.",
+            )
+        self.maxsize = maxsize
+        self.__entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self.__lock = Lock()
+
+    def __len__(self) -> int:
+        """Returns the number of entries in the cache."""
+        return len(self.__entries)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Returns the entry stored under the key, if any.
+
+        Args:
+            key: The key of the entry.
+
+        Returns:
+            The entry, or None if the key is not in the cache.
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                self.__entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Stores the entry under the key.
+
+        Args:
+            key: The key of the entry.
+            entry: The entry to be stored.
+        """
+        with self.__lock:
+            self.__entries[key] = entry
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.maxsize:
+                self.__entries.popitem(last=False)
+
+
+class DiskCache:
+    """A cache storing one file per entry in a directory.
+
+    The cache can be shared across processes, and survives restarts.
+    """
+
+    def __init__(self, directory: Union[str, "os.PathLike[str]"]):
+        """Instantiate a new on-disk cache.
+
+        Args:
+            directory: The directory where the entries are stored. It is
+                created if it does not exist.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.__encoder = msgspec.msgpack.Encoder()
+        self.__decoder = msgspec.msgpack.Decoder(CacheEntry)
+
+    def __path(self, key: str) -> Path:
+        name = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.directory / f"{name}.msgpack"
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Returns the entry stored under the key, if any.
+
+        Unreadable entries (e.g. written by an incompatible version) are
+        considered missing.
+
+        Args:
+            key: The key of the entry.
+
+        Returns:
+            The entry, or None if the key is not in the cache.
+        """
+        try:
+            with open(self.__path(key), "rb") as f:
+                return self.__decoder.decode(f.read())
+        except (OSError, msgspec.DecodeError):
+            return None
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Stores the entry under the key.
+
+        The entry is written to a temporary file first, so that concurrent
+        readers never see a partially written entry.
+
+        Args:
+            key: The key of the entry.
+            entry: The entry to be stored.
+        """
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(self.__encoder.encode(entry))
+            os.replace(tmp, self.__path(key))
+        finally:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+
+
+class TieredCache:
+    """Combines several caches, from the fastest to the slowest.
+
+    Entries are looked up in each cache in turn and copied to the faster
+    caches when found. New entries are written to all caches. A typical
+    setup combines a ``MemoryCache`` with a ``DiskCache``.
+    """
+
+    def __init__(self, *caches: Cache):
+        """Instantiate a new tiered cache.
+
+        Args:
+            *caches: The caches to be combined, from the fastest to
+                the slowest.
+        """
+        self.caches = caches
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Returns the entry stored under the key, if any.
+
+        Args:
+            key: The key of the entry.
+
+        Returns:
+            The entry, or None if the key is not in any of the caches.
+        """
+        for i, cache in enumerate(self.caches):
+            entry = cache.get(key)
+            if entry is not None:
+                for faster in self.caches[:i]:
+                    faster.set(key, entry)
+                return entry
+        return None
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Stores the entry under the key, in all the caches.
+
+        Args:
+            key: The key of the entry.
+            entry: The entry to be stored.
+        """
+        for cache in self.caches:
+            cache.set(key, entry)
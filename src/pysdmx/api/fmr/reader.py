@@ -1,7 +1,9 @@
 """API for FMR readers."""
 
-from dataclasses import dataclass
-from typing import Any, Protocol, runtime_checkable
+from dataclasses import dataclass, field
+from typing import Any, Dict, Protocol, runtime_checkable
+
+from msgspec.json import Decoder
 
 
 @runtime_checkable
@@ -14,7 +16,11 @@ class Deserializer(Protocol):
 
 @dataclass
 class Deserializers:
-    """Collection of deserializers for a format."""
+    """Collection of deserializers for a format.
+
+    The JSON decoders of the deserializers are created once, on first use,
+    and then reused for all the messages of the same type.
+    """
 
     agencies: Deserializer
     categories: Deserializer
@@ -28,3 +34,20 @@ class Deserializers:
     report: Deserializer
     mapping: Deserializer
     code_map: Deserializer
+    _decoders: Dict[Any, "Decoder[Any]"] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def decoder(self, typ: Deserializer) -> "Decoder[Any]":
+        """Returns the JSON decoder for the supplied deserializer.
+
+        Args:
+            typ: One of the deserializers of the collection.
+
+        Returns:
+            The decoder, creating (and caching) it if needed.
+        """
+        dec = self._decoders.get(typ)
+        if dec is None:
+            dec = self._decoders[typ] = Decoder(typ)
+        return dec
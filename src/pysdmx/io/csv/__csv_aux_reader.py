@@ -0,0 +1,132 @@
+"""Utilities shared by the SDMX-CSV readers."""
+
+from io import StringIO
+from os import PathLike
+from typing import (
+    Any,
+    Dict,
+    IO,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
+
+import pandas as pd
+
+from pysdmx.errors import Invalid
+from pysdmx.model import Schema
+
+CHUNKSIZE = 50000
+
+
+def get_dataset_attributes(
+    df_csv: pd.DataFrame, attribute_ids: Optional[Sequence[str]] = None
+) -> Dict[str, Any]:
+    """Extracts the dataset attributes.
+
+    By default, the columns with a unique value are the dataset attributes.
+    This cannot be decided on a chunk of data, as a column may be constant
+    in a chunk and vary in the next one. When reading in chunks, only the
+    supplied attributes (i.e. the attributes attached to the dataset, as
+    per the schema) are therefore extracted.
+
+    Args:
+        df_csv: The data (or the chunk of data) of one dataset.
+        attribute_ids: The IDs of the dataset-level attributes, if known.
+
+    Returns:
+        A dictionary with the dataset attributes.
+
+    Raises:
+        Invalid: If a dataset-level attribute has more than one value.
+    """
+    if attribute_ids is None:
+        attribute_ids = [
+            col for col in df_csv.columns if df_csv[col].nunique() == 1
+        ]
+    attributes = {}
+    for col in attribute_ids:
+        if col not in df_csv.columns:
+            continue
+        unique = df_csv[col].dropna().unique()
+        if len(unique) > 1:
+            raise Invalid(
+                "Invalid dataset attribute",
+                f"The dataset attribute {col} has more than one value.",
+            )
+        if len(unique) == 1:
+            attributes[col] = unique[0]
+    return attributes
+
+
+def get_dataset_attribute_ids(schema: Optional[Schema]) -> List[str]:
+    """Returns the IDs of the attributes attached to the dataset, if any.
+
+    Args:
+        schema: The schema describing the data, if any.
+
+    Returns:
+        The IDs of the dataset-level attributes of the schema.
+    """
+    if schema is None:
+        return []
+    return [
+        a.id for a in schema.components.attributes if a.attachment_level == "D"
+    ]
+
+
+def __source(infile: Union[str, "PathLike[str]", IO[Any]]) -> Any:
+    if isinstance(infile, str):
+        return StringIO(infile)
+    return infile
+
+
+def read_csv(
+    infile: Union[str, "PathLike[str]", IO[Any]], raw: bool = False
+) -> pd.DataFrame:
+    """Reads an SDMX-CSV file.
+
+    Args:
+        infile: Path to file, text or binary stream (e.g. a memory-mapped
+            file), or string.
+        raw: If True, the values are read as strings, without type
+            inference, and missing values are kept as such.
+
+    Returns:
+        The content of the CSV file.
+    """
+    dtype = str if raw else None
+    return pd.read_csv(__source(infile), encoding="utf-8-sig", dtype=dtype)
+
+
+def read_csv_chunks(
+    infile: Union[str, "PathLike[str]", IO[Any]],
+    chunksize: int = CHUNKSIZE,
+    raw: bool = False,
+) -> Iterator[pd.DataFrame]:
+    """Reads an SDMX-CSV file in chunks of at most ``chunksize`` rows.
+
+    Args:
+        infile: Path to file, text or binary stream, or string.
+        chunksize: The maximum number of rows per chunk.
+        raw: If True, the values are read as strings, without type
+            inference, and missing values are kept as such.
+
+    Returns:
+        An iterator over the chunks of the CSV file.
+
+    Raises:
+        Invalid: If the chunksize is not a positive integer.
+    """
+    if chunksize < 1:
+        raise Invalid(
+            "Invalid chunksize", "The chunksize must be a positive integer."
+        )
+    return pd.read_csv(
+        __source(infile),
+        chunksize=chunksize,
+        encoding="utf-8-sig",
+        dtype=str if raw else None,
+    )
@@ -1,13 +1,31 @@
 """SDMX 2.0 CSV reader module."""
 
-from io import StringIO
-from typing import Dict
+from os import PathLike
+from typing import (
+    Any,
+    Dict,
+    IO,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
 
 import pandas as pd
 
 from pysdmx.errors import Invalid
+from pysdmx.io.csv.__csv_aux_reader import (
+    CHUNKSIZE,
+    get_dataset_attribute_ids,
+    get_dataset_attributes,
+    read_csv,
+    read_csv_chunks,
+)
+from pysdmx.model import Schema
 from pysdmx.model.dataset import PandasDataset
 from pysdmx.model.message import ActionType
+from pysdmx.toolkit.dtypes import cast_columns
 
 ACTION_SDMX_CSV_MAPPER_READING = {
     "A": ActionType.Append,
@@ -17,7 +35,9 @@ ACTION_SDMX_CSV_MAPPER_READING = {
 }
 
 
-def __generate_dataset_from_sdmx_csv(data: pd.DataFrame) -> PandasDataset:
+def __generate_dataset_from_sdmx_csv(
+    data: pd.DataFrame, attribute_ids: Optional[Sequence[str]] = None
+) -> PandasDataset:
     # Extract Structure type and structure id
     action = ActionType.Information
     if "ACTION" in data.columns:
@@ -70,11 +90,7 @@ def __generate_dataset_from_sdmx_csv(data: pd.DataFrame) -> PandasDataset:
             "Check the docs for the proper values on STRUCTURE column.",
         )
     # Extract dataset attributes from sdmx-csv (all values are the same)
-    attributes = {
-        col: df_csv[col].iloc[0]
-        for col in df_csv.columns
-        if df_csv[col].nunique() == 1
-    }
+    attributes = get_dataset_attributes(df_csv, attribute_ids)
     for col in attributes:
         df_csv = df_csv.drop(col, axis=1)
 
@@ -87,20 +103,26 @@ def __generate_dataset_from_sdmx_csv(data: pd.DataFrame) -> PandasDataset:
     )
 
 
-def read(infile: str) -> Dict[str, PandasDataset]:
-    """Reads csv file and returns a payload dictionary.
+def __split_by_structure(
+    df_csv: pd.DataFrame,
+    schema: Optional[Schema] = None,
+    categorical: bool = True,
+) -> List[pd.DataFrame]:
+    """Checks the CSV content and splits it per structure.
 
     Args:
-        infile: Path to file, str.
+        df_csv: The content of the CSV file (or a chunk of it).
+        schema: The schema used to convert the values (read as strings)
+            to the types of the components, if any.
+        categorical: Whether the values of the enumerated components are
+            converted to categoricals (only used with a schema).
 
     Returns:
-        payload: dict.
+        A list of DataFrames, one per structure.
 
     Raises:
         Invalid: If it is an invalid CSV file.
     """
-    # Get Dataframe from CSV file
-    df_csv = pd.read_csv(StringIO(infile))
     # Drop empty columns
     df_csv = df_csv.dropna(axis=1, how="all")
 
@@ -116,8 +138,9 @@ def read(infile: str) -> Dict[str, PandasDataset]:
             "Check the docs for the proper structure on content.",
         )
 
-    # Convert all columns to strings
-    df_csv = df_csv.astype("str")
+    if schema is None:
+        # Convert all columns to strings
+        df_csv = df_csv.astype("str")
     # Check if any column headers contain ':', indicating mode, label or text
     mode_label_text = any(":" in x for x in df_csv.columns)
 
@@ -137,8 +160,38 @@ def read(infile: str) -> Dict[str, PandasDataset]:
 
     # Grouping columns to separate datasets
     grouping_columns = ["STRUCTURE", "STRUCTURE_ID"]
+    if schema is not None:
+        df_csv = cast_columns(df_csv, schema, categorical)
+
     # Separate SDMX-CSV in different datasets per Structure ID
-    list_df = [data for _, data in df_csv.groupby(grouping_columns)]
+    return [data for _, data in df_csv.groupby(grouping_columns)]
+
+
+def read(
+    infile: Union[str, "PathLike[str]", IO[Any]],
+    schema: Optional[Schema] = None,
+    categorical: bool = True,
+) -> Dict[str, PandasDataset]:
+    """Reads csv file and returns a payload dictionary.
+
+    Args:
+        infile: Path to file, text or binary stream (e.g. a memory-mapped
+            file), or string.
+        schema: The schema describing the data, if any. If supplied, the
+            values are converted to the types of the components (e.g.
+            floats for measures of type double). Otherwise, all values
+            are read as strings.
+        categorical: If True (and a schema is supplied), the values of
+            the components taking their values from a codelist (e.g. the
+            dimensions) are returned as categoricals, using the order of
+            the codes in the codelist.
+
+    Returns:
+        payload: dict.
+    """
+    # Get Dataframe from CSV file
+    df_csv = read_csv(infile, raw=schema is not None)
+    list_df = __split_by_structure(df_csv, schema, categorical)
 
     # Create a payload dictionary to store datasets with the
     # different unique_ids as keys
@@ -152,3 +205,34 @@ def read(infile: str) -> Dict[str, PandasDataset]:
 
     # Return the payload generated
     return payload
+
+
+def read_chunks(
+    infile: Union[str, "PathLike[str]", IO[Any]],
+    chunksize: int = CHUNKSIZE,
+    schema: Optional[Schema] = None,
+    categorical: bool = True,
+) -> Iterator[PandasDataset]:
+    """Reads csv file in chunks and yields the datasets piece by piece.
+
+    The file is read ``chunksize`` rows at a time, and each chunk is split
+    per structure. Whether a column is constant cannot be decided on a
+    chunk, so only the dataset-level attributes of the schema (if any) are
+    moved to the attributes of the datasets. All the other columns are
+    kept in the data of every chunk, unlike with ``read``, which moves all
+    the columns with a unique value to the attributes.
+
+    Args:
+        infile: Path to file, text or binary stream, or string.
+        chunksize: The maximum number of rows read at a time.
+        schema: The schema describing the data, if any (see ``read``).
+        categorical: Whether enumerated values are returned as
+            categoricals (see ``read``).
+
+    Yields:
+        The datasets in the file, split in chunks.
+    """
+    attribute_ids = get_dataset_attribute_ids(schema)
+    for chunk in read_csv_chunks(infile, chunksize, schema is not None):
+        for df in __split_by_structure(chunk, schema, categorical):
+            yield __generate_dataset_from_sdmx_csv(df, attribute_ids)
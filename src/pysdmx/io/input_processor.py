@@ -1,16 +1,28 @@
 """Processes the input that comes into read_sdmx function."""
 
 from io import BytesIO, TextIOWrapper
-from json import JSONDecodeError, loads
+import mmap
 from os import PathLike
 from pathlib import Path
-from typing import Tuple, Union
+from typing import Any, BinaryIO, Optional, Tuple, Union
+
+import msgspec
 
 from pysdmx.errors import Invalid
 
+# Number of bytes used to detect the format of the input
+SNIFF_SIZE = 4096
+
+BOM = "\ufeff"
+BOM_BYTES = BOM.encode("utf-8")
+
+CSV_FIRST_COLUMNS = ("DATAFLOW", "STRUCTURE")
+
 
 def __remove_bom(input_string: str) -> str:
-    return input_string.replace("\ufeff", "")
+    if input_string[:1] == BOM:
+        return input_string[1:]
+    return input_string
 
 
 def __check_xml(infile: str) -> bool:
@@ -20,8 +32,28 @@ def __check_xml(infile: str) -> bool:
     return False
 
 
+def __check_json(infile: str) -> bool:
+    return infile.lstrip()[:1] in ("{", "[")
+
+
+def __check_csv(infile: str) -> bool:
+    first_column = infile.split("\n", 1)[0].split(",", 1)[0]
+    return first_column.strip().strip('"') in CSV_FIRST_COLUMNS
+
+
+def __detect_format(head: str) -> Optional[str]:
+    """Detects the format of the input, using its first characters."""
+    if __check_xml(head):
+        return "xml"
+    if __check_json(head):
+        return "json"
+    if __check_csv(head):
+        return "csv"
+    return None
+
+
 def process_string_to_read(
-    infile: Union[str, Path, BytesIO]
+    infile: Union[str, Path, BytesIO],
 ) -> Tuple[str, str]:
     """Processes the input that comes into read_sdmx function.
 
@@ -41,7 +73,9 @@ def process_string_to_read(
 
     # Read from BytesIO
     elif isinstance(infile, BytesIO):
-        text_wrap = TextIOWrapper(infile, encoding="utf-8", errors="replace")
+        text_wrap = TextIOWrapper(
+            infile, encoding="utf-8-sig", errors="replace"
+        )
         out_str = text_wrap.read()
 
     elif isinstance(infile, str):
@@ -53,17 +87,73 @@ def process_string_to_read(
 
     out_str = __remove_bom(out_str)
 
-    # Check if string is a valid JSON
-    try:
-        loads(out_str)
-        return out_str, "json"
-    except JSONDecodeError:
-        pass
+    filetype = __detect_format(out_str[:SNIFF_SIZE])
+
+    # Check if string is a valid JSON, without building Python objects
+    if filetype == "json":
+        try:
+            msgspec.json.decode(out_str, type=msgspec.Raw)
+        except msgspec.DecodeError:
+            filetype = None
+
+    if filetype is None:
+        raise Invalid(
+            "Validation Error", f"Cannot parse input as SDMX. Found {infile}"
+        )
+    return out_str, filetype
+
+
+def process_file_to_read(
+    infile: Union[str, Path, BinaryIO],
+) -> Tuple[Any, str]:
+    """Detects the format of the input, without reading it in full.
 
-    # Check if string is a valid XML
-    if __check_xml(out_str):
-        return out_str, "xml"
+    Only the first bytes of the input are inspected. Files are memory-mapped
+    instead of being read into memory, and binary streams are returned as
+    they are, so that they can be passed directly to the readers. As JSON
+    messages are decoded from a buffer, memory-mapped JSON files are
+    returned as a memoryview, without the byte order mark, if any.
 
-    raise Invalid(
-        "Validation Error", f"Cannot parse input as SDMX. Found {infile}"
-    )
+    Args:
+        infile: Path to file, binary stream, or string.
+
+    Returns:
+        tuple: Tuple containing the input to be passed to the reader
+        (string, memory-mapped file, memoryview or binary stream) and the
+        format of the input.
+
+    Raises:
+        Invalid: If the input cannot be parsed as SDMX.
+    """
+    out: Any
+    if isinstance(infile, (Path, PathLike)):
+        with open(infile, "rb") as f:
+            if f.seek(0, 2) == 0:
+                raise Invalid(
+                    "Validation Error", f"Cannot parse empty file {infile}"
+                )
+            out = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        head_bytes = out[:SNIFF_SIZE]
+    elif isinstance(infile, str):
+        out = __remove_bom(infile)
+        head_bytes = out[:SNIFF_SIZE].encode("utf-8")
+    elif hasattr(infile, "read") and hasattr(infile, "seek"):
+        out = infile
+        position = infile.tell()
+        head_bytes = infile.read(SNIFF_SIZE)
+        infile.seek(position)
+    else:
+        raise Invalid(
+            "Validation Error", f"Cannot parse input of type {type(infile)}."
+        )
+
+    head = __remove_bom(head_bytes.decode("utf-8", errors="replace"))
+    filetype = __detect_format(head)
+    if filetype is None:
+        raise Invalid(
+            "Validation Error", f"Cannot parse input as SDMX. Found {infile}"
+        )
+    if filetype == "json" and isinstance(out, mmap.mmap):
+        offset = len(BOM_BYTES) if head_bytes.startswith(BOM_BYTES) else 0
+        out = memoryview(out)[offset:]
+    return out, filetype
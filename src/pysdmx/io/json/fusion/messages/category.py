@@ -8,7 +8,7 @@ from msgspec import Struct
 from pysdmx.io.json.fusion.messages.core import FusionString
 from pysdmx.io.json.fusion.messages.dataflow import FusionDataflowRef
 from pysdmx.model import Category, CategoryScheme as CS, DataflowRef
-from pysdmx.util import find_by_urn
+from pysdmx.util import ArtefactIndex, find_by_urn
 
 
 class FusionCategorisation(Struct, frozen=True):
@@ -69,8 +69,9 @@ class FusionCategorySchemeMessage(Struct, frozen=True):
 
     def __group_flows(self) -> defaultdict[str, list[DataflowRef]]:
         out: defaultdict[str, list[DataflowRef]] = defaultdict(list)
+        dataflows = ArtefactIndex(self.Dataflow)
         for c in self.Categorisation:
-            d = find_by_urn(self.Dataflow, c.structureReference)
+            d = find_by_urn(dataflows, c.structureReference)
             src = c.categoryReference[c.categoryReference.find(")") + 2 :]
             out[src].append(d.to_model())
         return out
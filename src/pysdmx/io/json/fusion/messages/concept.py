@@ -10,6 +10,7 @@ from pysdmx.io.json.fusion.messages.core import (
     FusionString,
 )
 from pysdmx.model.concept import Concept, ConceptScheme as CS, DataType
+from pysdmx.util import ArtefactIndex
 
 
 class FusionConcept(Struct, frozen=True):
@@ -29,7 +30,7 @@ class FusionConcept(Struct, frozen=True):
         )
         f = self.representation.to_facets() if self.representation else None
         c = (
-            self.representation.to_enumeration(codelists, [])
+            self.representation.to_enumeration(codelists)
             if self.representation
             else None
         )
@@ -63,13 +64,14 @@ class FusionConceptScheme(Struct, frozen=True, rename={"agency": "agencyId"}):
     def to_model(self, codelists: Sequence[FusionCodelist]) -> CS:
         """Converts a FusionConceptScheme to a standard concept scheme."""
         d = self.descriptions[0].value if self.descriptions else None
+        cls = ArtefactIndex(codelists)
         return CS(
             id=self.id,
             name=self.names[0].value,
             agency=self.agency,
             description=d,
             version=self.version,
-            items=[c.to_model(codelists) for c in self.items],
+            items=[c.to_model(cls) for c in self.items],
         )
 
 
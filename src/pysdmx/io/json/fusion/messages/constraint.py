@@ -4,6 +4,8 @@ from typing import Dict, Sequence
 
 from msgspec import Struct
 
+from pysdmx.util._value_selection import merge_cube_regions, ValueSelection
+
 
 class FusionKeyValue(Struct, frozen=True):
     """Fusion-JSON payload for the list of allowed values per component."""
@@ -15,7 +17,17 @@ class FusionContentConstraint(Struct, frozen=True):
     """Fusion-JSON payload for a content constraint."""
 
     includeCube: Dict[str, FusionKeyValue] = {}
-
-    def to_map(self) -> Dict[str, Sequence[str]]:
-        """Gets the list of allowed values for a component."""
-        return {k: v.values for k, v in self.includeCube.items()}
+    excludeCube: Dict[str, FusionKeyValue] = {}
+
+    def to_map(self) -> Dict[str, ValueSelection]:
+        """Gets the allowed values, per component."""
+        # An empty list of included values does not constrain the component
+        regions = [
+            (True, {k: v for k, v in self.includeCube.items() if v.values}),
+            (False, self.excludeCube),
+        ]
+        return merge_cube_regions(
+            (inc, {k: ValueSelection.of(v.values) for k, v in cube.items()})
+            for inc, cube in regions
+            if cube
+        )
@@ -7,6 +7,7 @@ import msgspec
 
 from pysdmx.model import ArrayBoundaries, Codelist, Facets
 from pysdmx.util import find_by_urn
+from pysdmx.util._value_selection import ValueSelection
 
 
 class FusionAnnotation(msgspec.Struct, frozen=True):
@@ -88,15 +89,15 @@ class FusionRepresentation(msgspec.Struct, frozen=True):
     def to_enumeration(
         self,
         codelists: Sequence[Any],
-        valid: Sequence[str],
+        valid: Optional[ValueSelection] = None,
     ) -> Optional[Codelist]:
         """Returns the list of codes allowed for this component."""
         if self.representation:
             a = find_by_urn(codelists, self.representation)
             cl = a.to_model()
-            codes = [
-                c.to_model() for c in a.items if not valid or c.id in valid
-            ]
+            if valid is None or valid.is_all:
+                return cl
+            codes = [c.to_model() for c in a.items if c.id in valid]
             return msgspec.structs.replace(cl, items=codes)
         return None
 
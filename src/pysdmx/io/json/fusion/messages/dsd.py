@@ -4,7 +4,7 @@ from typing import Dict, List, Optional, Sequence, Tuple
 
 from msgspec import Struct
 
-from pysdmx.errors import InternalError
+from pysdmx.errors import InternalError, NotFound
 from pysdmx.io.json.fusion.messages.code import FusionCodelist
 from pysdmx.io.json.fusion.messages.concept import (
     FusionConcept,
@@ -25,26 +25,37 @@ from pysdmx.model import (
     Role,
 )
 from pysdmx.util import parse_item_urn
+from pysdmx.util._value_selection import ValueSelection
 
 
-def _find_concept(
-    cs: Sequence[FusionConceptScheme],
-    urn: str,
-) -> FusionConcept:
+# The concepts, by agency, concept scheme ID, version and concept ID
+ConceptIndex = Dict[Tuple[str, str, str, str], FusionConcept]
+
+
+def _index_concepts(cs: Sequence[FusionConceptScheme]) -> ConceptIndex:
+    index: ConceptIndex = {}
+    for m in cs:
+        for c in m.items:
+            index.setdefault((m.agency, m.id, m.version, c.id), c)
+    return index
+
+
+def _find_concept(concepts: ConceptIndex, urn: str) -> FusionConcept:
     r = parse_item_urn(urn)
-    f = [
-        m
-        for m in cs
-        if (m.agency == r.agency and m.id == r.id and m.version == r.version)
-    ]
-    return [c for c in f[0].items if c.id == r.item_id][0]
+    c = concepts.get((r.agency, r.id, r.version, r.item_id))
+    if c is None:
+        raise NotFound(
+            "Not found",
+            f"Could not find a concept matching the following URN: {urn}.",
+        )
+    return c
 
 
 def _get_representation(
     id_: str,
     r: Optional[FusionRepresentation],
     cls: Sequence[FusionCodelist],
-    cons: Dict[str, Sequence[str]],
+    cons: Dict[str, ValueSelection],
 ) -> Tuple[
     Optional[DataType],
     Optional[Facets],
@@ -54,7 +65,7 @@ def _get_representation(
     ab = r.to_array_def() if r else None
     dt = DataType(r.textFormat.textType) if r and r.textFormat else None
     facets = r.to_facets() if r else None
-    codes = r.to_enumeration(cls, cons.get(id_, [])) if r else None
+    codes = r.to_enumeration(cls, cons.get(id_)) if r else None
     return (dt, facets, codes, ab)
 
 
@@ -98,13 +109,13 @@ class FusionAttribute(Struct, frozen=True):
 
     def to_model(
         self,
-        cs: Sequence[FusionConceptScheme],
+        concepts: ConceptIndex,
         cls: Sequence[FusionCodelist],
-        cons: Dict[str, Sequence[str]],
+        cons: Dict[str, ValueSelection],
         groups: Sequence[FusionGroup],
     ) -> Component:
         """Returns an attribute."""
-        c = _find_concept(cs, self.concept)
+        c = _find_concept(concepts, self.concept)
         dt, facets, codes, ab = _get_representation(
             self.id, self.representation, cls, cons
         )
@@ -135,13 +146,15 @@ class FusionAttributes(Struct, frozen=True):
 
     def to_model(
         self,
-        cs: Sequence[FusionConceptScheme],
+        concepts: ConceptIndex,
         cls: Sequence[FusionCodelist],
-        cons: Dict[str, Sequence[str]],
+        cons: Dict[str, ValueSelection],
         groups: Sequence[FusionGroup],
     ) -> List[Component]:
         """Returns the list of attributes."""
-        return [d.to_model(cs, cls, cons, groups) for d in self.attributes]
+        return [
+            d.to_model(concepts, cls, cons, groups) for d in self.attributes
+        ]
 
 
 class FusionDimension(Struct, frozen=True):
@@ -153,12 +166,12 @@ class FusionDimension(Struct, frozen=True):
 
     def to_model(
         self,
-        cs: Sequence[FusionConceptScheme],
+        concepts: ConceptIndex,
         cls: Sequence[FusionCodelist],
-        cons: Dict[str, Sequence[str]],
+        cons: Dict[str, ValueSelection],
     ) -> Component:
         """Returns a dimension."""
-        c = _find_concept(cs, self.concept)
+        c = _find_concept(concepts, self.concept)
         dt, facets, codes, ab = _get_representation(
             self.id, self.representation, cls, cons
         )
@@ -187,12 +200,12 @@ class FusionDimensions(Struct, frozen=True):
 
     def to_model(
         self,
-        cs: Sequence[FusionConceptScheme],
+        concepts: ConceptIndex,
         cls: Sequence[FusionCodelist],
-        cons: Dict[str, Sequence[str]],
+        cons: Dict[str, ValueSelection],
     ) -> List[Component]:
         """Returns the list of dimensions."""
-        return [d.to_model(cs, cls, cons) for d in self.dimensions]
+        return [d.to_model(concepts, cls, cons) for d in self.dimensions]
 
 
 class FusionMeasure(Struct, frozen=True):
@@ -205,12 +218,12 @@ class FusionMeasure(Struct, frozen=True):
 
     def to_model(
         self,
-        cs: Sequence[FusionConceptScheme],
+        concepts: ConceptIndex,
         cls: Sequence[FusionCodelist],
-        cons: Dict[str, Sequence[str]],
+        cons: Dict[str, ValueSelection],
     ) -> Component:
         """Returns a measure."""
-        c = _find_concept(cs, self.concept)
+        c = _find_concept(concepts, self.concept)
         dt, facets, codes, ab = _get_representation(
             self.id, self.representation, cls, cons
         )
@@ -253,17 +266,17 @@ class FusionDataStructure(Struct, frozen=True, rename={"agency": "agencyId"}):
     ) -> Components:
         """Returns the schema for this DSD."""
         comps = []
-        if constraints:
-            cons = constraints[0].to_map()
-        else:
-            cons = {}
-        comps.extend(self.dimensionList.to_model(cs, cls, cons))
+        cons = constraints[0].to_map() if constraints else {}
+        concepts = _index_concepts(cs)
+        comps.extend(self.dimensionList.to_model(concepts, cls, cons))
         if self.measures:
-            comps.extend([m.to_model(cs, cls, cons) for m in self.measures])
+            comps.extend(
+                [m.to_model(concepts, cls, cons) for m in self.measures]
+            )
         if self.attributeList:
             comps.extend(
                 self.attributeList.to_model(
-                    cs,
+                    concepts,
                     cls,
                     cons,
                     self.groups,
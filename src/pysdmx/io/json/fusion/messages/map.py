@@ -20,7 +20,7 @@ from pysdmx.model import (
     StructureMap as SM,
     ValueMap,
 )
-from pysdmx.util import find_by_urn
+from pysdmx.util import ArtefactIndex, find_by_urn
 
 
 class FusionSourceValue(Struct, frozen=True):
@@ -215,7 +215,9 @@ class FusionMappingMessage(Struct, frozen=True):
 
     def to_model(self) -> SM:
         """Returns the requested mapping definition."""
-        return self.StructureMap[0].to_model(self.RepresentationMap)
+        return self.StructureMap[0].to_model(
+            ArtefactIndex(self.RepresentationMap)
+        )
 
 
 class FusionRepresentationMapMessage(Struct, frozen=True):
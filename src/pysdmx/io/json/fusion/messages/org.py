@@ -7,7 +7,7 @@ from msgspec import Struct
 
 from pysdmx.io.json.fusion.messages.core import FusionString
 from pysdmx.model import Agency, Contact, DataflowRef, DataProvider
-from pysdmx.util import parse_urn
+from pysdmx.util import parse_urns
 
 
 class FusionContact(Struct, frozen=True):
@@ -117,18 +117,17 @@ class FusionProviderScheme(Struct, frozen=True):
 
     items: Sequence[FusionProvider]
 
-    def __get_df_ref(self, ref: str) -> DataflowRef:
-        a = parse_urn(ref)
-        return DataflowRef(id=a.id, agency=a.agency, version=a.version)
-
     def to_model(
         self, pas: Sequence[FusionProvisionAgreement]
     ) -> Sequence[DataProvider]:
         """Converts a FusionProviderScheme to a list of Organisations."""
         if pas:
             paprs: Dict[str, Set[DataflowRef]] = defaultdict(set)
-            for pa in pas:
-                df = self.__get_df_ref(pa.structureUsage)
+            # Many agreements typically reference the same dataflows
+            refs = parse_urns(pa.structureUsage for pa in pas)
+            for i, pa in enumerate(pas):
+                a = refs[i]
+                df = DataflowRef(id=a.id, agency=a.agency, version=a.version)
                 pr = pa.dataproviderRef[pa.dataproviderRef.rindex(".") + 1 :]
                 paprs[pr].add(df)
             prvs = [o.to_model() for o in self.items]
@@ -1,6 +1,6 @@
 """Collection of Fusion-JSON schemas for SDMX-REST schema queries."""
 
-from typing import List, Sequence
+from typing import Sequence
 
 import msgspec
 
@@ -10,7 +10,7 @@ from pysdmx.io.json.fusion.messages.constraint import FusionContentConstraint
 from pysdmx.io.json.fusion.messages.core import FusionLink
 from pysdmx.io.json.fusion.messages.dsd import FusionDataStructure
 from pysdmx.model import Components, HierarchyAssociation, Schema
-from pysdmx.util import parse_item_urn
+from pysdmx.util import ArtefactIndex, parse_item_urns
 
 
 class FusionHeader(msgspec.Struct, frozen=True):
@@ -38,16 +38,15 @@ class FusionSchemaMessage(msgspec.Struct, frozen=True):
         hierarchies: Sequence[HierarchyAssociation],
     ) -> Schema:
         """Returns the requested schema."""
-        cls: List[FusionCodelist] = []
-        cls.extend(self.Codelist)
-        cls.extend(self.ValueList)
+        cls = ArtefactIndex([*self.Codelist, *self.ValueList])
         components = self.DataStructure[0].get_components(
             self.ConceptScheme, cls, self.DataConstraint
         )
         comp_dict = {c.id: c for c in components}
         urns = [a.urn for a in self.meta.links]
-        for ha in hierarchies:
-            comp_id = parse_item_urn(ha.component_ref).item_id
+        refs = parse_item_urns(ha.component_ref for ha in hierarchies)
+        for i, ha in enumerate(hierarchies):
+            comp_id = refs[i].item_id
             h = msgspec.structs.replace(ha.hierarchy, operator=ha.operator)
             comp_dict[comp_id] = msgspec.structs.replace(
                 components[comp_id], local_codes=h
@@ -9,7 +9,7 @@ from msgspec import Struct
 from pysdmx.io.json.sdmxjson2.messages.core import JsonAnnotation
 from pysdmx.io.json.sdmxjson2.messages.dataflow import JsonDataflowRef
 from pysdmx.model import Category, CategoryScheme, DataflowRef
-from pysdmx.util import find_by_urn
+from pysdmx.util import ArtefactIndex, find_by_urn
 
 
 class JsonCategorisation(Struct, frozen=True, rename={"agency": "agencyID"}):
@@ -69,8 +69,9 @@ class JsonCategorySchemeMessage(Struct, frozen=True):
 
     def __group_flows(self) -> defaultdict[str, list[DataflowRef]]:
         out: defaultdict[str, list[DataflowRef]] = defaultdict(list)
+        dataflows = ArtefactIndex(self.data.dataflows)
         for c in self.data.categorisations:
-            d = find_by_urn(self.data.dataflows, c.target)
+            d = find_by_urn(dataflows, c.target)
             src = c.source[c.source.find(")") + 2 :]
             out[src].append(d.to_model())
         return out
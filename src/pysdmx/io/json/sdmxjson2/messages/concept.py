@@ -11,6 +11,7 @@ from pysdmx.io.json.sdmxjson2.messages.core import (
     JsonRepresentation,
 )
 from pysdmx.model import Codelist, Concept, ConceptScheme, DataType
+from pysdmx.util import ArtefactIndex
 
 
 class IsoConceptReference(Struct, frozen=True):
@@ -43,7 +44,7 @@ class JsonConcept(Struct, frozen=True):
             else:
                 dt = DataType.STRING
             facets = repr_.to_facets()
-            codes = repr_.to_enumeration(codelists, [])
+            codes = repr_.to_enumeration(codelists)
             cl_ref = repr_.enumeration
         else:
             dt = DataType.STRING
@@ -78,7 +79,7 @@ class JsonConceptScheme(Struct, frozen=True, rename={"agency": "agencyID"}):
 
     def to_model(self, codelists: Sequence[JsonCodelist]) -> ConceptScheme:
         """Converts a JsonConceptScheme to a standard concept scheme."""
-        cls = [c.to_model() for c in codelists]
+        cls = ArtefactIndex(c.to_model() for c in codelists)
         return ConceptScheme(
             id=self.id,
             name=self.name,
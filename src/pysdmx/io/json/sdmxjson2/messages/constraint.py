@@ -6,6 +6,7 @@ from typing import Dict, Literal, Optional, Sequence
 from msgspec import Struct
 
 from pysdmx.io.json.sdmxjson2.messages.core import JsonAnnotation
+from pysdmx.util._value_selection import merge_cube_regions, ValueSelection
 
 
 class JsonValue(Struct, frozen=True):
@@ -19,20 +20,28 @@ class JsonKeyValue(Struct, frozen=True):
 
     id: str
     values: Sequence[JsonValue]
+    include: bool = True
 
-    def to_model(self) -> Sequence[str]:
-        """Returns the requested list of values."""
-        return [v.value for v in self.values]
+    def to_model(self) -> ValueSelection:
+        """Returns the selected values."""
+        return ValueSelection.of((v.value for v in self.values), self.include)
 
 
 class JsonCubeRegion(Struct, frozen=True):
     """SDMX-JSON payload for a cube region."""
 
-    keyValues: Sequence[JsonKeyValue]
+    keyValues: Sequence[JsonKeyValue] = ()
+    include: bool = True
 
-    def to_map(self) -> Dict[str, Sequence[str]]:
-        """Gets the list of allowed values for a component."""
-        return {kv.id: kv.to_model() for kv in self.keyValues}
+    def to_map(self) -> Dict[str, ValueSelection]:
+        """Gets the values selected by the region, per component."""
+        # In an included region, an empty list of values does not
+        # constrain the component, i.e. all its values are selected.
+        return {
+            kv.id: kv.to_model()
+            for kv in self.keyValues
+            if kv.values or not self.include
+        }
 
 
 class JsonConstraintAttachment(Struct, frozen=True):
@@ -62,3 +71,9 @@ class JsonDataConstraint(Struct, frozen=True, rename={"agency": "agencyID"}):
     role: Optional[Literal["Allowed", "Actual"]] = None
     constraintAttachment: Optional[JsonConstraintAttachment] = None
     cubeRegions: Optional[Sequence[JsonCubeRegion]] = None
+
+    def to_map(self) -> Dict[str, ValueSelection]:
+        """Gets the allowed values, per component, for all the regions."""
+        return merge_cube_regions(
+            (r.include, r.to_map()) for r in self.cubeRegions or ()
+        )
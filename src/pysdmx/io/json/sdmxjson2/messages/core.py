@@ -7,6 +7,7 @@ import msgspec
 
 from pysdmx.model import ArrayBoundaries, Codelist, Facets
 from pysdmx.util import find_by_urn
+from pysdmx.util._value_selection import ValueSelection
 
 
 class JsonAnnotation(msgspec.Struct, frozen=True):
@@ -87,12 +88,25 @@ class JsonRepresentation(msgspec.Struct, frozen=True):
     def to_enumeration(
         self,
         codelists: Sequence[Codelist],
-        valid: Sequence[str],
+        valid: Optional[ValueSelection] = None,
     ) -> Optional[Codelist]:
-        """Returns the list of codes allowed for this component."""
+        """Returns the list of codes allowed for this component.
+
+        If the codes are not constrained, the codelist is returned as is,
+        i.e. it is shared by the components using it, instead of copied.
+
+        Args:
+            codelists: The codelists (or an index of the codelists).
+            valid: The values selected by the constraints, if any.
+
+        Returns:
+            The codelist, restricted to the selected codes, if any.
+        """
         if self.enumeration:
             a = find_by_urn(codelists, self.enumeration)
-            codes = [c for c in a.codes if not valid or c.id in valid]
+            if valid is None or valid.is_all:
+                return a
+            codes = [c for c in a.codes if c.id in valid]
             return msgspec.structs.replace(a, items=codes)
         return None
 
@@ -5,6 +5,7 @@ from typing import Dict, List, Optional, Sequence, Tuple
 
 from msgspec import Struct
 
+from pysdmx.errors import NotFound
 from pysdmx.io.json.sdmxjson2.messages.concept import (
     JsonConcept,
     JsonConceptScheme,
@@ -24,16 +25,30 @@ from pysdmx.model import (
     Role,
 )
 from pysdmx.util import parse_item_urn
+from pysdmx.util._value_selection import ValueSelection
 
 
-def _find_concept(cs: Sequence[JsonConceptScheme], urn: str) -> JsonConcept:
+# The concepts, by agency, concept scheme ID, version and concept ID
+ConceptIndex = Dict[Tuple[str, str, str, str], JsonConcept]
+
+
+def _index_concepts(cs: Sequence[JsonConceptScheme]) -> ConceptIndex:
+    index: ConceptIndex = {}
+    for m in cs:
+        for c in m.concepts:
+            index.setdefault((m.agency, m.id, m.version, c.id), c)
+    return index
+
+
+def _find_concept(concepts: ConceptIndex, urn: str) -> JsonConcept:
     r = parse_item_urn(urn)
-    f = [
-        m
-        for m in cs
-        if (m.agency == r.agency and m.id == r.id and m.version == r.version)
-    ]
-    return [c for c in f[0].concepts if c.id == r.item_id][0]
+    c = concepts.get((r.agency, r.id, r.version, r.item_id))
+    if c is None:
+        raise NotFound(
+            "Not found",
+            f"Could not find a concept matching the following URN: {urn}.",
+        )
+    return c
 
 
 def __get_type(repr_: JsonRepresentation) -> str:
@@ -50,15 +65,14 @@ def _get_representation(
     id_: str,
     local: Optional[JsonRepresentation],
     cls: Sequence[Codelist],
-    cons: Dict[str, Sequence[str]],
+    cons: Dict[str, ValueSelection],
 ) -> Tuple[
     Optional[DataType],
     Optional[Facets],
     Optional[Codelist],
     Optional[ArrayBoundaries],
 ]:
-    valid = cons.get(id_, [])
-    codes = local.to_enumeration(cls, valid) if local else None
+    codes = local.to_enumeration(cls, cons.get(id_)) if local else None
     dt = DataType(__get_type(local)) if local else None
     facets = local.to_facets() if local else None
     ab = local.to_array_def() if local else None
@@ -106,12 +120,12 @@ class JsonDimension(Struct, frozen=True):
 
     def to_model(
         self,
-        cs: Sequence[JsonConceptScheme],
+        concepts: ConceptIndex,
         cls: Sequence[Codelist],
-        cons: Dict[str, Sequence[str]],
+        cons: Dict[str, ValueSelection],
     ) -> Component:
         """Returns a component."""
-        c = _find_concept(cs, self.conceptIdentity)
+        c = _find_concept(concepts, self.conceptIdentity)
         dt, facets, codes, ab = _get_representation(
             self.id, self.localRepresentation, cls, cons
         )
@@ -142,13 +156,13 @@ class JsonAttribute(Struct, frozen=True):
 
     def to_model(
         self,
-        cs: Sequence[JsonConceptScheme],
+        concepts: ConceptIndex,
         cls: Sequence[Codelist],
-        cons: Dict[str, Sequence[str]],
+        cons: Dict[str, ValueSelection],
         groups: Sequence[JsonGroup],
     ) -> Component:
         """Returns a component."""
-        c = _find_concept(cs, self.conceptIdentity)
+        c = _find_concept(concepts, self.conceptIdentity)
         dt, facets, codes, ab = _get_representation(
             self.id, self.localRepresentation, cls, cons
         )
@@ -183,12 +197,12 @@ class JsonMeasure(Struct, frozen=True):
 
     def to_model(
         self,
-        cs: Sequence[JsonConceptScheme],
+        concepts: ConceptIndex,
         cls: Sequence[Codelist],
-        cons: Dict[str, Sequence[str]],
+        cons: Dict[str, ValueSelection],
     ) -> Component:
         """Returns a component."""
-        c = _find_concept(cs, self.conceptIdentity)
+        c = _find_concept(concepts, self.conceptIdentity)
         dt, facets, codes, ab = _get_representation(
             self.id, self.localRepresentation, cls, cons
         )
@@ -214,13 +228,15 @@ class JsonAttributes(Struct, frozen=True):
 
     def to_model(
         self,
-        cs: Sequence[JsonConceptScheme],
+        concepts: ConceptIndex,
         cls: Sequence[Codelist],
-        cons: Dict[str, Sequence[str]],
+        cons: Dict[str, ValueSelection],
         groups: Sequence[JsonGroup],
     ) -> List[Component]:
         """Returns the list of attributes."""
-        return [d.to_model(cs, cls, cons, groups) for d in self.attributes]
+        return [
+            d.to_model(concepts, cls, cons, groups) for d in self.attributes
+        ]
 
 
 class JsonDimensions(Struct, frozen=True):
@@ -231,14 +247,16 @@ class JsonDimensions(Struct, frozen=True):
 
     def to_model(
         self,
-        cs: Sequence[JsonConceptScheme],
+        concepts: ConceptIndex,
         cls: Sequence[Codelist],
-        cons: Dict[str, Sequence[str]],
+        cons: Dict[str, ValueSelection],
     ) -> List[Component]:
         """Returns the list of dimensions."""
         c = []
-        c.extend([d.to_model(cs, cls, cons) for d in self.dimensions])
-        c.extend([d.to_model(cs, cls, cons) for d in self.timeDimensions])
+        c.extend([d.to_model(concepts, cls, cons) for d in self.dimensions])
+        c.extend(
+            [d.to_model(concepts, cls, cons) for d in self.timeDimensions]
+        )
         return c
 
 
@@ -249,12 +267,12 @@ class JsonMeasures(Struct, frozen=True):
 
     def to_model(
         self,
-        cs: Sequence[JsonConceptScheme],
+        concepts: ConceptIndex,
         cls: Sequence[Codelist],
-        cons: Dict[str, Sequence[str]],
+        cons: Dict[str, ValueSelection],
     ) -> List[Component]:
         """Returns the list of measures."""
-        return [m.to_model(cs, cls, cons) for m in self.measures]
+        return [m.to_model(concepts, cls, cons) for m in self.measures]
 
 
 class JsonComponents(Struct, frozen=True):
@@ -273,17 +291,15 @@ class JsonComponents(Struct, frozen=True):
     ) -> Components:
         """Returns the schema for this DSD."""
         comps = []
-        if constraints and constraints[0].cubeRegions:
-            cons = constraints[0].cubeRegions[0].to_map()
-        else:
-            cons = {}
-        comps.extend(self.dimensionList.to_model(cs, cls, cons))
+        cons = constraints[0].to_map() if constraints else {}
+        concepts = _index_concepts(cs)
+        comps.extend(self.dimensionList.to_model(concepts, cls, cons))
         if self.measureList:
-            comps.extend(self.measureList.to_model(cs, cls, cons))
+            comps.extend(self.measureList.to_model(concepts, cls, cons))
         if self.attributeList:
             comps.extend(
                 self.attributeList.to_model(
-                    cs,
+                    concepts,
                     cls,
                     cons,
                     self.groups,
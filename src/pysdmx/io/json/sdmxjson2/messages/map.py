@@ -20,7 +20,7 @@ from pysdmx.model import (
     StructureMap,
     ValueMap,
 )
-from pysdmx.util import find_by_urn
+from pysdmx.util import ArtefactIndex, find_by_urn
 
 
 class JsonSourceValue(Struct, frozen=True):
@@ -257,7 +257,9 @@ class JsonStructureMaps(Struct, frozen=True):
 
     def to_model(self) -> StructureMap:
         """Returns the requested mapping definition."""
-        return self.structureMaps[0].to_model(self.representationMaps)
+        return self.structureMaps[0].to_model(
+            ArtefactIndex(self.representationMaps)
+        )
 
 
 class JsonMappingMessage(Struct, frozen=True):
@@ -9,7 +9,7 @@ from msgspec import Struct
 from pysdmx.io.json.sdmxjson2.messages.core import JsonAnnotation
 from pysdmx.io.json.sdmxjson2.messages.pa import JsonProvisionAgreement
 from pysdmx.model import Agency, DataflowRef, DataProvider
-from pysdmx.util import parse_urn
+from pysdmx.util import parse_urns
 
 
 class JsonDataProviderScheme(Struct, frozen=True):
@@ -24,18 +24,17 @@ class JsonDataProviderScheme(Struct, frozen=True):
     annotations: Optional[Sequence[JsonAnnotation]] = None
     isPartial: bool = False
 
-    def __get_df_ref(self, ref: str) -> DataflowRef:
-        a = parse_urn(ref)
-        return DataflowRef(id=a.id, agency=a.agency, version=a.version)
-
     def to_model(
         self, pas: Sequence[JsonProvisionAgreement]
     ) -> Sequence[DataProvider]:
         """Converts a JsonDataProviderScheme to a list of Organisations."""
         if pas:
             paprs: Dict[str, Set[DataflowRef]] = defaultdict(set)
-            for pa in pas:
-                df = self.__get_df_ref(pa.structureUsage)
+            # Many agreements typically reference the same dataflows
+            refs = parse_urns(pa.structureUsage for pa in pas)
+            for i, pa in enumerate(pas):
+                a = refs[i]
+                df = DataflowRef(id=a.id, agency=a.agency, version=a.version)
                 pr = pa.dataProvider[pa.dataProvider.rindex(".") + 1 :]
                 paprs[pr].add(df)
             return [
@@ -10,7 +10,7 @@ from pysdmx.io.json.sdmxjson2.messages.constraint import JsonDataConstraint
 from pysdmx.io.json.sdmxjson2.messages.core import JsonHeader
 from pysdmx.io.json.sdmxjson2.messages.dsd import JsonDataStructure
 from pysdmx.model import Components, HierarchyAssociation, Schema
-from pysdmx.util import parse_item_urn
+from pysdmx.util import ArtefactIndex, parse_item_urns
 
 
 class JsonSchemas(
@@ -27,8 +27,10 @@ class JsonSchemas(
 
     def to_model(self) -> Components:
         """Returns the requested schema."""
-        cls = [cl.to_model() for cl in self.codelists]
-        cls.extend([vl.to_model() for vl in self.valuelists])
+        cls = ArtefactIndex(
+            [cl.to_model() for cl in self.codelists]
+            + [vl.to_model() for vl in self.valuelists]
+        )
         return self.dataStructures[0].dataStructureComponents.to_model(
             self.conceptSchemes, cls, self.contentConstraints
         )
@@ -55,8 +57,9 @@ class JsonSchemaMessage(
         components = self.data.to_model()
         comp_dict = {c.id: c for c in components}
         urns = [a.urn for a in self.meta.links]
-        for ha in hierarchies:
-            comp_id = parse_item_urn(ha.component_ref).item_id
+        refs = parse_item_urns(ha.component_ref for ha in hierarchies)
+        for i, ha in enumerate(hierarchies):
+            comp_id = refs[i].item_id
             h = msgspec.structs.replace(ha.hierarchy, operator=ha.operator)
             comp_dict[comp_id] = msgspec.structs.replace(
                 components[comp_id], local_codes=h
@@ -1,6 +1,9 @@
 """Validates an SDMX-ML 2.1 XML file against the XSD schema."""
 
+from functools import lru_cache
 from io import BytesIO
+from threading import Lock
+from typing import Any, Union
 
 from lxml import etree
 from sdmxschemas import SDMX_ML_21_MESSAGE_PATH as SCHEMA_PATH
@@ -8,25 +11,52 @@ from sdmxschemas import SDMX_ML_21_MESSAGE_PATH as SCHEMA_PATH
 from pysdmx.errors import Invalid
 from pysdmx.io.xml.__allowed_lxml_errors import ALLOWED_ERRORS_CONTENT
 
+# The error log of a schema is overwritten by each validation
+VALIDATION_LOCK = Lock()
 
-def validate_doc(infile: str) -> None:
+
+@lru_cache(maxsize=None)
+def get_schema() -> etree.XMLSchema:
+    """Returns the XSD schema for SDMX-ML 2.1.
+
+    The schema is compiled on first use and then reused by all subsequent
+    validations in the process.
+
+    Returns:
+        The compiled XSD schema.
+    """
+    xmlschema_doc = etree.parse(SCHEMA_PATH)
+    return etree.XMLSchema(xmlschema_doc)
+
+
+def validate_doc(infile: Union[str, Any]) -> Any:
     """Validates the XML file against the XSD schema for SDMX-ML 2.1.
 
     Args:
-        infile (str): The path to the XML file to validate.
+        infile: The XML content, as a string or as a binary file-like
+            object (e.g. a memory-mapped file). The position of a
+            file-like object is restored after the validation.
+
+    Returns:
+        The parsed (lxml) document, so that it can be read without
+        parsing the input again.
 
     Raises:
         Invalid: If the XML file does not validate against the schema.
     """
     parser = etree.ETCompatXMLParser()
-    xmlschema_doc = etree.parse(SCHEMA_PATH)
-    xmlschema = etree.XMLSchema(xmlschema_doc)
-
-    bytes_infile = BytesIO(bytes(infile, "UTF_8"))
+    xmlschema = get_schema()
 
-    doc = etree.parse(bytes_infile, parser=parser)
-    if not xmlschema.validate(doc):
+    if isinstance(infile, str):
+        doc = etree.parse(BytesIO(bytes(infile, "UTF_8")), parser=parser)
+    else:
+        position = infile.tell()
+        doc = etree.parse(infile, parser=parser)
+        infile.seek(position)
+    with VALIDATION_LOCK:
+        is_valid = xmlschema.validate(doc)
         log_errors = list(xmlschema.error_log)  # type: ignore[call-overload]
+    if not is_valid:
         unhandled_errors = []
         for e in log_errors:
             unhandled_errors.append(e.message)
@@ -38,3 +68,4 @@ def validate_doc(infile: str) -> None:
 
         if len(severe_errors) > 0:
             raise Invalid("Validation Error", ";\n".join(severe_errors))
+    return doc
@@ -1,6 +1,6 @@
 """SDMX 2.1 XML reader package."""
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 import xmltodict
 
@@ -14,6 +14,7 @@ from pysdmx.io.xml.sdmx21.__parsing_config import (
     ERROR_TEXT,
     GENERIC,
     HEADER,
+    NAMESPACES_21,
     REG_INTERFACE,
     STRSPE,
     STRUCTURE,
@@ -25,11 +26,13 @@ from pysdmx.io.xml.sdmx21.reader.data_read import (
     __extract_structure,
     create_dataset,
 )
+from pysdmx.io.xml.sdmx21.reader.data_stream import read_xml_chunks
 from pysdmx.io.xml.sdmx21.reader.metadata_read import StructureParser
 from pysdmx.io.xml.sdmx21.reader.submission_reader import (
     handle_registry_interface,
 )
-from pysdmx.io.xml.utils import add_list
+from pysdmx.io.xml.utils import add_list, etree_to_dict
+from pysdmx.model import Schema
 
 MODES = {
     MessageType.GenericDataSet.value: GENERIC,
@@ -41,19 +44,30 @@ MODES = {
 
 
 def read_xml(
-    infile: str,
+    infile: Union[str, Any],
     validate: bool = True,
     mode: Optional[MessageType] = None,
     use_dataset_id: bool = False,
+    schema: Optional[Schema] = None,
+    categorical: bool = True,
 ) -> Dict[str, Any]:
     """Reads an SDMX-ML file and returns a dictionary with the parsed data.
 
     Args:
-        infile: Path to file, URL, or string.
+        infile: The XML content, as a string or as a binary file-like
+            object (e.g. a memory-mapped file).
         validate: If True, the XML data will be validated against the XSD.
         mode: The type of message to parse.
         use_dataset_id: If True, the dataset ID will be used as the key in the
             resulting dictionary.
+        schema: The schema describing the data, if any. If supplied, the
+            values of the datasets are converted to the types of the
+            components (e.g. floats for measures of type double).
+            Otherwise, the values are read as strings.
+        categorical: If True (and a schema is supplied), the values of
+            the components taking their values from a codelist (e.g. the
+            dimensions) are returned as categoricals, using the order of
+            the codes in the codelist.
 
     Returns:
         dict: Dictionary with the parsed data.
@@ -62,10 +76,14 @@ def read_xml(
         Invalid: If the SDMX data cannot be parsed.
     """
     if validate:
-        validate_doc(infile)
-    dict_info = xmltodict.parse(
-        infile, **XML_OPTIONS  # type: ignore[arg-type]
-    )
+        # The validated document is read directly, without parsing again
+        doc = validate_doc(infile)
+        dict_info = etree_to_dict(doc.getroot(), NAMESPACES_21)
+        del doc
+    else:
+        dict_info = xmltodict.parse(
+            infile, **XML_OPTIONS  # type: ignore[arg-type]
+        )
 
     del infile
 
@@ -75,13 +93,18 @@ def read_xml(
             f"Unable to parse sdmx file as {MODES[mode.value]} file",
         )
 
-    result = __generate_sdmx_objects_from_xml(dict_info, use_dataset_id)
+    result = __generate_sdmx_objects_from_xml(
+        dict_info, use_dataset_id, schema, categorical
+    )
 
     return result
 
 
 def __generate_sdmx_objects_from_xml(
-    dict_info: Dict[str, Any], use_dataset_id: bool = False
+    dict_info: Dict[str, Any],
+    use_dataset_id: bool = False,
+    schema: Optional[Schema] = None,
+    categorical: bool = True,
 ) -> Dict[str, Any]:
     """Generates SDMX objects from the XML dictionary (xmltodict).
 
@@ -89,6 +112,8 @@ def __generate_sdmx_objects_from_xml(
         dict_info: XML dictionary (xmltodict)
         use_dataset_id: Use the dataset ID as the key in
             the resulting dictionary
+        schema: The schema used to convert the values of the datasets
+        categorical: Return enumerated values as categoricals
 
     Returns:
         dict: Dictionary with the parsed data.
@@ -102,9 +127,11 @@ def __generate_sdmx_objects_from_xml(
         text = dict_info[ERROR][ERROR_MESSAGE][ERROR_TEXT]
         raise Invalid("Invalid", f"{code}: {text}")
     if STRSPE in dict_info:
-        return __parse_dataset(dict_info[STRSPE], mode=STRSPE)
+        return __parse_dataset(dict_info[STRSPE], STRSPE, schema, categorical)
     if GENERIC in dict_info:
-        return __parse_dataset(dict_info[GENERIC], mode=GENERIC)
+        return __parse_dataset(
+            dict_info[GENERIC], GENERIC, schema, categorical
+        )
     if STRUCTURE in dict_info:
         return StructureParser().format_structures(
             dict_info[STRUCTURE][STRUCTURES]
@@ -114,12 +141,19 @@ def __generate_sdmx_objects_from_xml(
     raise NotImplemented("Unsupported", "Cannot parse input as SDMX.")
 
 
-def __parse_dataset(message_info: Dict[str, Any], mode: str) -> Dict[str, Any]:
+def __parse_dataset(
+    message_info: Dict[str, Any],
+    mode: str,
+    schema: Optional[Schema] = None,
+    categorical: bool = True,
+) -> Dict[str, Any]:
     """Parse dataset.
 
     Args:
         message_info: Dict.
         mode: Str.
+        schema: Optional Schema.
+        categorical: Bool.
 
     Returns:
         A dictionary of datasets.
@@ -128,6 +162,9 @@ def __parse_dataset(message_info: Dict[str, Any], mode: str) -> Dict[str, Any]:
     dataset_info = add_list(message_info[DATASET])
     datasets = {}
     for dataset in dataset_info:
-        ds = create_dataset(dataset, str_info, mode)
+        ds = create_dataset(dataset, str_info, mode, schema, categorical)
         datasets[ds.short_urn] = ds
     return datasets
+
+
+__all__ = ["read_xml", "read_xml_chunks"]
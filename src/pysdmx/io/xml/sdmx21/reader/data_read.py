@@ -1,6 +1,5 @@
 """Module that holds the necessary functions to read xml files."""
 
-import itertools
 from typing import Any, Dict, List, Optional
 
 import numpy as np
@@ -31,7 +30,9 @@ from pysdmx.io.xml.sdmx21.__parsing_config import (
     VERSION,
 )
 from pysdmx.io.xml.utils import add_list
+from pysdmx.model import Schema
 from pysdmx.model.dataset import PandasDataset
+from pysdmx.toolkit.dtypes import cast_columns
 from pysdmx.util import parse_urn
 
 READING_CHUNKSIZE = 50000
@@ -45,27 +46,102 @@ def __get_element_to_list(data: Dict[str, Any], mode: Any) -> Dict[str, Any]:
     return obs
 
 
-def __process_df(
-    test_list: List[Dict[str, Any]],
-    df: Optional[pd.DataFrame],
-    is_end: bool = False,
-) -> Any:
-    if not is_end and len(test_list) <= READING_CHUNKSIZE:
-        return test_list, df
-    if df is not None:
-        df = pd.concat([df, pd.DataFrame(test_list)], ignore_index=True)
-    else:
-        df = pd.DataFrame(test_list)
+class ColumnarBuilder:
+    """Accumulates observations column by column.
 
-    del test_list[:]
+    Values are appended to one list per component, and the resulting
+    DataFrame is created only once, when calling :meth:`to_frame`. Keys
+    that are shared by consecutive rows (e.g. the series key and the
+    series attributes) are stored only once, together with the number of
+    rows they apply to, and they are broadcast when creating the frame.
+    """
 
-    return test_list, df
+    def __init__(self) -> None:
+        """Instantiates an empty builder."""
+        self.__length = 0
+        self.__columns: Dict[str, None] = {}
+        self.__keys: List[Dict[str, Any]] = [{}]
+        self.__counts: List[int] = [0]
+        self.__values: Dict[str, List[Any]] = {}
+        self.__indices: Dict[str, List[int]] = {}
+
+    def __len__(self) -> int:
+        """Returns the number of rows added to the builder."""
+        return self.__length
+
+    def set_keys(self, keys: Dict[str, Any]) -> None:
+        """Sets the values shared by the rows that will be added next.
+
+        Args:
+            keys: The values shared by the next rows, e.g. the series key
+                and the series attributes.
+        """
+        for k in keys:
+            self.__columns.setdefault(k)
+        self.__keys.append(keys)
+        self.__counts.append(0)
+
+    def add_row(self, values: Dict[str, Any]) -> None:
+        """Adds a row, on top of the current keys.
+
+        Args:
+            values: The values of the row (e.g. an observation). An empty
+                dictionary adds a row with the current keys only.
+        """
+        row = self.__length
+        for k, v in values.items():
+            if k not in self.__values:
+                self.__columns.setdefault(k)
+                self.__values[k] = []
+                if row > 0:
+                    self.__indices[k] = []
+            col = self.__values[k]
+            if k in self.__indices:
+                self.__indices[k].append(row)
+            elif len(col) != row:
+                # The column is missing in some rows: track positions
+                self.__indices[k] = list(range(len(col))) + [row]
+            col.append(v)
+        self.__counts[-1] += 1
+        self.__length += 1
+
+    def __broadcast_keys(self, column: str) -> Any:
+        per_key = np.array(
+            [k.get(column, np.nan) for k in self.__keys], dtype=object
+        )
+        return np.repeat(per_key, self.__counts)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Creates a DataFrame out of the accumulated values.
+
+        Returns:
+            A DataFrame, with the columns in order of appearance, and
+            NaN where a component is not reported.
+        """
+        data = {}
+        key_columns = {k for keys in self.__keys for k in keys}
+        for column in self.__columns:
+            arr = None
+            if column in key_columns:
+                arr = self.__broadcast_keys(column)
+            if column in self.__values:
+                values = np.array(self.__values[column], dtype=object)
+                indices: Any = self.__indices.get(
+                    column, slice(0, len(values))
+                )
+                if arr is None and len(values) == self.__length:
+                    arr = values
+                else:
+                    if arr is None:
+                        arr = np.full(self.__length, np.nan, dtype=object)
+                    arr[indices] = values
+            data[column] = arr
+        return pd.DataFrame(data)
 
 
 def __reading_generic_series(dataset: Dict[str, Any]) -> pd.DataFrame:
     # Generic Series
-    test_list = []
-    df = None
+    builder = ColumnarBuilder()
     dataset[SERIES] = add_list(dataset[SERIES])
     for series in dataset[SERIES]:
         keys = {}
@@ -77,6 +153,7 @@ def __reading_generic_series(dataset: Dict[str, Any]) -> pd.DataFrame:
             series[ATTRIBUTES][VALUE] = add_list(series[ATTRIBUTES][VALUE])
             for v in series[ATTRIBUTES][VALUE]:
                 keys[v[ID]] = v[VALUE.lower()]
+        builder.set_keys(keys)
         if OBS in series:
             series[OBS] = add_list(series[OBS])
 
@@ -90,68 +167,53 @@ def __reading_generic_series(dataset: Dict[str, Any]) -> pd.DataFrame:
                         **obs,
                         **__get_element_to_list(data, mode=ATTRIBUTES),
                     }
-                test_list.append({**keys, **obs})
+                builder.add_row(obs)
         else:
-            test_list.append(keys)
-        test_list, df = __process_df(test_list, df)
+            builder.add_row({})
 
-    test_list, df = __process_df(test_list, df, is_end=True)
-
-    return df
+    return builder.to_frame()
 
 
 def __reading_generic_all(dataset: Dict[str, Any]) -> pd.DataFrame:
     # Generic All Dimensions
-    test_list = []
-    df = None
+    builder = ColumnarBuilder()
     dataset[OBS] = add_list(dataset[OBS])
     for data in dataset[OBS]:
-        obs: Dict[str, Any] = {}
         obs = {
-            **obs,
             **__get_element_to_list(data, mode=OBSKEY),
             OBSVALUE.upper(): data[OBSVALUE][VALUE.lower()],
         }
         if ATTRIBUTES in data:
             obs = {**obs, **__get_element_to_list(data, mode=ATTRIBUTES)}
-        test_list.append({**obs})
-        test_list, df = __process_df(test_list, df)
+        builder.add_row(obs)
 
-    test_list, df = __process_df(test_list, df, is_end=True)
-
-    return df
+    return builder.to_frame()
 
 
 def __reading_str_series(dataset: Dict[str, Any]) -> pd.DataFrame:
     # Structure Specific Series
-    test_list = []
-    df = None
+    builder = ColumnarBuilder()
     dataset[SERIES] = add_list(dataset[SERIES])
     for data in dataset[SERIES]:
-        keys = dict(itertools.islice(data.items(), len(data)))
+        keys = {k: v for k, v in data.items() if k != OBS}
+        builder.set_keys(keys)
         if OBS in data:
-            del keys[OBS]
             data[OBS] = add_list(data[OBS])
             for j in data[OBS]:
-                test_list.append({**keys, **j})
+                builder.add_row(j)
         else:
-            test_list.append(keys)
-        test_list, df = __process_df(test_list, df)
+            builder.add_row({})
 
-    test_list, df = __process_df(test_list, df, is_end=True)
-
-    return df
+    return builder.to_frame()
 
 
 def __reading_group_data(dataset: Dict[str, Any]) -> pd.DataFrame:
     # Structure Specific Group Data
-    test_list = []
-    df = None
+    builder = ColumnarBuilder()
     dataset[GROUP] = add_list(dataset[GROUP])
     for data in dataset[GROUP]:
-        test_list.append(dict(data.items()))
-        test_list, df = __process_df(test_list, df)
-    test_list, df = __process_df(test_list, df, is_end=True)
+        builder.add_row(data)
+    df = builder.to_frame()
 
     cols_to_delete = [x for x in df.columns if ":type" in x]
     for x in cols_to_delete:
@@ -250,7 +312,9 @@ def __extract_structure(structure: Any) -> Any:
 
 
 def __parse_structure_specific_data(
-    dataset: Dict[str, Any], structure_info: Dict[str, Any]
+    dataset: Dict[str, Any],
+    structure_info: Dict[str, Any],
+    schema: Optional[Schema] = None,
 ) -> PandasDataset:
     attached_attributes = __get_at_att_str(dataset)
 
@@ -267,7 +331,9 @@ def __parse_structure_specific_data(
     else:
         dataset[OBS] = add_list(dataset[OBS])
         # Structure Specific All dimensions
-        df = pd.DataFrame(dataset[OBS]).replace(np.nan, "")
+        df = pd.DataFrame(dataset[OBS])
+        if schema is None:
+            df = df.replace(np.nan, "")
 
     urn = (
         "urn:sdmx:org.sdmx.infomodel.datastructure."
@@ -302,8 +368,40 @@ def __parse_generic_data(
     )
 
 
+def rename_generic_columns(
+    df: pd.DataFrame, schema: Schema, dim_at_obs: Optional[str]
+) -> pd.DataFrame:
+    """Renames the columns of Generic data to the IDs of the components.
+
+    Generic messages hold the observation value and the dimension at the
+    observation level in generic elements, which are read as the
+    ``OBSVALUE`` and ``ObsDimension`` columns.
+
+    Args:
+        df: The data read from a Generic message.
+        schema: The schema describing the data.
+        dim_at_obs: The dimension at the observation level, as per
+            the header of the message.
+
+    Returns:
+        The data, with the columns named after the primary measure and
+        the dimension at the observation level.
+    """
+    columns = {}
+    measures = schema.components.measures
+    if len(measures) == 1:
+        columns[OBSVALUE.upper()] = measures[0].id
+    if dim_at_obs and dim_at_obs != "AllDimensions":
+        columns[OBS_DIM] = dim_at_obs
+    return df.rename(columns=columns)
+
+
 def create_dataset(
-    dataset: Any, str_info: Dict[str, Any], global_mode: Any
+    dataset: Any,
+    str_info: Dict[str, Any],
+    global_mode: Any,
+    schema: Optional[Schema] = None,
+    categorical: bool = True,
 ) -> PandasDataset:
     """Creates the dataset from the xml file.
 
@@ -316,6 +414,10 @@ def create_dataset(
             such as agency_id, id and its version.
         global_mode: Identifies if the xml file has
             Generic data or a StructureSpecificData.
+        schema: The schema used to convert the values to the types
+            of the components, if any.
+        categorical: Whether the values of the enumerated components
+            are converted to categoricals (only used with a schema).
 
     Returns:
         A pandas dataframe with the created dataset will be returned.
@@ -331,6 +433,13 @@ def create_dataset(
         )
     structure_info = str_info[dataset[STRREF]]
     if STRSPE == global_mode:
-        return __parse_structure_specific_data(dataset, structure_info)
+        ds = __parse_structure_specific_data(dataset, structure_info, schema)
     else:
-        return __parse_generic_data(dataset, structure_info)
+        ds = __parse_generic_data(dataset, structure_info)
+        if schema is not None:
+            ds.data = rename_generic_columns(
+                ds.data, schema, structure_info[DIM_OBS]
+            )
+    if schema is not None:
+        ds.data = cast_columns(ds.data, schema, categorical)
+    return ds
@@ -0,0 +1,315 @@
+"""Streaming reader for SDMX-ML 2.1 data messages.
+
+Instead of building the full xmltodict representation of the message, the
+document is walked with ``lxml.etree.iterparse``. Observations are added to
+a columnar builder as soon as they have been parsed and the processed
+elements are cleared, so that the memory footprint depends on the chunk
+size rather than on the size of the file.
+"""
+
+from io import BytesIO
+from os import PathLike
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Union
+
+from lxml import etree
+import numpy as np
+import pandas as pd
+import xmltodict
+
+from pysdmx.errors import Invalid, NotFound, NotImplemented
+from pysdmx.io.xml.sdmx21.__parsing_config import (
+    ATTRIBUTES,
+    DATASET,
+    DIM_OBS,
+    GENERIC,
+    GROUP,
+    HEADER,
+    ID,
+    OBS,
+    OBS_DIM,
+    OBSKEY,
+    OBSVALUE,
+    SERIES,
+    STRREF,
+    STRSPE,
+    STRUCTURE,
+    VALUE,
+    XML_OPTIONS,
+)
+from pysdmx.io.xml.sdmx21.reader.data_read import (
+    __extract_structure,
+    __get_at_att_str,
+    ColumnarBuilder,
+    READING_CHUNKSIZE,
+    rename_generic_columns,
+)
+from pysdmx.model import Schema
+from pysdmx.model.dataset import PandasDataset
+from pysdmx.toolkit.dtypes import cast_columns
+
+XSI_NS = "http://www.w3.org/2001/XMLSchema-instance"
+
+
+def __local_name(tag: Any) -> str:
+    return etree.QName(tag).localname
+
+
+def __attributes(element: Any) -> Dict[str, str]:
+    """Returns the attributes of an element, without namespaces.
+
+    The xsi prefix is kept, as done by xmltodict with the parsing options
+    used by the non-streaming reader.
+
+    Args:
+        element: The lxml element.
+
+    Returns:
+        A dictionary with the attributes of the element.
+    """
+    out = {}
+    for k, v in element.attrib.items():
+        qname = etree.QName(k)
+        if qname.namespace == XSI_NS:
+            out[f"xsi:{qname.localname}"] = v
+        else:
+            out[qname.localname] = v
+    return out
+
+
+def __values(element: Any) -> Dict[str, str]:
+    """Returns the generic Value children of an element as a dict."""
+    return {
+        v.get(ID): v.get(VALUE.lower())
+        for v in element
+        if __local_name(v.tag) == VALUE
+    }
+
+
+def __release(element: Any) -> None:
+    """Clears an element and the already processed siblings."""
+    element.clear()
+    parent = element.getparent()
+    if parent is not None:
+        while element.getprevious() is not None:
+            del parent[0]
+
+
+def __generic_obs(element: Any) -> Dict[str, Any]:
+    obs: Dict[str, Any] = {}
+    for child in element:
+        name = __local_name(child.tag)
+        if name == OBS_DIM:
+            obs[OBS_DIM] = child.get(VALUE.lower())
+        elif name == OBSKEY:
+            obs.update(__values(child))
+        elif name == OBSVALUE:
+            obs[OBSVALUE.upper()] = child.get(VALUE.lower())
+        elif name == ATTRIBUTES:
+            obs.update(__values(child))
+    return obs
+
+
+def __header_structures(element: Any) -> Dict[str, Any]:
+    header = xmltodict.parse(
+        etree.tostring(element), **XML_OPTIONS  # type: ignore[arg-type]
+    )
+    return __extract_structure(header[HEADER][STRUCTURE])
+
+
+def __new_dataset(
+    element: Any, mode: str, str_info: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Holds the information about the dataset being parsed."""
+    attributes = __attributes(element)
+    if attributes.get(STRREF) not in str_info:
+        raise NotFound(
+            "Unknown structure",
+            f"Cannot find the structure reference "
+            f"of this dataset:{attributes.get(STRREF)}",
+        )
+    structure_info = str_info[attributes[STRREF]]
+    urn = (
+        "urn:sdmx:org.sdmx.infomodel.datastructure."
+        f"{structure_info['structure_type']}={structure_info['unique_id']}"
+    )
+    return {
+        "urn": urn,
+        "mode": mode,
+        "dim_obs": structure_info[DIM_OBS],
+        "attributes": __get_at_att_str(attributes) if mode == STRSPE else {},
+        "groups": [],
+        "builder": ColumnarBuilder(),
+        "series_keys": {},
+        "series_obs": 0,
+        "all_dimensions": True,
+        "chunks": 0,
+        "closed": False,
+    }
+
+
+def __flush(
+    ds: Dict[str, Any],
+    schema: Optional[Schema] = None,
+    categorical: bool = True,
+) -> PandasDataset:
+    """Turns the accumulated rows into a dataset."""
+    df = ds["builder"].to_frame()
+    ds["builder"] = ColumnarBuilder()
+    if ds["series_obs"]:
+        # The current series continues in the next chunk
+        ds["builder"].set_keys(ds["series_keys"])
+    ds["chunks"] += 1
+    if ds["mode"] == STRSPE:
+        if ds["all_dimensions"] and schema is None:
+            df = df.replace(np.nan, "")
+        elif ds["groups"]:
+            df = __merge_groups(df, ds["groups"])
+    elif schema is not None:
+        df = rename_generic_columns(df, schema, ds["dim_obs"])
+    if schema is not None:
+        df = cast_columns(df, schema, categorical)
+    return PandasDataset(
+        structure=ds["urn"], attributes=dict(ds["attributes"]), data=df
+    )
+
+
+def __merge_groups(
+    df: pd.DataFrame, groups: List[Dict[str, Any]]
+) -> pd.DataFrame:
+    df_group = pd.DataFrame(groups)
+    cols_to_delete = [x for x in df_group.columns if ":type" in x]
+    for x in cols_to_delete:
+        del df_group[x]
+    df_group = df_group.drop_duplicates(keep="first").reset_index(drop=True)
+    common_columns = list(set(df.columns).intersection(set(df_group.columns)))
+    return pd.merge(df, df_group, on=common_columns, how="left")
+
+
+def __source(infile: Union[str, "PathLike[str]", BinaryIO]) -> Any:
+    if isinstance(infile, PathLike):
+        return str(infile)
+    if isinstance(infile, str):
+        return BytesIO(infile.encode("utf-8"))
+    return infile
+
+
+def __start_element(
+    ds: Optional[Dict[str, Any]],
+    element: Any,
+    mode: str,
+    str_info: Dict[str, Any],
+) -> Optional[Dict[str, Any]]:
+    """Handles the start of an element and returns the current dataset."""
+    name = __local_name(element.tag)
+    if name == DATASET:
+        return __new_dataset(element, mode, str_info)
+    if ds is not None and name == SERIES:
+        ds["all_dimensions"] = False
+        ds["series_obs"] = 0
+        ds["series_keys"] = __attributes(element) if mode == STRSPE else {}
+    return ds
+
+
+def __process_element(
+    ds: Dict[str, Any], element: Any, name: str, parent_name: str
+) -> None:
+    """Adds the information of a fully parsed element to the dataset."""
+    if name == DATASET:
+        ds["closed"] = True
+    elif name == GROUP and parent_name == DATASET:
+        ds["groups"].append(__attributes(element))
+    elif name == ATTRIBUTES and parent_name == DATASET:
+        ds["attributes"] = __values(element)
+    elif name == OBS and parent_name in (SERIES, DATASET):
+        if ds["mode"] == STRSPE:
+            obs = __attributes(element)
+        else:
+            obs = __generic_obs(element)
+        if not ds["series_obs"]:
+            ds["builder"].set_keys(ds["series_keys"])
+        ds["builder"].add_row(obs)
+        ds["series_obs"] += 1
+    elif name == SERIES and parent_name == DATASET:
+        if not ds["series_obs"]:
+            ds["builder"].set_keys(ds["series_keys"])
+            ds["builder"].add_row({})
+        ds["series_obs"] = 0
+    elif parent_name == SERIES and ds["mode"] == GENERIC:
+        # SeriesKey and Attributes of a Generic series
+        ds["series_keys"].update(__values(element))
+        return
+    else:
+        return
+    __release(element)
+
+
+def __is_ready(ds: Dict[str, Any], chunksize: int) -> bool:
+    """Whether a chunk of the dataset must be yielded."""
+    if ds["closed"]:
+        return len(ds["builder"]) > 0 or not ds["chunks"]
+    return len(ds["builder"]) >= chunksize
+
+
+def read_xml_chunks(
+    infile: Union[str, "PathLike[str]", BinaryIO],
+    chunksize: int = READING_CHUNKSIZE,
+    schema: Optional[Schema] = None,
+    categorical: bool = True,
+) -> Iterator[PandasDataset]:
+    """Reads an SDMX-ML data message and yields datasets of bounded size.
+
+    The message is parsed incrementally, hence the whole document is never
+    held in memory. Each yielded dataset holds at most ``chunksize`` rows
+    of one of the datasets in the message. Group attributes (in
+    Structure Specific data) are merged into each chunk.
+
+    Validation against the XSD is not performed, as it requires the full
+    document. Use :func:`read_xml` if validation is needed.
+
+    Args:
+        infile: Path to file, binary stream, or string.
+        chunksize: The maximum number of rows per yielded dataset.
+        schema: The schema describing the data, if any. If supplied, the
+            values are converted to the types of the components.
+        categorical: Whether the values of the enumerated components
+            are returned as categoricals (only used with a schema).
+
+    Yields:
+        The datasets in the message, split in chunks.
+
+    Raises:
+        Invalid: If the chunksize is not a positive integer.
+        NotImplemented: If the message is not a data message.
+    """
+    if chunksize < 1:
+        raise Invalid(
+            "Invalid chunksize", "The chunksize must be a positive integer."
+        )
+    str_info: Dict[str, Any] = {}
+    ds: Optional[Dict[str, Any]] = None
+    context = etree.iterparse(__source(infile), events=("start", "end"))
+    _, root = next(context)
+    mode = __local_name(root.tag)
+    if mode not in (STRSPE, GENERIC):
+        raise NotImplemented(
+            "Unsupported", "Only data messages can be read in chunks."
+        )
+    for event, element in context:
+        if event == "start":
+            ds = __start_element(ds, element, mode, str_info)
+            continue
+        parent = element.getparent()
+        if parent is None:
+            break
+        name = __local_name(element.tag)
+        parent_name = __local_name(parent.tag)
+        if name == HEADER and parent_name == mode:
+            str_info = __header_structures(element)
+            __release(element)
+        elif ds is not None:
+            __process_element(ds, element, name, parent_name)
+            if __is_ready(ds, chunksize):
+                yield __flush(ds, schema, categorical)
+            if ds["closed"]:
+                ds = None
+    del context
@@ -1,6 +1,6 @@
 """Parsers for reading metadata."""
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from msgspec import Struct
 
@@ -65,7 +65,7 @@ from pysdmx.model import (
 )
 from pysdmx.model.__base import Agency, Annotation, Contact, Item, ItemScheme
 from pysdmx.model.message import CONCEPTS, ORGS
-from pysdmx.util import find_by_urn
+from pysdmx.util import ArtefactIndex, find_by_urn
 
 SCHEMES_CLASSES = {CL: Codelist, AGENCIES: ItemScheme, CS: ConceptScheme}
 ITEMS_CLASSES = {AGENCY: Agency, CODE: Code, CON: Concept}
@@ -76,6 +76,7 @@ class StructureParser(Struct):
 
     agencies: Dict[str, Any] = {}
     codelists: Dict[str, Any] = {}
+    codelist_index: Optional[ArtefactIndex] = None
     concepts: Dict[str, Any] = {}
     datastructures: Dict[str, Any] = {}
     dataflows: Dict[str, Any] = {}
@@ -240,10 +241,10 @@ class StructureParser(Struct):
         if (
             "Enumeration" in json_rep
             and URN in json_rep["Enumeration"]
-            and len(self.codelists) > 0
+            and self.codelist_index
         ):
             codelist = find_by_urn(
-                list(self.codelists.values()),
+                self.codelist_index,
                 json_rep["Enumeration"][URN],
             )
             json_obj["codes"] = codelist.codes
@@ -327,6 +328,7 @@ class StructureParser(Struct):
         if CLS in json_meta:
             structures[CLS] = self.__format_scheme(json_meta[CLS], CL, CODE)
             self.codelists = structures[CLS]
+            self.codelist_index = ArtefactIndex(self.codelists.values())
         if CONCEPTS in json_meta:
             structures[CONCEPTS] = self.__format_scheme(
                 json_meta[CONCEPTS], CS, CON
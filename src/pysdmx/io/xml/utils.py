@@ -1,6 +1,6 @@
 """Utility functions for XML parsing and serialization."""
 
-from typing import Any, List
+from typing import Any, Dict, List, Optional
 
 
 def add_list(element: Any) -> List[Any]:
@@ -19,3 +19,94 @@ def add_list(element: Any) -> List[Any]:
     if not isinstance(element, list):
         element = [element]
     return element
+
+
+def etree_to_dict(
+    element: Any, namespaces: Dict[str, Optional[str]]
+) -> Dict[str, Any]:
+    """Converts an lxml element into a dictionary, as xmltodict would do.
+
+    The conventions are the ones of ``xmltodict.parse``, when namespaces
+    are processed, with an empty attribute prefix and ``dict`` as
+    dictionary constructor. This allows using an already parsed (e.g.
+    validated) document, instead of parsing the input a second time.
+
+    Args:
+        element: The lxml element to convert (e.g. the root of a document)
+        namespaces: The mapping of namespaces to prefixes. Namespaces
+            mapped to None are removed from the names.
+
+    Returns:
+        A dictionary with the content of the element
+    """
+    names: Dict[str, str] = {}
+    return {
+        __build_name(element.tag, namespaces, names): __element_value(
+            element, {}, namespaces, names
+        )
+    }
+
+
+def __build_name(
+    tag: str, namespaces: Dict[str, Optional[str]], names: Dict[str, str]
+) -> str:
+    if tag in names:
+        return names[tag]
+    name = tag
+    if tag[:1] == "{":
+        namespace, local_name = tag[1:].split("}", 1)
+        short_namespace = namespaces.get(namespace, namespace)
+        name = (
+            f"{short_namespace}:{local_name}"
+            if short_namespace
+            else local_name
+        )
+    names[tag] = name
+    return name
+
+
+def __element_value(
+    element: Any,
+    parent_nsmap: Dict[Optional[str], str],
+    namespaces: Dict[str, Optional[str]],
+    names: Dict[str, str],
+) -> Any:
+    item: Optional[Dict[str, Any]] = None
+    if element.attrib:
+        item = {
+            __build_name(k, namespaces, names): v
+            for k, v in element.attrib.items()
+        }
+    nsmap = element.nsmap
+    declarations = {
+        prefix or "": uri
+        for prefix, uri in nsmap.items()
+        if parent_nsmap.get(prefix) != uri
+    }
+    if declarations:
+        item = item if item is not None else {}
+        item["xmlns"] = declarations
+
+    data = [element.text] if element.text else []
+    for child in element:
+        if child.tail:
+            data.append(child.tail)
+        if not isinstance(child.tag, str):
+            # Comments and processing instructions
+            continue
+        item = item if item is not None else {}
+        name = __build_name(child.tag, namespaces, names)
+        value = __element_value(child, nsmap, namespaces, names)
+        if name not in item:
+            item[name] = value
+        elif isinstance(item[name], list):
+            item[name].append(value)
+        else:
+            item[name] = [item[name], value]
+
+    text = "".join(data).strip() or None
+    if item is None:
+        return text
+    if text:
+        item["#text"] = text
+    return item
@@ -1,5 +1,7 @@
 from datetime import datetime
-from typing import Any, Dict, Optional, Sequence, Union
+from functools import cached_property
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Mapping, Optional, Sequence, Union
 
 from msgspec import Struct
 
@@ -238,12 +240,18 @@ class MaintainableArtefact(
             )
 
 
-class ItemScheme(MaintainableArtefact, frozen=True, omit_defaults=True):
+class ItemScheme(
+    MaintainableArtefact, frozen=True, omit_defaults=True, dict=True
+):
     """ItemScheme class.
 
     The descriptive information for an arrangement or division of objects
     into groups based on characteristics, which the objects have in common.
 
+    Items can be looked up by ID in constant time. The index is built the
+    first time it is needed and is then kept with the scheme. It is not
+    part of the scheme fields, hence it is neither serialized nor compared.
+
     Attributes:
         items: The list of items in the scheme.
         is_partial: Whether the scheme is partial.
@@ -252,6 +260,23 @@ class ItemScheme(MaintainableArtefact, frozen=True, omit_defaults=True):
     items: Sequence[Item] = ()
     is_partial: bool = False
 
+    def _build_index(self) -> Dict[str, Item]:
+        """Map the IDs used to look up items to the items."""
+        index: Dict[str, Item] = {}
+        for item in self.items:
+            index.setdefault(item.id, item)
+        return index
+
+    @cached_property
+    def _index(self) -> Mapping[str, Item]:
+        """The read-only index of the items, by ID."""
+        return MappingProxyType(self._build_index())
+
+    @cached_property
+    def ids(self) -> FrozenSet[str]:
+        """The IDs of the items in the scheme."""
+        return frozenset(self._index)
+
 
 class DataflowRef(MaintainableArtefact, frozen=True, omit_defaults=True):
     """Provide core information about a dataflow.
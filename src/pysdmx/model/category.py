@@ -4,7 +4,7 @@ An example of a category scheme is one which categorises data, sometimes
 known as a subject matter domain scheme or a data category scheme.
 """
 
-from typing import Iterator, List, Optional, Sequence, Set
+from typing import Dict, Iterator, List, Optional, Sequence, Set
 
 from pysdmx.model.__base import DataflowRef, Item, ItemScheme
 
@@ -87,12 +87,12 @@ class CategoryScheme(ItemScheme, frozen=True, omit_defaults=True):
         return self.__get_count(self.categories)
 
     def __getitem__(self, id_: str) -> Optional[Category]:
-        """Return the category identified by the given ID."""
-        return self.__extract_cat(self.categories, id_)
+        """Return the category identified by the given ID (or dotted path)."""
+        return self._index.get(id_)  # type: ignore[return-value]
 
     def __contains__(self, id_: str) -> bool:
         """Whether there is a category with the supplied ID in the scheme."""
-        return bool(self.__getitem__(id_))
+        return id_ in self._index
 
     def __get_count(self, categories: Sequence[Category]) -> int:
         """Return the number of categories at all levels."""
@@ -102,20 +102,20 @@ class CategoryScheme(ItemScheme, frozen=True, omit_defaults=True):
                 count += self.__get_count(cat.categories)
         return count
 
-    def __extract_cat(
-        self, categories: Sequence[Category], id_: str
-    ) -> Optional[Category]:
-        if "." in id_:
-            ids = id_.split(".")
-            out = list(filter(lambda cat: cat.id == ids[0], categories))
-            if out:
-                pkey = ".".join(ids[1:])
-                return self.__extract_cat(out[0].categories, pkey)
-        else:
-            out = list(filter(lambda cat: cat.id == id_, categories))
-            if out:
-                return out[0]
-        return None
+    def _build_index(self) -> Dict[str, Item]:
+        """Map the path of the categories to the categories."""
+        index: Dict[str, Item] = {}
+        self.__index_cat(index, self.categories, "")
+        return index
+
+    def __index_cat(
+        self, index: Dict[str, Item], categories: Sequence[Category], path: str
+    ) -> None:
+        for cat in categories:
+            key = f"{path}{cat.id}"
+            if key not in index:
+                index[key] = cat
+                self.__index_cat(index, cat.categories, f"{key}.")
 
     def __extract_flows(self, c: Category) -> Sequence[DataflowRef]:
         flows: List[DataflowRef] = []
@@ -16,8 +16,20 @@ seems to be the vast majority of the cases), thereby leaving the
 representation of hierarchical relationships to hierarchies only.
 """
 
+from collections import defaultdict
 from datetime import datetime
-from typing import Iterator, Literal, Optional, Sequence
+from functools import cached_property
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 from msgspec import Struct
 
@@ -83,15 +95,11 @@ class Codelist(ItemScheme, frozen=True, omit_defaults=True):
 
     def __getitem__(self, id_: str) -> Optional[Code]:
         """Return the code identified by the supplied ID."""
-        out = list(filter(lambda code: code.id == id_, self.codes))
-        if len(out) == 0:
-            return None
-        else:
-            return out[0]
+        return self._index.get(id_)  # type: ignore[return-value]
 
     def __contains__(self, id_: str) -> bool:
         """Whether a code with the supplied ID is present in the codelist."""
-        return bool(self.__getitem__(id_))
+        return id_ in self._index
 
 
 class HierarchicalCode(Struct, frozen=True, omit_defaults=True):
@@ -140,8 +148,70 @@ class HierarchicalCode(Struct, frozen=True, omit_defaults=True):
             out = f"{out} ({self.name})"
         return out
 
+    def __hash__(self) -> int:
+        """Returns the code's hash."""
+        # Child codes are left out, so that hashing the root of a large
+        # tree is cheap. Equal codes still have the same hash.
+        return hash(
+            (
+                self.id,
+                self.name,
+                self.description,
+                self.valid_from,
+                self.valid_to,
+                self.rel_valid_from,
+                self.rel_valid_to,
+            )
+        )
+
+
+class _HierarchyIndex:
+    """A flattened view of the codes in a hierarchy.
+
+    Paths are the dotted IDs of the codes and of their parents (e.g.
+    1.11.111). As when navigating the tree, if siblings share the same ID,
+    the path refers to the first one.
+    """
 
-class Hierarchy(Struct, frozen=True, omit_defaults=True):
+    def __init__(self, codes: Sequence[HierarchicalCode]) -> None:
+        self.count = 0
+        self.nodes: Dict[str, HierarchicalCode] = {}
+        self.paths: Dict[str, List[str]] = defaultdict(list)
+        self.codes: Dict[str, Dict[HierarchicalCode, None]] = defaultdict(dict)
+        self.all_codes: Dict[HierarchicalCode, None] = {}
+        parents: Dict[str, Set[str]] = defaultdict(set)
+        children: Dict[str, Set[str]] = defaultdict(set)
+        ancestors: Dict[str, Set[str]] = defaultdict(set)
+        descendants: Dict[str, Set[str]] = defaultdict(set)
+        stack: List[Tuple[HierarchicalCode, Tuple[str, ...], bool]] = [
+            (c, (), True) for c in reversed(codes)
+        ]
+        while stack:
+            code, above, reachable = stack.pop()
+            self.count += 1
+            self.codes[code.id][code] = None
+            self.all_codes[code] = None
+            path = ".".join((*above, code.id))
+            # Only the first sibling with a given ID can be reached by path
+            reachable = reachable and path not in self.nodes
+            if reachable:
+                self.nodes[path] = code
+                self.paths[code.id].append(path)
+            if above:
+                parents[code.id].add(above[-1])
+                children[above[-1]].add(code.id)
+            ancestors[code.id].update(above)
+            for a in above:
+                descendants[a].add(code.id)
+            ids = (*above, code.id)
+            stack.extend((c, ids, reachable) for c in reversed(code.codes))
+        self.parents = {k: frozenset(v) for k, v in parents.items()}
+        self.children = {k: frozenset(v) for k, v in children.items()}
+        self.ancestors = {k: frozenset(v) for k, v in ancestors.items()}
+        self.descendants = {k: frozenset(v) for k, v in descendants.items()}
+
+
+class Hierarchy(Struct, frozen=True, omit_defaults=True, dict=True):
     """An immutable collection of codes, organized hierarchically.
 
     A hierarchy is **maintained by its agency**, typically, an organisation
@@ -184,53 +254,20 @@ class Hierarchy(Struct, frozen=True, omit_defaults=True):
 
     def __len__(self) -> int:
         """Return the number of codes in the hierarchy."""
-        return self.__get_count(self.codes)
+        return self.__index.count
 
     def __getitem__(self, id_: str) -> Optional[HierarchicalCode]:
         """Return the code identified by the supplied ID."""
-        return self.__extract_code(self.codes, id_)
+        return self.__index.nodes.get(id_)
 
     def __contains__(self, id_: str) -> bool:
         """Whether a code with the supplied ID is present in the hierarchy."""
-        return bool(self.__getitem__(id_))
-
-    def __get_count(self, codes: Sequence[HierarchicalCode]) -> int:
-        """Return the number of codes at all levels."""
-        count = len(codes)
-        for code in codes:
-            if code.codes:
-                count += self.__get_count(code.codes)
-        return count
-
-    def __extract_code(
-        self, codes: Sequence[HierarchicalCode], id_: str
-    ) -> Optional[HierarchicalCode]:
-        if "." in id_:
-            ids = id_.split(".")
-            out = list(filter(lambda c: c.id == ids[0], codes))
-            if out:
-                pkey = ".".join(ids[1:])
-                return self.__extract_code(out[0].codes, pkey)
-        else:
-            out = list(filter(lambda c: c.id == id_, codes))
-            if out:
-                return out[0]
-        return None
-
-    def __by_id(
-        self,
-        id: str,
-        codes: Sequence[HierarchicalCode],
-        out: Optional[Sequence[HierarchicalCode]] = None,
-    ) -> Sequence[HierarchicalCode]:
-        if out is None:
-            out = []
-        for i in codes:
-            if i.id == id and i not in out:
-                out.append(i)  # type: ignore[attr-defined]
-            if i.codes:
-                self.__by_id(id, i.codes, out)
-        return out
+        return id_ in self.__index.nodes
+
+    @cached_property
+    def __index(self) -> _HierarchyIndex:
+        """The index of the codes, built on first use."""
+        return _HierarchyIndex(self.codes)
 
     def by_id(self, id: str) -> Sequence[HierarchicalCode]:
         """Get a code without knowing its parent IDs.
@@ -253,17 +290,7 @@ class Hierarchy(Struct, frozen=True, omit_defaults=True):
             we could have different codes with the same ID in the
             returned set.
         """
-        return self.__by_id(id, self.codes)
-
-    def __get_codes(
-        self, codes: Sequence[HierarchicalCode]
-    ) -> Sequence[HierarchicalCode]:
-        out = []
-        for code in codes:
-            out.append(code)
-            if code.codes:
-                out.extend(self.__get_codes(code.codes))
-        return out
+        return list(self.__index.codes.get(id, ()))
 
     def all_codes(self) -> Sequence[HierarchicalCode]:
         """Get all the codes in the hierarchy as a flat list.
@@ -275,13 +302,66 @@ class Hierarchy(Struct, frozen=True, omit_defaults=True):
         Returns:
             A flat list of the codes present in the hierarchy.
         """
-        out = []
-        # We need to do this below because a hierarchical code is not
-        # (yet?) hashable.
-        for c in self.__get_codes(self.codes):
-            if c not in out:
-                out.append(c)
-        return out
+        return list(self.__index.all_codes)
+
+    def paths(self, id: str) -> Sequence[str]:
+        """Get the full IDs (e.g. 1.11.111) of a code in the hierarchy.
+
+        Args:
+            id: The ID of the code.
+
+        Returns:
+            The full IDs of the code, one for each node where the code
+            is attached, in the order of the hierarchy.
+        """
+        return tuple(self.__index.paths.get(id, ()))
+
+    def parents(self, id: str) -> FrozenSet[str]:
+        """Get the IDs of the codes to which a code is directly attached.
+
+        Args:
+            id: The ID of the code.
+
+        Returns:
+            The IDs of the parents of the code, at any of its nodes.
+        """
+        return self.__index.parents.get(id, frozenset())
+
+    def children(self, id: str) -> FrozenSet[str]:
+        """Get the IDs of the codes directly attached to a code.
+
+        Args:
+            id: The ID of the code.
+
+        Returns:
+            The IDs of the children of the code, at any of its nodes.
+        """
+        return self.__index.children.get(id, frozenset())
+
+    def ancestors(self, id: str) -> FrozenSet[str]:
+        """Get the IDs of the codes above a code, at any level.
+
+        For example, in a hierarchy of country groups, this returns all the
+        groups to which a country belongs, directly or indirectly.
+
+        Args:
+            id: The ID of the code.
+
+        Returns:
+            The IDs of the ancestors of the code, at any of its nodes.
+        """
+        return self.__index.ancestors.get(id, frozenset())
+
+    def descendants(self, id: str) -> FrozenSet[str]:
+        """Get the IDs of the codes below a code, at any level.
+
+        Args:
+            id: The ID of the code.
+
+        Returns:
+            The IDs of the descendants of the code, at any of its nodes.
+        """
+        return self.__index.descendants.get(id, frozenset())
 
 
 class HierarchyAssociation(Struct, frozen=True, omit_defaults=True):
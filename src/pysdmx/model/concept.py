@@ -187,12 +187,8 @@ class ConceptScheme(ItemScheme, frozen=True, omit_defaults=True):
 
     def __getitem__(self, id_: str) -> Optional[Concept]:
         """Return the concept identified by the given ID."""
-        out = list(filter(lambda concept: concept.id == id_, self.concepts))
-        if len(out) == 0:
-            return None
-        else:
-            return out[0]
+        return self._index.get(id_)  # type: ignore[return-value]
 
     def __contains__(self, id_: str) -> bool:
         """Whether a concept with the supplied ID is present in the scheme."""
-        return bool(self.__getitem__(id_))
+        return id_ in self._index
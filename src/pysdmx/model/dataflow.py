@@ -10,7 +10,16 @@ as part of the response.
 from collections import Counter, UserList
 from datetime import datetime
 from enum import Enum
-from typing import Any, Iterable, Optional, Sequence, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from msgspec import Struct
 
@@ -182,17 +191,36 @@ class Component(Struct, frozen=True, omit_defaults=True):
 
 
 class Components(UserList[Component]):
-    """A collection of components describing the data."""
+    """A collection of components describing the data.
+
+    Components can be looked up by ID in constant time, and the components
+    playing a given role (e.g. dimensions) are only extracted once. Both
+    are refreshed whenever the collection is modified.
+    """
 
     def __init__(self, iterable: Iterable[Component]) -> None:
         """Create a new schema with the supplied components."""
+        self.__index: Optional[Dict[str, int]] = None
+        self.__roles: Optional[Dict[Role, Tuple[Component, ...]]] = None
         self.__validate_iterable(iterable, True)
         super().__init__(iterable)
 
+    def __copy__(self) -> "Components":
+        """Return a shallow copy, which does not share the caches."""
+        out = super().__copy__()
+        out.__invalidate()
+        return out
+
     def __setitem__(self, index: Any, item: Any) -> None:
         """Add a component at the requested index."""
         self.__validate_comp(item)
         super().__setitem__(index, item)
+        self.__invalidate()
+
+    def __delitem__(self, index: Any) -> None:
+        """Remove the component(s) at the requested index."""
+        super().__delitem__(index)
+        self.__invalidate()
 
     def __getitem__(self, i: Any) -> Any:
         """Return the component matching the supplied id or position.
@@ -208,26 +236,65 @@ class Components(UserList[Component]):
         if isinstance(i, (int, slice)):
             return super().__getitem__(i)
         else:
-            out = list(filter(lambda item: item.id == i, self.data))
-            if len(out) == 0:
-                return None
-            else:
-                return out[0]
+            pos = self.__get_index().get(i)
+            return self.data[pos] if pos is not None else None
+
+    def __iadd__(self, other: Iterable[Component]) -> "Components":
+        """Add the components to the existing list of components."""
+        self.extend(other)
+        return self
+
+    def __imul__(self, n: int) -> "Components":
+        """Repeat the components in the collection."""
+        super().__imul__(n)
+        self.__invalidate()
+        return self
 
     def insert(self, i: int, item: Component) -> None:
         """Add a component at the requested index."""
         self.__validate_comp(item)
         super().insert(i, item)
+        self.__invalidate()
 
     def append(self, item: Component) -> None:
         """Add a component to the existing list of components."""
         self.__validate_comp(item)
         super().append(item)
+        if self.__index is not None:
+            self.__index.setdefault(item.id, len(self.data) - 1)
+        self.__roles = None
 
     def extend(self, other: Iterable[Component]) -> None:
         """Add the components to the existing list of components."""
         self.__validate_iterable(other, False)
         super().extend(other)
+        self.__invalidate()
+
+    def pop(self, i: int = -1) -> Component:
+        """Remove the component at the requested index and return it."""
+        out = super().pop(i)
+        self.__invalidate()
+        return out
+
+    def remove(self, item: Component) -> None:
+        """Remove the supplied component."""
+        super().remove(item)
+        self.__invalidate()
+
+    def clear(self) -> None:
+        """Remove all the components."""
+        super().clear()
+        self.__invalidate()
+
+    def reverse(self) -> None:
+        """Reverse the order of the components."""
+        super().reverse()
+        self.__invalidate()
+
+    def sort(self, /, *args: Any, **kwds: Any) -> None:
+        """Sort the components."""
+        super().sort(*args, **kwds)
+        self.__invalidate()
 
     @property
     def dimensions(self) -> Sequence[Component]:
@@ -241,7 +308,7 @@ class Components(UserList[Component]):
         Returns:
             The list of dimensions
         """
-        return [c for c in self.data if c.role == "D"]
+        return list(self.__get_roles()[Role.DIMENSION])
 
     @property
     def attributes(self) -> Sequence[Component]:
@@ -253,7 +320,7 @@ class Components(UserList[Component]):
         Returns:
             The list of attributes
         """
-        return [c for c in self.data if c.role == "A"]
+        return list(self.__get_roles()[Role.ATTRIBUTE])
 
     @property
     def measures(self) -> Sequence[Component]:
@@ -264,7 +331,27 @@ class Components(UserList[Component]):
         Returns:
             The list of measures
         """
-        return [c for c in self.data if c.role == "M"]
+        return list(self.__get_roles()[Role.MEASURE])
+
+    def __invalidate(self) -> None:
+        self.__index = None
+        self.__roles = None
+
+    def __get_index(self) -> Dict[str, int]:
+        if self.__index is None:
+            index: Dict[str, int] = {}
+            for i, c in enumerate(self.data):
+                index.setdefault(c.id, i)
+            self.__index = index
+        return self.__index
+
+    def __get_roles(self) -> Dict[Role, Tuple[Component, ...]]:
+        if self.__roles is None:
+            roles: Dict[Role, List[Component]] = {r: [] for r in Role}
+            for c in self.data:
+                roles[c.role].append(c)
+            self.__roles = {r: tuple(v) for r, v in roles.items()}
+        return self.__roles
 
     def __validate_iterable(
         self,
@@ -288,13 +375,11 @@ class Components(UserList[Component]):
                 "Validation Error",
                 f"Unexpected type. Expected Component but got: {type(fld)}",
             )
-        if not is_init:
-            ids = [f.id for f in self.data]
-            if fld.id in ids:
-                raise Invalid(
-                    "Validation Error",
-                    f"There is already a component with ID: {fld.id}",
-                )
+        if not is_init and fld.id in self.__get_index():
+            raise Invalid(
+                "Validation Error",
+                f"There is already a component with ID: {fld.id}",
+            )
 
 
 class DataflowInfo(Struct, frozen=True, omit_defaults=True):
@@ -1,8 +1,23 @@
 """Model for Mapping Definitions."""
 
-from datetime import datetime
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone
+from functools import cached_property, lru_cache
+import re
 from re import Pattern
-from typing import Any, Iterator, Literal, Optional, Sequence, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from msgspec import Struct
 
@@ -174,7 +189,206 @@ class ValueMap(Struct, frozen=True, omit_defaults=True):
     valid_to: Optional[datetime] = None
 
 
-class MultiRepresentationMap(Struct, frozen=True, omit_defaults=True):
+MATCH_CACHE_SIZE = 65536
+GROUP_REFERENCE = re.compile(r"\\(\d+)")
+BACK_REFERENCE = re.compile(r"\\\d|\(\?P=")
+DEFAULT_FLAGS = re.compile("").flags
+EARLIEST = datetime.min.replace(tzinfo=timezone.utc)
+RESOLUTION = timedelta(microseconds=1)
+# Ends at or after this time are unbounded (e.g. datetime.max)
+LATEST = datetime.max.replace(tzinfo=timezone.utc) - RESOLUTION
+
+# The validity of a target value: from (inclusive), to (exclusive), target.
+# Unbounded validity periods are expressed with None.
+Interval = Tuple[Optional[datetime], Optional[datetime], Any]
+
+
+class _Entry(NamedTuple):
+    """The source and target values of a map, along with its validity."""
+
+    source: Sequence[Union[str, Pattern[str]]]
+    target: Tuple[str, ...]
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+
+    def is_valid(self, at: Optional[datetime]) -> bool:
+        """Whether the map is valid at the supplied time (None for -inf)."""
+        if self.start is not None and (at is None or at < self.start):
+            return False
+        return self.end is None or at is None or at < self.end
+
+
+def _utc(dt: Optional[datetime]) -> Optional[datetime]:
+    if dt is not None and dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def _entry(
+    source: Sequence[Union[str, Pattern[str]]],
+    target: Sequence[str],
+    valid_from: Optional[datetime],
+    valid_to: Optional[datetime],
+) -> _Entry:
+    end = _utc(valid_to)
+    return _Entry(
+        source,
+        tuple(target),
+        _utc(valid_from),
+        end + RESOLUTION if end is not None and end < LATEST else None,
+    )
+
+
+def _substitute(target: str, groups: Sequence[Optional[str]]) -> str:
+    r"""Replaces references to capture groups (e.g. ``\1``) in the target."""
+
+    def group(m: "re.Match[str]") -> str:
+        i = int(m.group(1))
+        if 0 < i <= len(groups):
+            return groups[i - 1] or ""
+        return m.group(0)
+
+    return GROUP_REFERENCE.sub(group, target)
+
+
+def _intervals(entries: Sequence[_Entry]) -> List[Interval]:
+    """Splits the validity of the entries into sorted, disjoint intervals."""
+    # When the validity of several entries overlaps, the first entry wins
+    bounds = sorted(
+        {e.start for e in entries if e.start is not None}
+        | {e.end for e in entries if e.end is not None}
+    )
+    starts: List[Optional[datetime]] = [None, *bounds]
+    out: List[Interval] = []
+    for i, start in enumerate(starts):
+        winner = next((e for e in entries if e.is_valid(start)), None)
+        end = starts[i + 1] if i + 1 < len(starts) else None
+        if winner is None:
+            continue
+        if out and out[-1][1] == start and out[-1][2] == winner.target:
+            out[-1] = (out[-1][0], end, winner.target)
+        else:
+            out.append((start, end, winner.target))
+    return out
+
+
+class _ValueMatcher:
+    """Resolves the target values mapped to the supplied source values.
+
+    Maps without regular expressions are stored in a dictionary. Regular
+    expressions are tried in the order of the maps, after the exact matches.
+    For maps with a single source value, they are combined into a single
+    alternation, so that the regular expression engine evaluates all of them
+    in one pass. The results are memoised per distinct source value.
+
+    Maps valid at different times are indexed per source value, as sorted
+    and disjoint validity intervals.
+    """
+
+    def __init__(self, entries: Sequence[_Entry]):
+        self.exact: Dict[Tuple[str, ...], List[_Entry]] = {}
+        self.patterns: List[_Entry] = []
+        for e in entries:
+            if any(isinstance(s, Pattern) for s in e.source):
+                self.patterns.append(e)
+            else:
+                key = tuple(str(v) for v in e.source)
+                self.exact.setdefault(key, []).append(e)
+        self.alternation = self.__combine()
+        self.match: Callable[[Tuple[str, ...]], Optional[Tuple[str, ...]]] = (
+            lru_cache(maxsize=MATCH_CACHE_SIZE)(self.__match)
+        )
+        self.intervals: Callable[[Tuple[str, ...]], Sequence[Interval]] = (
+            lru_cache(maxsize=MATCH_CACHE_SIZE)(self.__intervals)
+        )
+
+    def __combine(self) -> Optional[Pattern[str]]:
+        patterns = [e.source[0] for e in self.patterns if len(e.source) == 1]
+        if not patterns or len(patterns) != len(self.patterns):
+            return None
+        if any(
+            not isinstance(p, Pattern)
+            or p.flags != DEFAULT_FLAGS
+            or BACK_REFERENCE.search(p.pattern)
+            for p in patterns
+        ):
+            # Flags and back references cannot be embedded in alternations
+            return None
+        alternatives = "|".join(
+            f"(?P<_{i}>{p.pattern})"  # type: ignore[union-attr]
+            for i, p in enumerate(patterns)
+        )
+        try:
+            return re.compile(alternatives)
+        except re.error:
+            # e.g. the same group name used in several expressions
+            return None
+
+    def __expand(self, entry: _Entry, values: Tuple[str, ...]) -> _Entry:
+        if not any("\\" in t for t in entry.target):
+            return entry
+        groups: List[Optional[str]] = []
+        for i, s in enumerate(entry.source):
+            m = s.fullmatch(values[i]) if isinstance(s, Pattern) else None
+            if m is not None:
+                groups.extend(m.groups())
+        target = tuple(_substitute(t, groups) for t in entry.target)
+        return entry._replace(target=target)
+
+    def __matches(self, entry: _Entry, values: Tuple[str, ...]) -> bool:
+        source = entry.source
+        return len(source) == len(values) and all(
+            (
+                s.fullmatch(values[i]) is not None
+                if isinstance(s, Pattern)
+                else s == values[i]
+            )
+            for i, s in enumerate(source)
+        )
+
+    def __match(self, values: Tuple[str, ...]) -> Optional[Tuple[str, ...]]:
+        exact = self.exact.get(values)
+        if exact:
+            return exact[0].target
+        if not self.patterns:
+            return None
+        if self.alternation is not None:
+            m = self.alternation.fullmatch(values[0])
+            if m is None or m.lastgroup is None:
+                return None
+            entry = self.patterns[int(m.lastgroup[1:])]
+            return self.__expand(entry, values).target
+        for entry in self.patterns:
+            if self.__matches(entry, values):
+                return self.__expand(entry, values).target
+        return None
+
+    def __intervals(self, values: Tuple[str, ...]) -> Sequence[Interval]:
+        entries = list(self.exact.get(values, ()))
+        entries.extend(
+            self.__expand(e, values)
+            for e in self.patterns
+            if self.__matches(e, values)
+        )
+        return tuple(_intervals(entries))
+
+    def match_at(
+        self, values: Tuple[str, ...], at: datetime
+    ) -> Optional[Tuple[str, ...]]:
+        """Returns the target values valid at the supplied time, if any."""
+        intervals = self.intervals(values)
+        at = _utc(at)  # type: ignore[assignment]
+        starts = [s if s is not None else EARLIEST for s, _, _ in intervals]
+        i = bisect_right(starts, at) - 1
+        if i < 0:
+            return None
+        _, end, target = intervals[i]
+        return target if end is None or at < end else None
+
+
+class MultiRepresentationMap(
+    Struct, frozen=True, omit_defaults=True, dict=True
+):
     """Maps one or more source codelists to one or more target codelists.
 
     A representation map is iterable, i.e. it is possible to iterate over
@@ -213,6 +427,55 @@ class MultiRepresentationMap(Struct, frozen=True, omit_defaults=True):
         """Return the number of maps in the representation map."""
         return len(self.maps)
 
+    @cached_property
+    def _matcher(self) -> _ValueMatcher:
+        return _ValueMatcher(
+            [
+                _entry(m.source, m.target, m.valid_from, m.valid_to)
+                for m in self.maps
+            ]
+        )
+
+    def match(
+        self, values: Sequence[str], valid_at: Optional[datetime] = None
+    ) -> Optional[Sequence[str]]:
+        r"""Return the target values mapped to the source values, if any.
+
+        Maps without regular expressions take precedence. Maps with regular
+        expressions are then tried in order, and references to their capture
+        groups in the target values (e.g. ``\1``) are replaced by the
+        captured values.
+
+        Args:
+            values: The source values.
+            valid_at: If supplied, only the maps valid at that time are
+                considered. Otherwise, the business validity of maps is
+                not considered. Naive datetimes are considered to be UTC.
+
+        Returns:
+            The target values, or None if no map matches the source values.
+        """
+        if valid_at is None:
+            return self._matcher.match(tuple(values))
+        return self._matcher.match_at(tuple(values), valid_at)
+
+    def intervals(self, values: Sequence[str]) -> Sequence[Interval]:
+        """Return the validity intervals of the maps for the source values.
+
+        The intervals are sorted and disjoint. Each interval is a tuple made
+        of its start (inclusive), its end (exclusive) and the target values
+        valid during the interval. Unbounded starts and ends are expressed
+        with None. When the validity of several maps overlaps, the map that
+        would be selected by ``match`` wins.
+
+        Args:
+            values: The source values.
+
+        Returns:
+            The validity intervals, empty if no map matches the values.
+        """
+        return self._matcher.intervals(tuple(values))
+
 
 class MultiComponentMap(Struct, frozen=True, omit_defaults=True):
     """Maps one or more source components to one or more target components.
@@ -242,7 +505,7 @@ class MultiComponentMap(Struct, frozen=True, omit_defaults=True):
     values: MultiRepresentationMap
 
 
-class RepresentationMap(Struct, frozen=True, omit_defaults=True):
+class RepresentationMap(Struct, frozen=True, omit_defaults=True, dict=True):
     """Maps one source codelist to a target codelist.
 
     A representation map is iterable, i.e. it is possible to iterate over
@@ -279,6 +542,58 @@ class RepresentationMap(Struct, frozen=True, omit_defaults=True):
         """Return the number of maps in the representation map."""
         return len(self.maps)
 
+    @cached_property
+    def _matcher(self) -> _ValueMatcher:
+        return _ValueMatcher(
+            [
+                _entry((m.source,), (m.target,), m.valid_from, m.valid_to)
+                for m in self.maps
+            ]
+        )
+
+    def match(
+        self, value: str, valid_at: Optional[datetime] = None
+    ) -> Optional[str]:
+        r"""Return the target value mapped to the source value, if any.
+
+        Maps without regular expressions take precedence. Maps with regular
+        expressions are then tried in order, and references to their capture
+        groups in the target value (e.g. ``\1``) are replaced by the
+        captured values.
+
+        Args:
+            value: The source value.
+            valid_at: If supplied, only the maps valid at that time are
+                considered. Otherwise, the business validity of maps is
+                not considered. Naive datetimes are considered to be UTC.
+
+        Returns:
+            The target value, or None if no map matches the source value.
+        """
+        if valid_at is None:
+            out = self._matcher.match((value,))
+        else:
+            out = self._matcher.match_at((value,), valid_at)
+        return out[0] if out is not None else None
+
+    def intervals(self, value: str) -> Sequence[Interval]:
+        """Return the validity intervals of the maps for the source value.
+
+        The intervals are sorted and disjoint. Each interval is a tuple made
+        of its start (inclusive), its end (exclusive) and the target value
+        valid during the interval. Unbounded starts and ends are expressed
+        with None. When the validity of several maps overlaps, the map that
+        would be selected by ``match`` wins.
+
+        Args:
+            value: The source value.
+
+        Returns:
+            The validity intervals, empty if no map matches the value.
+        """
+        intervals = self._matcher.intervals((value,))
+        return tuple((s, e, t[0]) for s, e, t in intervals)
+
 
 class ComponentMap(Struct, frozen=True, omit_defaults=True):
     """Maps a source component to a target component.
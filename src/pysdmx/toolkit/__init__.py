@@ -0,0 +1 @@
+"""Tools to process SDMX data, such as mapping and validation engines."""
@@ -0,0 +1,297 @@
+"""Conversion of dates to SDMX reporting periods, using date patterns.
+
+Dates are parsed with ``pandas.to_datetime``, once per distinct value, and
+formatted in bulk. Month names are translated using the tables below rather
+than the locale of the process (``locale.setlocale`` affects the whole
+process, and the required locales are often not installed).
+"""
+
+import re
+from typing import Callable, Dict, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from pysdmx.errors import Invalid, NotImplemented
+from pysdmx.model import DatePatternMap
+from pysdmx.util import convert_dpm
+
+# Full names and abbreviations of months, per language. Dots ending the
+# abbreviations are optional in the input.
+MONTHS: Dict[str, Sequence[Sequence[str]]] = {
+    "de": [
+        ("Januar", "Jan", "Jänner", "Jän"),
+        ("Februar", "Feb"),
+        ("März", "Mär", "Mrz"),
+        ("April", "Apr"),
+        ("Mai",),
+        ("Juni", "Jun"),
+        ("Juli", "Jul"),
+        ("August", "Aug"),
+        ("September", "Sept", "Sep"),
+        ("Oktober", "Okt"),
+        ("November", "Nov"),
+        ("Dezember", "Dez"),
+    ],
+    "en": [
+        ("January", "Jan"),
+        ("February", "Feb"),
+        ("March", "Mar"),
+        ("April", "Apr"),
+        ("May",),
+        ("June", "Jun"),
+        ("July", "Jul"),
+        ("August", "Aug"),
+        ("September", "Sept", "Sep"),
+        ("October", "Oct"),
+        ("November", "Nov"),
+        ("December", "Dec"),
+    ],
+    "es": [
+        ("enero", "ene"),
+        ("febrero", "feb"),
+        ("marzo", "mar"),
+        ("abril", "abr"),
+        ("mayo", "may"),
+        ("junio", "jun"),
+        ("julio", "jul"),
+        ("agosto", "ago"),
+        ("septiembre", "setiembre", "sept", "sep", "set"),
+        ("octubre", "oct"),
+        ("noviembre", "nov"),
+        ("diciembre", "dic"),
+    ],
+    "fr": [
+        ("janvier", "janv", "jan"),
+        ("février", "févr", "fév", "fevrier", "fevr", "fev"),
+        ("mars", "mar"),
+        ("avril", "avr"),
+        ("mai",),
+        ("juin",),
+        ("juillet", "juil"),
+        ("août", "aout", "aoû"),
+        ("septembre", "sept", "sep"),
+        ("octobre", "oct"),
+        ("novembre", "nov"),
+        ("décembre", "déc", "decembre", "dec"),
+    ],
+    "it": [
+        ("gennaio", "gen"),
+        ("febbraio", "feb"),
+        ("marzo", "mar"),
+        ("aprile", "apr"),
+        ("maggio", "mag"),
+        ("giugno", "giu"),
+        ("luglio", "lug"),
+        ("agosto", "ago"),
+        ("settembre", "set"),
+        ("ottobre", "ott"),
+        ("novembre", "nov"),
+        ("dicembre", "dic"),
+    ],
+    "nl": [
+        ("januari", "jan"),
+        ("februari", "feb"),
+        ("maart", "mrt", "mar"),
+        ("april", "apr"),
+        ("mei",),
+        ("juni", "jun"),
+        ("juli", "jul"),
+        ("augustus", "aug"),
+        ("september", "sept", "sep"),
+        ("oktober", "okt"),
+        ("november", "nov"),
+        ("december", "dec"),
+    ],
+    "pt": [
+        ("janeiro", "jan"),
+        ("fevereiro", "fev"),
+        ("março", "mar"),
+        ("abril", "abr"),
+        ("maio", "mai"),
+        ("junho", "jun"),
+        ("julho", "jul"),
+        ("agosto", "ago"),
+        ("setembro", "set"),
+        ("outubro", "out"),
+        ("novembro", "nov"),
+        ("dezembro", "dez"),
+    ],
+}
+MONTH_DIRECTIVES = re.compile("%[Bb]")
+DAY_NAME_DIRECTIVES = re.compile("%[Aa]")
+
+
+def _month_numbers(language: str) -> Callable[[str], str]:
+    """Returns a function replacing month names by their numbers."""
+    numbers = {
+        name.lower(): f"{i + 1:02d}"
+        for i, month in enumerate(MONTHS[language])
+        for name in month
+    }
+    # Longest names first, so that abbreviations do not match full names
+    alternatives = "|".join(
+        re.escape(n) for n in sorted(numbers, key=len, reverse=True)
+    )
+    names = re.compile(rf"\b({alternatives})\b\.?", re.IGNORECASE)
+
+    def replace(value: str) -> str:
+        return names.sub(lambda m: numbers[m.group(1).lower()], value)
+
+    return replace
+
+
+def format_periods(
+    dates: pd.Series, frequency: Union[str, pd.Series]
+) -> pd.Series:
+    """Formats dates as SDMX reporting periods.
+
+    Supported frequencies are ``A`` (e.g. ``2024``), ``S`` (``2024-S1``),
+    ``Q`` (``2024-Q1``), ``M`` (``2024-01``), ``W`` (``2024-W01``) and
+    ``D`` (``2024-01-01``).
+
+    Args:
+        dates: The dates to be formatted.
+        frequency: The frequency of the periods. For a series of
+            frequencies (one per date), the dates are formatted once per
+            distinct frequency. Dates with a missing frequency remain
+            missing.
+
+    Returns:
+        The reporting periods, as strings.
+    """
+    if isinstance(frequency, str):
+        return __format(dates, frequency)
+    out = pd.Series(None, index=dates.index, dtype=object)
+    codes, uniques = pd.factorize(frequency)
+    for i, f in enumerate(uniques):
+        rows = codes == i
+        out[rows] = __format(dates[rows], str(f))
+    return out
+
+
+def __format(dates: pd.Series, frequency: str) -> pd.Series:
+    valid = dates.notna()
+    year = dates.dt.year.astype("Int64").astype("string")
+    if frequency == "A":
+        out = year
+    elif frequency == "S":
+        half = ((dates.dt.month - 1) // 6 + 1).astype("Int64")
+        out = year + "-S" + half.astype("string")
+    elif frequency == "Q":
+        out = year + "-Q" + dates.dt.quarter.astype("Int64").astype("string")
+    elif frequency == "M":
+        out = dates.dt.strftime("%Y-%m").astype("string")
+    elif frequency == "W":
+        iso = dates.dt.isocalendar()
+        week = iso["week"].astype("string").str.zfill(2)
+        out = iso["year"].astype("string") + "-W" + week
+    elif frequency == "D":
+        out = dates.dt.strftime("%Y-%m-%d").astype("string")
+    else:
+        raise Invalid(
+            "Unsupported frequency",
+            f"Dates cannot be formatted for frequency {frequency}.",
+        )
+    return out.astype(object).where(valid)
+
+
+class DateConverter:
+    """Converts dates to SDMX reporting periods, using a date pattern.
+
+    The date pattern is translated once, when creating the converter, and
+    the converter can then be applied to any number of columns.
+
+    Examples:
+        >>> converter = DateConverter("MMM yy", "fr")
+        >>> converter.convert(pd.Series(["sept. 23", "oct. 23"]), "M")
+    """
+
+    def __init__(self, pattern: str, locale: str = "en"):
+        """Translates the date pattern.
+
+        Args:
+            pattern: The SDMX date pattern (e.g. ``MMM yy``).
+            locale: The locale of the dates (e.g. ``fr`` or ``fr_CH``).
+                Only the language is considered.
+
+        Raises:
+            Invalid: If the pattern is invalid, or if the names of months
+                are not available for the locale.
+            NotImplemented: If the pattern contains names of days, for
+                languages other than English.
+        """
+        language = re.split("[-_]", locale)[0].lower()
+        fmt = convert_dpm(pattern)
+        if "%V" not in fmt:
+            # ISO years can only be parsed together with ISO weeks
+            fmt = fmt.replace("%G", "%Y")
+        self.__suffix = ""
+        if "%V" in fmt and "%u" not in fmt:
+            # ISO weeks can only be parsed together with week days
+            fmt = f"{fmt}-%u"
+            self.__suffix = "-1"
+        if language != "en" and DAY_NAME_DIRECTIVES.search(fmt):
+            raise NotImplemented(
+                "Unsupported date pattern",
+                "Names of days are only supported in English.",
+            )
+        self.__months: Optional[Callable[[str], str]] = None
+        if MONTH_DIRECTIVES.search(fmt):
+            if language not in MONTHS:
+                raise Invalid(
+                    "Unsupported locale",
+                    f"Month names are not available for locale {locale}.",
+                )
+            fmt = MONTH_DIRECTIVES.sub("%m", fmt)
+            self.__months = _month_numbers(language)
+        self.pattern = pattern
+        self.locale = locale
+        self.format = fmt
+
+    @classmethod
+    def from_map(cls, dpm: DatePatternMap) -> "DateConverter":
+        """Creates a converter for the date pattern of the map.
+
+        Args:
+            dpm: The date pattern map.
+
+        Returns:
+            The converter.
+        """
+        return cls(dpm.pattern, dpm.locale)
+
+    def parse(self, values: pd.Series) -> pd.Series:
+        """Parses the dates, once per distinct value.
+
+        Args:
+            values: The dates to be parsed.
+
+        Returns:
+            The parsed dates. Dates not matching the pattern are missing.
+        """
+        codes, uniques = pd.factorize(values)
+        distinct = pd.Series(uniques, dtype=object).astype(str)
+        if self.__months is not None:
+            distinct = distinct.map(self.__months)
+        if self.__suffix:
+            distinct = distinct + self.__suffix
+        dates = pd.to_datetime(distinct, format=self.format, errors="coerce")
+        parsed = np.append(dates.to_numpy(), np.datetime64("NaT", "ns"))
+        return pd.Series(parsed[codes], index=values.index)
+
+    def convert(
+        self, values: pd.Series, frequency: Union[str, pd.Series]
+    ) -> pd.Series:
+        """Converts the dates to SDMX reporting periods.
+
+        Args:
+            values: The dates to be converted.
+            frequency: The frequency of the periods, either fixed (e.g.
+                ``M``) or for each date (e.g. the ``FREQ`` column).
+
+        Returns:
+            The reporting periods. Dates not matching the pattern are
+            missing.
+        """
+        return format_periods(self.parse(values), frequency)
@@ -0,0 +1,157 @@
+"""Conversion of data to the pandas types matching the SDMX data types.
+
+Numbers are converted to numeric pandas types. Integers use the nullable
+``Int64`` type and booleans the nullable ``boolean`` type, so that missing
+values do not turn the column into floats or objects. All the other types,
+including time periods and dates, are kept as strings, as their format
+varies (e.g. with the frequency).
+
+Optionally, the values of enumerated components (e.g. dimensions taking
+their values from a codelist) can be dictionary-encoded, using the codes
+of the codelist as categories.
+"""
+
+from typing import Any, List
+
+import pandas as pd
+
+from pysdmx.model import Codelist, Component, DataType, Hierarchy, Schema
+
+INTEGER_TYPES = frozenset(
+    {DataType.BIG_INTEGER, DataType.INTEGER, DataType.LONG, DataType.SHORT}
+)
+FLOAT_TYPES = frozenset(
+    {DataType.DECIMAL, DataType.DOUBLE, DataType.FLOAT, DataType.NUMERIC}
+)
+
+BOOLEAN_VALUES = {
+    "true": True,
+    "false": False,
+    "1": True,
+    "0": False,
+}
+
+
+def to_pandas_dtype(dtype: DataType) -> str:
+    """Returns the pandas type used for the supplied SDMX data type.
+
+    Args:
+        dtype: The SDMX data type.
+
+    Returns:
+        The name of the pandas type.
+    """
+    if dtype in INTEGER_TYPES:
+        return "Int64"
+    if dtype in FLOAT_TYPES:
+        return "float64"
+    if dtype == DataType.BOOLEAN:
+        return "boolean"
+    return "object"
+
+
+def cast(series: pd.Series, dtype: DataType) -> pd.Series:
+    """Converts the values to the pandas type matching the SDMX data type.
+
+    Values that cannot be converted (e.g. ``abc`` for an integer) become
+    missing values. Missing values are kept as such, i.e. they are never
+    turned into strings like ``nan``.
+
+    Args:
+        series: The values to be converted.
+        dtype: The SDMX data type of the values.
+
+    Returns:
+        The converted values.
+    """
+    target = to_pandas_dtype(dtype)
+    if str(series.dtype) == target:
+        return series
+    if dtype in INTEGER_TYPES:
+        values = pd.to_numeric(series, errors="coerce")
+        return values.where(values % 1 == 0).astype("Int64")
+    if dtype in FLOAT_TYPES:
+        return pd.to_numeric(series, errors="coerce").astype("float64")
+    if dtype == DataType.BOOLEAN:
+        if pd.api.types.is_bool_dtype(series):
+            return series.astype("boolean")
+        values = series.astype("string").str.strip().str.lower()
+        return values.map(BOOLEAN_VALUES).astype("boolean")
+    if pd.api.types.is_object_dtype(series) or isinstance(
+        series.dtype, pd.CategoricalDtype
+    ):
+        return series
+    return series.astype(object).where(series.isna(), series.astype(str))
+
+
+def categories(enumeration: Any) -> List[str]:
+    """Returns the IDs of the codes, in the order of the enumeration.
+
+    Args:
+        enumeration: The codelist or hierarchy of a component.
+
+    Returns:
+        The IDs of the codes, or an empty list for other enumerations.
+        Codes used several times in a hierarchy (e.g. under different
+        parents) are only returned once.
+    """
+    if isinstance(enumeration, Codelist):
+        return [c.id for c in enumeration]
+    if isinstance(enumeration, Hierarchy):
+        return list(dict.fromkeys(c.id for c in enumeration.all_codes()))
+    return []
+
+
+def to_categorical(series: pd.Series, component: Component) -> pd.Series:
+    """Encodes the values using the codes of the component as categories.
+
+    The categories follow the order of the codes in the enumeration, so
+    that the category codes are stable across datasets using the same
+    codelist. Values that are not in the enumeration are not lost: they
+    are added after the codes of the enumeration.
+
+    Args:
+        series: The values to be converted.
+        component: The enumerated component.
+
+    Returns:
+        The values, as a categorical series.
+    """
+    codes = categories(component.enumeration)
+    values = cast(series, DataType.STRING)
+    known = set(codes)
+    extra = [v for v in values.dropna().unique() if v not in known]
+    return values.astype(pd.CategoricalDtype(codes + extra))
+
+
+def cast_columns(
+    data: pd.DataFrame, schema: Schema, categorical: bool = False
+) -> pd.DataFrame:
+    """Converts the columns to the pandas types of the matching components.
+
+    Columns that do not match any component of the schema are kept as is.
+
+    Args:
+        data: The data to be converted.
+        schema: The schema describing the data.
+        categorical: Whether the values of the enumerated components
+            of type string are converted to categoricals.
+
+    Returns:
+        A copy of the data, with the converted columns.
+    """
+    components = schema.components
+    data = data.copy(deep=False)
+    for c in data.columns:
+        component = components[c]
+        if component is None:
+            continue
+        if (
+            categorical
+            and component.enumeration is not None
+            and to_pandas_dtype(component.dtype) == "object"
+        ):
+            data[c] = to_categorical(data[c], component)
+        else:
+            data[c] = cast(data[c], component.dtype)
+    return data
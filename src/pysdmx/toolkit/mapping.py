@@ -0,0 +1,340 @@
+"""Apply structure maps to datasets.
+
+A structure map is compiled once into a list of column operations, which
+are then applied to whole columns of the datasets to be mapped:
+
+- Fixed values are broadcast to all rows.
+- Implicit maps copy the source column.
+- Value maps are resolved once per distinct source value, and the results
+  are applied as dictionary lookups (``Series.map``) for single components
+  and as hash joins for multiple components.
+- Dates are converted to reporting periods using ``DateConverter``.
+"""
+
+from datetime import datetime
+from functools import cached_property
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from pysdmx.errors import Invalid
+from pysdmx.model import (
+    ComponentMap,
+    DatePatternMap,
+    FixedValueMap,
+    ImplicitComponentMap,
+    MultiComponentMap,
+    MultiRepresentationMap,
+    MultiValueMap,
+    RepresentationMap,
+    Schema,
+    StructureMap,
+    ValueMap,
+)
+from pysdmx.model.dataset import PandasDataset
+from pysdmx.model.map import Interval
+from pysdmx.toolkit.dates import DateConverter
+from pysdmx.toolkit.dtypes import cast_columns
+from pysdmx.toolkit.periods import period_start
+
+EARLIEST = np.datetime64(np.iinfo(np.int64).min + 1, "ns")
+LATEST = np.datetime64(np.iinfo(np.int64).max, "ns")
+
+
+class _Context:
+    """The dataset being mapped."""
+
+    def __init__(self, dataset: PandasDataset, time_period: str):
+        self.data = dataset.data
+        self.attributes = dataset.attributes
+        self.time_period = time_period
+        self.out: Dict[str, Any] = {}
+
+    def source(self, component: str) -> pd.Series:
+        """Returns the values of a source component, for each row."""
+        if component in self.data.columns:
+            return self.data[component]
+        if component in self.attributes:
+            return pd.Series(self.attributes[component], index=self.data.index)
+        raise Invalid(
+            "Missing component",
+            f"The source component {component} is not present in the "
+            "dataset.",
+        )
+
+    def target(self, component: str) -> pd.Series:
+        """Returns the mapped values of a component, or else its source."""
+        if component not in self.out:
+            return self.source(component)
+        values = self.out[component]
+        if isinstance(values, pd.Series):
+            return values
+        return pd.Series(values, index=self.data.index)
+
+    @cached_property
+    def periods(self) -> Optional[np.ndarray]:
+        """The start of the reporting period of each row (UTC), if known."""
+        if self.time_period not in self.data.columns:
+            return None
+        starts = period_start(self.data[self.time_period])
+        return starts.dt.tz_convert(None).to_numpy(dtype="datetime64[ns]")
+
+
+# Computes the values of one or more target components
+Operation = Callable[[_Context], Dict[str, Any]]
+
+
+def _map_values(values: pd.Series, rm: RepresentationMap) -> pd.Series:
+    """Maps the distinct values, and broadcasts the results to all rows."""
+    lookup = {v: rm.match(str(v)) for v in values.dropna().unique()}
+    return values.map(lookup)
+
+
+def _map_multi_values(
+    frame: pd.DataFrame, rm: MultiRepresentationMap, n_targets: int
+) -> pd.DataFrame:
+    """Maps combinations of values with a left join on a lookup table."""
+    sources = [f"s{i}" for i in range(len(frame.columns))]
+    targets = [f"t{i}" for i in range(n_targets)]
+    frame = frame.set_axis(sources, axis=1)
+    rows = []
+    for key in frame.dropna().drop_duplicates().itertuples(index=False):
+        mapped = rm.match([str(v) for v in key])
+        if mapped is not None:
+            rows.append((*key, *mapped))
+    lookup = pd.DataFrame(rows, columns=sources + targets, dtype=object)
+    joined = frame.merge(lookup, how="left", on=sources)
+    return joined[targets].set_axis(frame.index, axis=0)
+
+
+def _as_datetime64(dt: Optional[datetime], default: Any) -> Any:
+    if dt is None:
+        return default
+    ts = pd.Timestamp(dt)
+    if ts <= pd.Timestamp.min.tz_localize("UTC"):
+        return EARLIEST
+    if ts >= pd.Timestamp.max.tz_localize("UTC"):
+        return LATEST
+    return ts.tz_convert(None).to_datetime64().astype("datetime64[ns]")
+
+
+def _map_dated_values(
+    frame: pd.DataFrame,
+    periods: np.ndarray,
+    intervals: Callable[[Tuple[str, ...]], Sequence[Interval]],
+    n_targets: int,
+) -> pd.DataFrame:
+    """Maps values using the maps valid at the time of each row."""
+    # The rows are grouped by distinct source key, and the validity intervals
+    # of each key are searched for all the rows of the key at once.
+    groups = frame.groupby(
+        [frame.iloc[:, i] for i in range(len(frame.columns))],
+        sort=False,
+        dropna=True,
+        observed=True,
+    ).ngroup()
+    codes = groups.fillna(-1).to_numpy(dtype=np.int64)
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(
+        codes[order], np.arange(codes.max(initial=-1) + 2)
+    )
+    out = np.full((len(frame), n_targets), None, dtype=object)
+    for code in range(len(bounds) - 1):
+        rows = order[bounds[code] : bounds[code + 1]]
+        key = tuple(str(v) for v in frame.iloc[rows[0]])
+        segments = intervals(key)
+        if not segments:
+            continue
+        starts = np.array(
+            [_as_datetime64(s, EARLIEST) for s, _, _ in segments],
+            dtype="datetime64[ns]",
+        )
+        ends = np.array(
+            [_as_datetime64(e, LATEST) for _, e, _ in segments],
+            dtype="datetime64[ns]",
+        )
+        targets = np.empty((len(segments), n_targets), dtype=object)
+        targets[:] = [list(t) for _, _, t in segments]
+        times = periods[rows]
+        pos = np.searchsorted(starts, times, side="right") - 1
+        hit = (pos >= 0) & (times < ends[np.maximum(pos, 0)])
+        out[rows[hit]] = targets[pos[hit]]
+    return pd.DataFrame(out, index=frame.index)
+
+
+def _fill(current: Any, values: Any) -> Any:
+    """Fills the missing values of a target with the supplied values."""
+    if isinstance(current, pd.Series):
+        return current.where(current.notna(), values)
+    if pd.isna(current):
+        return values
+    return current
+
+
+class StructureMapper:
+    """Maps datasets using the rules of a structure map.
+
+    The structure map is compiled once, when creating the mapper, and the
+    mapper can then be applied to any number of datasets.
+
+    Values are mapped as described in ``RepresentationMap.match``. If no
+    rule matches a value, the target value is missing. When value maps have
+    a business validity, the maps valid at the start of the reporting period
+    of each row are used. When several rules provide values for the same
+    target component, the first rule providing a value wins.
+
+    Examples:
+        >>> mapper = StructureMapper(structure_map, target_schema)
+        >>> mapped = mapper.apply(dataset)
+    """
+
+    def __init__(
+        self,
+        structure_map: StructureMap,
+        schema: Optional[Schema] = None,
+        time_period: str = "TIME_PERIOD",
+    ):
+        """Compiles the structure map.
+
+        Args:
+            structure_map: The structure map to be applied.
+            schema: The schema of the target structure. If supplied, the
+                columns of mapped datasets are ordered as the components of
+                the schema, and converted to the types of the components.
+            time_period: The ID of the source component with the reporting
+                period, used to select the value maps valid for each row.
+                If the component is not in the data, the business validity
+                of value maps is not considered.
+        """
+        self.structure_map = structure_map
+        self.schema = schema
+        self.time_period = time_period
+        rules = [
+            m
+            for m in structure_map.maps
+            if not (isinstance(m, FixedValueMap) and m.located_in == "source")
+        ]
+        # Variable date patterns need the frequency of the target
+        rules.sort(
+            key=lambda m: isinstance(m, DatePatternMap)
+            and m.pattern_type == "variable"
+        )
+        self.__operations: List[Operation] = [self.__compile(m) for m in rules]
+
+    def apply(self, dataset: PandasDataset) -> PandasDataset:
+        """Maps a dataset to the target structure.
+
+        Args:
+            dataset: The dataset to be mapped.
+
+        Returns:
+            A new dataset, with the target components.
+        """
+        data = dataset.data
+        context = _Context(dataset, self.time_period)
+        out = context.out
+        for operation in self.__operations:
+            for target, values in operation(context).items():
+                out[target] = (
+                    _fill(out[target], values) if target in out else values
+                )
+        df = pd.DataFrame(out, index=data.index)
+        if self.schema is None:
+            return PandasDataset(
+                structure=self.structure_map.target,
+                data=df,
+                action=dataset.action,
+            )
+        ordered = [c.id for c in self.schema.components if c.id in out]
+        df = df[ordered + [c for c in df.columns if c not in ordered]]
+        return PandasDataset(
+            structure=self.schema,
+            data=cast_columns(df, self.schema),
+            action=dataset.action,
+        )
+
+    def __compile(
+        self,
+        rule: Union[
+            ComponentMap,
+            DatePatternMap,
+            FixedValueMap,
+            ImplicitComponentMap,
+            MultiComponentMap,
+        ],
+    ) -> Operation:
+        if isinstance(rule, FixedValueMap):
+            return self.__fixed(rule)
+        if isinstance(rule, ImplicitComponentMap):
+            return self.__implicit(rule)
+        if isinstance(rule, ComponentMap):
+            return self.__component(rule)
+        if isinstance(rule, MultiComponentMap):
+            return self.__multi_component(rule)
+        return self.__date_pattern(rule)
+
+    def __is_dated(
+        self, maps: Sequence[Union[ValueMap, MultiValueMap]]
+    ) -> bool:
+        return any(
+            m.valid_from is not None or m.valid_to is not None for m in maps
+        )
+
+    def __fixed(self, rule: FixedValueMap) -> Operation:
+        def operation(context: _Context) -> Dict[str, Any]:
+            return {rule.target: rule.value}
+
+        return operation
+
+    def __implicit(self, rule: ImplicitComponentMap) -> Operation:
+        def operation(context: _Context) -> Dict[str, Any]:
+            return {rule.target: context.source(rule.source)}
+
+        return operation
+
+    def __component(self, rule: ComponentMap) -> Operation:
+        dated = self.__is_dated(rule.values.maps)
+
+        def intervals(key: Tuple[str, ...]) -> Sequence[Interval]:
+            return [(s, e, (t,)) for s, e, t in rule.values.intervals(key[0])]
+
+        def operation(context: _Context) -> Dict[str, Any]:
+            values = context.source(rule.source)
+            periods = context.periods if dated else None
+            if periods is None:
+                return {rule.target: _map_values(values, rule.values)}
+            out = _map_dated_values(values.to_frame(), periods, intervals, 1)
+            return {rule.target: out.iloc[:, 0]}
+
+        return operation
+
+    def __multi_component(self, rule: MultiComponentMap) -> Operation:
+        dated = self.__is_dated(rule.values.maps)
+        n_targets = len(rule.target)
+
+        def operation(context: _Context) -> Dict[str, Any]:
+            frame = pd.concat([context.source(s) for s in rule.source], axis=1)
+            periods = context.periods if dated else None
+            if periods is None:
+                out = _map_multi_values(frame, rule.values, n_targets)
+            else:
+                out = _map_dated_values(
+                    frame, periods, rule.values.intervals, n_targets
+                )
+            return {t: out.iloc[:, i] for i, t in enumerate(rule.target)}
+
+        return operation
+
+    def __date_pattern(self, rule: DatePatternMap) -> Operation:
+        converter = DateConverter.from_map(rule)
+
+        def operation(context: _Context) -> Dict[str, Any]:
+            values = context.source(rule.source)
+            if rule.pattern_type == "fixed":
+                frequency: Union[str, pd.Series] = rule.frequency
+            else:
+                frequency = context.target(rule.frequency)
+            return {rule.target: converter.convert(values, frequency)}
+
+        return operation
@@ -0,0 +1,67 @@
+"""Conversion of SDMX reporting periods to timestamps."""
+
+import numpy as np
+import pandas as pd
+
+REPORTING_PERIOD = r"^(?P<year>\d{4})-(?P<type>[ASTQMWD])(?P<number>\d{1,3})$"
+# Number of months in the reporting periods of each type
+MONTHS = {"A": 12, "S": 6, "T": 4, "Q": 3, "M": 1}
+
+
+def period_start(periods: pd.Series) -> pd.Series:
+    """Returns the start of the supplied periods, as UTC timestamps.
+
+    Supported periods are years (e.g. ``2024``), SDMX reporting periods
+    (e.g. ``2024-Q1``, ``2024-S2``, ``2024-M03``, ``2024-W05`` or
+    ``2024-D100``), as well as ISO 8601 dates and datetimes (e.g.
+    ``2024-03`` or ``2024-03-01T12:00:00``). Invalid periods, like missing
+    periods, result in ``NaT``.
+
+    Each distinct period is only converted once.
+
+    Args:
+        periods: The periods to be converted.
+
+    Returns:
+        The start of the periods.
+    """
+    codes, uniques = pd.factorize(periods)
+    starts = __convert(pd.Series(uniques, dtype=object)).to_numpy()
+    # Missing periods (code -1) pick the NaT appended at the end
+    starts = np.append(starts, np.datetime64("NaT", "ns"))
+    return pd.Series(starts[codes], index=periods.index).dt.tz_localize("UTC")
+
+
+def __convert(periods: pd.Series) -> pd.Series:
+    values = periods.astype("string").str.strip()
+    out = pd.to_datetime(values, format="ISO8601", errors="coerce", utc=True)
+    parts = values.str.extract(REPORTING_PERIOD)
+    year = parts["year"]
+    number = parts["number"]
+    for kind, months in MONTHS.items():
+        rows = parts["type"] == kind
+        if rows.any():
+            month = (number[rows].astype(int) - 1) * months + 1
+            out[rows] = pd.to_datetime(
+                year[rows] + "-" + month.astype(str),
+                format="%Y-%m",
+                errors="coerce",
+                utc=True,
+            ).where(month <= 12)
+    rows = parts["type"] == "W"
+    if rows.any():
+        out[rows] = pd.to_datetime(
+            year[rows] + "-W" + number[rows] + "-1",
+            format="%G-W%V-%u",
+            errors="coerce",
+            utc=True,
+        )
+    rows = parts["type"] == "D"
+    if rows.any():
+        out[rows] = pd.to_datetime(
+            year[rows] + "-" + number[rows].str.zfill(3),
+            format="%Y-%j",
+            errors="coerce",
+            utc=True,
+        )
+    return out.dt.tz_convert(None)
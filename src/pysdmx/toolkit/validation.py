@@ -0,0 +1,486 @@
+"""Validation of datasets against their schema.
+
+Each check is evaluated on whole columns and all violations are reported,
+in a table with one row per violation:
+
+- ``row``: The index of the offending row in the data (None for
+  components provided at the dataset level).
+- ``component``: The ID of the offending component.
+- ``rule``: The rule that has been violated (see ``Rule``).
+"""
+
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+import re
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+import numpy as np
+import pandas as pd
+
+from pysdmx.errors import Invalid
+from pysdmx.model import (
+    Codelist,
+    Component,
+    DataType,
+    Facets,
+    Hierarchy,
+    Schema,
+)
+from pysdmx.model.dataset import PandasDataset
+from pysdmx.toolkit.dtypes import cast, FLOAT_TYPES, INTEGER_TYPES
+from pysdmx.toolkit.periods import period_start
+
+
+class Rule(str, Enum):
+    """The rules checked when validating datasets."""
+
+    MISSING = "missing"
+    """A mandatory component is not in the dataset."""
+    MANDATORY = "mandatory"
+    """A mandatory component has no value."""
+    ENUMERATION = "enumeration"
+    """The value is not one of the expected codes."""
+    DTYPE = "dtype"
+    """The value does not match the data type of the component."""
+    LENGTH = "length"
+    """The value is too short or too long."""
+    RANGE = "range"
+    """The value is below the minimum or above the maximum value."""
+    PATTERN = "pattern"
+    """The value does not match the expected pattern."""
+    DECIMALS = "decimals"
+    """The value has too many decimals."""
+    TIME_RANGE = "time_range"
+    """The value is before the start time or after the end time."""
+    ATTACHMENT = "attachment"
+    """The value varies within the key to which the attribute is attached."""
+
+
+@lru_cache(maxsize=1024)
+def _pattern(pattern: str) -> "re.Pattern[str]":
+    return re.compile(pattern)
+
+
+def _utc(dt: datetime) -> pd.Timestamp:
+    ts = pd.Timestamp(dt)
+    return ts.tz_localize("UTC") if ts.tzinfo is None else ts
+
+
+class FacetChecker:
+    """Checks values against facets, such as the maximum length.
+
+    The facets are compiled once, when creating the checker (e.g. regular
+    expressions), and the checker can then be applied to whole columns, once
+    per distinct value. Missing values never violate facets.
+
+    Examples:
+        >>> checker = FacetChecker(Facets(max_length=3, pattern="[A-Z]+"))
+        >>> dict(checker.violations(pd.Series(["ABC", "abcd"])))
+    """
+
+    def __init__(self, facets: Facets):
+        """Compiles the facets.
+
+        Args:
+            facets: The facets to be checked.
+        """
+        self.facets = facets
+        f = facets
+        self.__checks: List[Tuple[Rule, Callable[[pd.Series], pd.Series]]] = []
+        if f.min_length is not None or f.max_length is not None:
+            self.__checks.append((Rule.LENGTH, self.__length))
+        if any(
+            v is not None
+            for v in (f.min_value, f.max_value, f.start_value, f.end_value)
+        ):
+            self.__checks.append((Rule.RANGE, self.__range))
+        if f.pattern is not None:
+            self.__regex = _pattern(f.pattern)
+            self.__checks.append((Rule.PATTERN, self.__match))
+        if f.decimals is not None:
+            self.__checks.append((Rule.DECIMALS, self.__decimals))
+        if f.start_time is not None or f.end_time is not None:
+            self.__checks.append((Rule.TIME_RANGE, self.__time_range))
+
+    def __len__(self) -> int:
+        """Returns the number of facets to be checked."""
+        return len(self.__checks)
+
+    def violations(
+        self, values: pd.Series
+    ) -> Iterator[Tuple[Rule, np.ndarray]]:
+        """Checks the values against the facets.
+
+        Args:
+            values: The values to be checked.
+
+        Yields:
+            For each facet, the rule and whether each value violates it.
+        """
+        # Each distinct value is only checked once
+        codes, uniques = pd.factorize(values)
+        distinct = pd.Series(uniques, dtype=object)
+        for rule, check in self.__checks:
+            # Missing values (code -1) pick the False appended at the end
+            invalid = np.append(check(distinct).to_numpy(dtype=bool), False)
+            yield rule, invalid[codes]
+
+    def __length(self, values: pd.Series) -> pd.Series:
+        lengths = values.astype(str).str.len()
+        out = pd.Series(False, index=values.index)
+        if self.facets.min_length is not None:
+            out |= lengths < self.facets.min_length
+        if self.facets.max_length is not None:
+            out |= lengths > self.facets.max_length
+        return out
+
+    def __range(self, values: pd.Series) -> pd.Series:
+        # Non-numeric values are data type violations
+        numbers = pd.to_numeric(values, errors="coerce")
+        out = pd.Series(False, index=values.index)
+        for low in (self.facets.min_value, self.facets.start_value):
+            if low is not None:
+                out |= numbers < low
+        for high in (self.facets.max_value, self.facets.end_value):
+            if high is not None:
+                out |= numbers > high
+        return out
+
+    def __match(self, values: pd.Series) -> pd.Series:
+        return ~values.astype(str).str.fullmatch(self.__regex)
+
+    def __decimals(self, values: pd.Series) -> pd.Series:
+        decimals = int(self.facets.decimals or 0)
+        numbers = pd.to_numeric(values, errors="coerce").astype("float64")
+        # Tolerate the representation error of binary floating points
+        extra = ~np.isclose(
+            numbers, numbers.round(decimals), rtol=1e-12, atol=0
+        )
+        return pd.Series(
+            extra & numbers.notna().to_numpy(), index=values.index
+        )
+
+    def __time_range(self, values: pd.Series) -> pd.Series:
+        # Invalid periods are data type violations
+        starts = period_start(values)
+        out = pd.Series(False, index=values.index)
+        if self.facets.start_time is not None:
+            out |= starts < _utc(self.facets.start_time)
+        if self.facets.end_time is not None:
+            out |= starts > _utc(self.facets.end_time)
+        return out
+
+
+class _Grouping(NamedTuple):
+    """The rows of a dataset, grouped by an attachment key."""
+
+    level: str
+    attributes: List[str]
+    groups: Any
+    counts: pd.DataFrame
+
+
+class AttachmentChecker:
+    """Checks that attributes are constant within their attachment key.
+
+    Series- and group-level attributes (i.e. attributes attached to a set of
+    dimensions, such as ``FREQ,REF_AREA``) must have the same value for all
+    observations sharing the same values for these dimensions. Rows are
+    grouped once per attachment key, and all attributes attached to that key
+    are checked in one pass. Missing values are ignored.
+
+    Examples:
+        >>> checker = AttachmentChecker(schema)
+        >>> checker.inconsistencies(dataset)
+        >>> checker.collapse(dataset)
+    """
+
+    def __init__(self, schema: Schema):
+        """Collects the attributes attached to dimensions.
+
+        Args:
+            schema: The schema of the datasets to be checked.
+        """
+        self.schema = schema
+        self.__levels: Dict[str, List[str]] = {}
+        for c in schema.components.attributes:
+            level = c.attachment_level
+            if level and level not in ("D", "O"):
+                self.__levels.setdefault(level, []).append(c.id)
+
+    def __groupings(self, data: pd.DataFrame) -> Iterator[_Grouping]:
+        for level, attributes in self.__levels.items():
+            key = [d.strip() for d in level.split(",")]
+            present = [a for a in attributes if a in data.columns]
+            if present and all(d in data.columns for d in key):
+                groups = data.groupby(
+                    key, sort=False, dropna=False, observed=True
+                )[present]
+                yield _Grouping(level, present, groups, groups.nunique())
+
+    def inconsistencies(
+        self, dataset: PandasDataset
+    ) -> Dict[str, pd.DataFrame]:
+        """Returns the keys for which attributes have several values.
+
+        Args:
+            dataset: The dataset to be checked.
+
+        Returns:
+            For each inconsistent attribute, the offending keys, as a table
+            with one column per dimension of the attachment key.
+        """
+        out = {}
+        for g in self.__groupings(dataset.data):
+            for attribute in g.attributes:
+                offending = g.counts[attribute] > 1
+                if offending.any():
+                    keys = g.counts.index[offending.to_numpy()]
+                    out[attribute] = keys.to_frame(index=False)
+        return out
+
+    def collapse(self, dataset: PandasDataset) -> Dict[str, pd.DataFrame]:
+        """Collapses the attributes to one row per attachment key.
+
+        Args:
+            dataset: The dataset whose attributes must be collapsed.
+
+        Returns:
+            For each attachment level (e.g. ``FREQ,REF_AREA``), a table with
+            one row per key, with the dimensions of the key and the (first
+            non-missing) values of the attributes attached to it.
+
+        Raises:
+            Invalid: If attributes have several values for the same key.
+        """
+        out = {}
+        for g in self.__groupings(dataset.data):
+            offending = [a for a in g.attributes if (g.counts[a] > 1).any()]
+            if offending:
+                raise Invalid(
+                    "Inconsistent attributes",
+                    (
+                        f"Attributes {', '.join(offending)} have several "
+                        f"values for the same {g.level} key."
+                    ),
+                )
+            out[g.level] = g.groups.first().reset_index()
+        return out
+
+    def violations(
+        self, data: pd.DataFrame
+    ) -> Iterator[Tuple[str, np.ndarray]]:
+        """Returns the rows of the keys for which attributes vary.
+
+        Args:
+            data: The data to be checked.
+
+        Yields:
+            For each attribute, whether each row belongs to an inconsistent
+            key.
+        """
+        for g in self.__groupings(data):
+            codes = g.groups.ngroup().to_numpy()
+            for attribute in g.attributes:
+                yield attribute, (g.counts[attribute] > 1).to_numpy()[codes]
+
+
+class _Check(NamedTuple):
+    """The checks applying to a component, compiled once per schema."""
+
+    id: str
+    required: bool
+    codes: Optional[FrozenSet[str]]
+    dtype: DataType
+    facets: Optional[FacetChecker]
+
+
+class _Errors:
+    """Collects the positions of the rows violating rules.
+
+    Violations at the dataset level are stored at position -1.
+    """
+
+    def __init__(self, index: pd.Index):
+        self.index = index
+        self.rows: List[np.ndarray] = []
+        self.components: List[str] = []
+        self.rules: List[Rule] = []
+        self.counts: List[int] = []
+
+    def add(self, rows: np.ndarray, component: str, rule: Rule) -> None:
+        """Adds the positions of the rows violating the rule."""
+        if len(rows) > 0:
+            self.rows.append(rows)
+            self.components.append(component)
+            self.rules.append(rule)
+            self.counts.append(len(rows))
+
+    def add_mask(self, mask: np.ndarray, component: str, rule: Rule) -> None:
+        """Adds the rows violating the rule, as a boolean mask."""
+        self.add(np.flatnonzero(mask), component, rule)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Returns the violations, as a columnar table."""
+        if not self.rows:
+            return pd.DataFrame(
+                {
+                    "row": pd.Series([], dtype=object),
+                    "component": pd.Categorical([]),
+                    "rule": pd.Categorical([]),
+                }
+            )
+        counts = np.array(self.counts)
+        components = pd.Categorical(np.repeat(self.components, counts))
+        rules = pd.Categorical(
+            np.repeat([r.value for r in self.rules], counts)
+        )
+        positions = np.concatenate(self.rows)
+        rows = self.index.take(np.maximum(positions, 0)).to_numpy()
+        if (positions < 0).any():
+            rows = rows.astype(object)
+            rows[positions < 0] = None
+        return pd.DataFrame(
+            {
+                "row": rows,
+                "component": components,
+                "rule": rules,
+            }
+        )
+
+
+def _codes(enumeration: Any) -> Optional[FrozenSet[str]]:
+    if isinstance(enumeration, Codelist):
+        return enumeration.ids
+    if isinstance(enumeration, Hierarchy):
+        return frozenset(c.id for c in enumeration.all_codes())
+    return None
+
+
+def _invalid_types(values: pd.Series, dtype: DataType) -> pd.Series:
+    """Returns whether each value does not match the data type."""
+    if (
+        dtype in INTEGER_TYPES
+        or dtype in FLOAT_TYPES
+        or dtype == DataType.BOOLEAN
+    ):
+        converted = cast(values, dtype)
+    elif dtype == DataType.DATE:
+        converted = pd.to_datetime(values, format="%Y-%m-%d", errors="coerce")
+    elif dtype == DataType.DATE_TIME:
+        converted = pd.to_datetime(values, format="ISO8601", errors="coerce")
+    else:
+        return pd.Series(False, index=values.index)
+    return converted.isna() & values.notna()
+
+
+class Validator:
+    """Validates datasets against a schema.
+
+    The checks are compiled once, when creating the validator (e.g. the
+    sets of expected codes or the regular expressions of patterns), and the
+    validator can then be applied to any number of datasets.
+
+    The following rules are checked (see ``Rule``):
+
+    - Mandatory components must be present, and must have a value.
+    - Values of enumerated components must be one of the expected codes.
+    - Values must match the data type of the component (for numbers,
+      booleans, dates and datetimes).
+    - Values must comply with the facets of the component (see
+      ``FacetChecker``).
+    - Series- and group-level attributes must be constant within their
+      attachment key (see ``AttachmentChecker``).
+
+    Examples:
+        >>> validator = Validator(schema)
+        >>> errors = validator.validate(dataset)
+        >>> errors.groupby(["component", "rule"]).size()
+    """
+
+    def __init__(self, schema: Schema):
+        """Compiles the checks for the components of the schema.
+
+        Args:
+            schema: The schema against which datasets are validated.
+        """
+        self.schema = schema
+        self.__checks = [self.__compile(c) for c in schema.components]
+        self.__attachments = AttachmentChecker(schema)
+
+    def __compile(self, component: Component) -> _Check:
+        facets = component.facets
+        return _Check(
+            component.id,
+            component.required,
+            _codes(component.enumeration),
+            component.dtype,
+            FacetChecker(facets) if facets is not None else None,
+        )
+
+    def validate(self, dataset: PandasDataset) -> pd.DataFrame:
+        """Validates the dataset, and reports all violations.
+
+        Args:
+            dataset: The dataset to be validated.
+
+        Returns:
+            A table with one row per violation (``row``, ``component`` and
+            ``rule``). The table is empty if the dataset is valid.
+        """
+        data = dataset.data
+        errors = _Errors(data.index)
+        dataset_level = np.array([-1])
+        for check in self.__checks:
+            if check.id in data.columns:
+                self.__check(data[check.id], check, None, errors)
+            elif check.id in dataset.attributes:
+                value = pd.Series([dataset.attributes[check.id]])
+                self.__check(value, check, dataset_level, errors)
+            elif check.required:
+                errors.add(dataset_level, check.id, Rule.MISSING)
+        for attribute, rows in self.__attachments.violations(data):
+            errors.add_mask(rows, attribute, Rule.ATTACHMENT)
+        return errors.to_frame()
+
+    def __check(
+        self,
+        values: pd.Series,
+        check: _Check,
+        rows: Optional[np.ndarray],
+        errors: _Errors,
+    ) -> None:
+        def add(mask: np.ndarray, rule: Rule) -> None:
+            if rows is None:
+                errors.add_mask(mask, check.id, rule)
+            else:
+                errors.add(rows[mask], check.id, rule)
+
+        missing = values.isna().to_numpy()
+        if check.required:
+            add(missing, Rule.MANDATORY)
+        if check.codes is not None:
+            if not (
+                pd.api.types.is_object_dtype(values)
+                or pd.api.types.is_string_dtype(values)
+                or isinstance(values.dtype, pd.CategoricalDtype)
+            ):
+                values = values.astype(str)
+            unknown = ~values.isin(check.codes).to_numpy() & ~missing
+            add(unknown, Rule.ENUMERATION)
+        else:
+            add(_invalid_types(values, check.dtype).to_numpy(), Rule.DTYPE)
+        if check.facets is not None:
+            for rule, violations in check.facets.violations(values):
+                add(violations, rule)
@@ -1,7 +1,8 @@
 """Collection of utility functions."""
 
+from functools import lru_cache
 import re
-from typing import Any, Sequence
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from msgspec import Struct
 
@@ -53,39 +54,232 @@ class ItemReference(Struct, frozen=True):
 maintainable_urn_pattern = re.compile(r"^.*\.(.*)=(.*):(.*)\((.*)\)$")
 item_urn_pattern = re.compile(r"^.*\.(.*)=(.*):(.*)\((.*)\)\.(.*)$")
 
+# The number of distinct URNs kept in the cache of the parsers
+URN_CACHE_SIZE = 4096
 
+
+def _split_urn(
+    urn: str, short: bool = False
+) -> Optional[Tuple[str, str, str, str]]:
+    """Splits a maintainable URN into type, agency, id and version.
+
+    The URN is split on its separators (the ``=``, the ``(`` and the last
+    ``:`` before it), without backtracking. Malformed URNs, with several
+    ``=`` or ``(`` separators, are rejected. If short is True, the package
+    prefix (e.g. ``urn:sdmx:org.sdmx.infomodel.codelist.``) is optional,
+    i.e. short URNs like ``Codelist=BIS:CL_FREQ(1.0)`` are accepted too.
+
+    Args:
+        urn: The URN to be split.
+        short: Whether the package prefix is optional.
+
+    Returns:
+        The type, agency, id and version, or None if the URN is invalid.
+    """
+    if (
+        not urn.endswith(")")
+        or urn.count("=") != 1
+        or urn.count("(") != 1
+        or "\n" in urn
+    ):
+        return None
+    head, _, tail = urn.partition("=")
+    dot = head.rfind(".")
+    if dot < 0 and not short:
+        return None
+    before, sep, version = tail[:-1].rpartition("(")
+    if not sep:
+        return None
+    agency, sep, id_ = before.rpartition(":")
+    if not sep:
+        return None
+    return head[dot + 1 :], agency, id_, version
+
+
+@lru_cache(maxsize=URN_CACHE_SIZE)
 def parse_urn(urn: str) -> Reference:
-    """Parses an SDMX urn and returns an object with the details."""
-    m = re.match(maintainable_urn_pattern, urn)
-    if m:
-        return Reference(
-            sdmx_type=m.group(1),
-            agency=m.group(2),
-            id=m.group(3),
-            version=m.group(4),
-        )
+    """Parses an SDMX urn and returns an object with the details.
+
+    The results are cached, as the same URNs are typically parsed many
+    times (e.g. once per component referencing the same codelist).
+
+    Args:
+        urn: The urn to be parsed.
+
+    Returns:
+        The details of the urn.
+
+    Raises:
+        NotFound: If the urn is invalid.
+    """
+    parts = _split_urn(urn)
+    if parts:
+        return Reference(*parts)
     else:
         raise NotFound(NF, f"{urn} does not match {maintainable_urn_pattern}")
 
 
+@lru_cache(maxsize=URN_CACHE_SIZE)
 def parse_item_urn(urn: str) -> ItemReference:
-    """Parses an SDMX item urn and returns an object with the details."""
-    m = re.match(item_urn_pattern, urn)
-    if m:
-        return ItemReference(
-            sdmx_type=m.group(1),
-            agency=m.group(2),
-            id=m.group(3),
-            version=m.group(4),
-            item_id=m.group(5),
-        )
+    """Parses an SDMX item urn and returns an object with the details.
+
+    The results are cached, like for :func:`parse_urn`.
+
+    Args:
+        urn: The item urn to be parsed.
+
+    Returns:
+        The details of the item urn.
+
+    Raises:
+        NotFound: If the item urn is invalid.
+    """
+    maintainable, sep, item_id = urn.rpartition(").")
+    parts = _split_urn(f"{maintainable})") if sep else None
+    if parts:
+        return ItemReference(*parts, item_id=item_id)
     else:
         raise NotFound(NF, f"{urn} does not match {item_urn_pattern}.")
 
 
+def parse_urns(urns: Iterable[str]) -> List[Reference]:
+    """Parses SDMX urns, e.g. the references to the artefacts of a schema.
+
+    Each distinct urn is parsed only once, using :func:`parse_urn`, which
+    raises NotFound if one of the urns is invalid.
+
+    Args:
+        urns: The urns to be parsed.
+
+    Returns:
+        The details of the urns, in the same order.
+    """
+    urns = list(urns)
+    parsed = {u: parse_urn(u) for u in dict.fromkeys(urns)}
+    return [parsed[u] for u in urns]
+
+
+def parse_item_urns(urns: Iterable[str]) -> List[ItemReference]:
+    """Parses SDMX item urns, e.g. the components of constraint attachments.
+
+    Each distinct urn is parsed only once, using :func:`parse_item_urn`,
+    which raises NotFound if one of the urns is invalid.
+
+    Args:
+        urns: The item urns to be parsed.
+
+    Returns:
+        The details of the urns, in the same order.
+    """
+    urns = list(urns)
+    parsed = {u: parse_item_urn(u) for u in dict.fromkeys(urns)}
+    return [parsed[u] for u in urns]
+
+
+def _agency_id(artefact: Any) -> str:
+    if isinstance(artefact.agency, Agency):
+        return artefact.agency.id
+    return artefact.agency
+
+
+class ArtefactIndex(Sequence[Any]):
+    """A sequence of maintainable artefacts, indexed by their coordinates.
+
+    The index is meant to be built once per message, so that the
+    artefacts referenced by URN (e.g. the codelists used by the components
+    of a data structure) can be found in constant time, instead of
+    scanning the list of artefacts for each reference.
+
+    Both URNs (e.g. ``urn:sdmx:...codelist.Codelist=BIS:CL_FREQ(1.0)``)
+    and short URNs (e.g. ``Codelist=BIS:CL_FREQ(1.0)``) can be looked up.
+    As with :func:`find_by_urn`, the type of artefact is not checked, so
+    that, for example, a codelist can be found using a valuelist URN.
+    If several artefacts share the same coordinates, the first one wins.
+    """
+
+    def __init__(self, artefacts: Iterable[Any]) -> None:
+        """Indexes the supplied artefacts.
+
+        Args:
+            artefacts: The maintainable artefacts to be indexed.
+        """
+        self.__artefacts = list(artefacts)
+        self.__index: Dict[Tuple[str, str, str], Any] = {}
+        for a in self.__artefacts:
+            self.__index.setdefault((_agency_id(a), a.id, a.version), a)
+
+    def __getitem__(self, i: Any) -> Any:
+        """Returns the artefact at the supplied position."""
+        return self.__artefacts[i]
+
+    def __len__(self) -> int:
+        """Returns the number of artefacts."""
+        return len(self.__artefacts)
+
+    def get(self, agency: str, id: str, version: str) -> Optional[Any]:
+        """Returns the artefact with the supplied coordinates, if any.
+
+        Args:
+            agency: The maintainer of the artefact (e.g. ``BIS``).
+            id: The artefact ID (e.g. ``CL_FREQ``).
+            version: The artefact version (e.g. ``1.0``).
+
+        Returns:
+            The matching artefact, or None if there is none.
+        """
+        return self.__index.get((agency, id, version))
+
+    def find(self, urn: str) -> Any:
+        """Returns the artefact matching the supplied URN or short URN.
+
+        Args:
+            urn: The URN or short URN of the artefact.
+
+        Returns:
+            The matching artefact.
+
+        Raises:
+            NotFound: If the URN is invalid or no artefact matches it.
+        """
+        parts = _split_urn(urn, short=True)
+        if not parts:
+            raise NotFound(NF, f"{urn} is not a valid URN or short URN.")
+        a = self.get(*parts[1:])
+        if a is None:
+            raise NotFound(NF, _not_found_message(self.__artefacts, urn))
+        return a
+
+
+def _not_found_message(artefacts: Sequence[Any], urn: str) -> str:
+    urns = [f"{a.agency}:{a.id}({a.version})" for a in artefacts]
+    return (
+        f"Could not find an artefact matching the following URN: "
+        f"{urn}. The artefacts received were: {urns}."
+    )
+
+
 def find_by_urn(artefacts: Sequence[Any], urn: str) -> Any:
-    """Returns the maintainable artefact matching the supplied urn."""
+    """Returns the maintainable artefact matching the supplied urn.
+
+    If the artefacts are supplied as an :class:`ArtefactIndex`, the lookup
+    is done in constant time. Otherwise, the artefacts are scanned.
+
+    Args:
+        artefacts: The artefacts (or an index of the artefacts).
+        urn: The URN of the artefact to be found.
+
+    Returns:
+        The matching artefact.
+
+    Raises:
+        NotFound: If no artefact matches the URN.
+    """
     r = parse_urn(urn)
+    if isinstance(artefacts, ArtefactIndex):
+        a = artefacts.get(r.agency, r.id, r.version)
+        if a is None:
+            raise NotFound(NF, _not_found_message(artefacts, urn))
+        return a
     f = [
         a
         for a in artefacts
@@ -105,14 +299,15 @@ def find_by_urn(artefacts: Sequence[Any], urn: str) -> Any:
     if f:
         return f[0]
     else:
-        urns = [f"{a.agency}:{a.id}({a.version})" for a in artefacts]
-        raise NotFound(
-            NF,
-            (
-                f"Could not find an artefact matching the following URN: "
-                f"{urn}. The artefacts received were: {urns}."
-            ),
-        )
+        raise NotFound(NF, _not_found_message(artefacts, urn))
 
 
-__all__ = ["convert_dpm", "find_by_urn", "parse_item_urn", "parse_urn"]
+__all__ = [
+    "ArtefactIndex",
+    "convert_dpm",
+    "find_by_urn",
+    "parse_item_urn",
+    "parse_item_urns",
+    "parse_urn",
+    "parse_urns",
+]
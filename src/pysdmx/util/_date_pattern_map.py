@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from parsy import (  # type: ignore[import-untyped]
     alt,
     any_char,
@@ -47,8 +49,22 @@ __single_parser = alt(
 __dpm_parser = __single_parser.at_least(1)
 
 
+@lru_cache(maxsize=1024)
 def convert_dpm(sdmx_pattern: str) -> str:
-    """Convert an SDMX date pattern into Python format codes."""
+    """Convert an SDMX date pattern into Python format codes.
+
+    Translated patterns are cached, as patterns are typically translated
+    over and over again (e.g. via ``DatePatternMap.py_pattern``).
+
+    Args:
+        sdmx_pattern: The SDMX date pattern (e.g. ``MMM yy``).
+
+    Returns:
+        The equivalent Python format codes (e.g. ``%b %y``).
+
+    Raises:
+        Invalid: If the pattern is invalid or not supported.
+    """
     unsupported = ["G", "n", "kk", "KK", "S", "W"]
     for i in unsupported:
         if i in sdmx_pattern:
@@ -0,0 +1,96 @@
+"""Values of a component selected by content constraints."""
+
+from typing import Dict, FrozenSet, Iterable, Mapping, Tuple
+
+from msgspec import Struct
+
+
+class ValueSelection(Struct, frozen=True):
+    """The values of a component selected by one or more cube regions.
+
+    A selection is either a set of values (``include=True``), or all the
+    values except a set of values (``include=False``). Selections are
+    combined using set operations, so that membership tests remain
+    constant-time, whatever the number of cube regions.
+
+    Attributes:
+        values: The included (or excluded) values.
+        include: Whether the values are included or excluded.
+    """
+
+    values: FrozenSet[str] = frozenset()
+    include: bool = False
+
+    @classmethod
+    def of(
+        cls, values: Iterable[str], include: bool = True
+    ) -> "ValueSelection":
+        """Creates a selection including (or excluding) the values."""
+        return cls(frozenset(values), include)
+
+    @property
+    def is_all(self) -> bool:
+        """Whether all values are selected."""
+        return not self.include and not self.values
+
+    def __contains__(self, value: object) -> bool:
+        """Whether the value is selected."""
+        return (value in self.values) == self.include
+
+    def __or__(self, other: "ValueSelection") -> "ValueSelection":
+        """Returns the values selected by any of the two selections."""
+        if self.include and other.include:
+            return ValueSelection(self.values | other.values, True)
+        if self.include:
+            return ValueSelection(other.values - self.values, False)
+        if other.include:
+            return ValueSelection(self.values - other.values, False)
+        return ValueSelection(self.values & other.values, False)
+
+    def __and__(self, other: "ValueSelection") -> "ValueSelection":
+        """Returns the values selected by both selections."""
+        if self.include and other.include:
+            return ValueSelection(self.values & other.values, True)
+        if self.include:
+            return ValueSelection(self.values - other.values, True)
+        if other.include:
+            return ValueSelection(other.values - self.values, True)
+        return ValueSelection(self.values | other.values, False)
+
+    def __invert__(self) -> "ValueSelection":
+        """Returns the values not selected by this selection."""
+        return ValueSelection(self.values, not self.include)
+
+
+def merge_cube_regions(
+    regions: Iterable[Tuple[bool, Mapping[str, ValueSelection]]],
+) -> Dict[str, ValueSelection]:
+    """Merges cube regions into the values selected per component.
+
+    A value of a component is selected if any of the included regions
+    selects it (a region that does not constrain the component selects all
+    its values). Excluded regions remove values from the selection, but
+    only when they constrain a single component: excluding a combination
+    of values of several components does not exclude any value on its own.
+
+    Args:
+        regions: Whether each region is included, and the values selected
+            by the region, per component.
+
+    Returns:
+        The values selected per component, for the constrained components.
+    """
+    regions = list(regions)
+    included = [r for inc, r in regions if inc]
+    out: Dict[str, ValueSelection] = {}
+    for c in {comp for r in included for comp in r}:
+        selection = included[0].get(c, ValueSelection())
+        for r in included[1:]:
+            selection = selection | r.get(c, ValueSelection())
+        if not selection.is_all:
+            out[c] = selection
+    for inc, r in regions:
+        if not inc and len(r) == 1:
+            ((c, excluded),) = r.items()
+            out[c] = out.get(c, ValueSelection()) & ~excluded
+    return out
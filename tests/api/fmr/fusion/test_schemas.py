@@ -429,3 +429,33 @@ def test_has_hierarchy_pra(
         hierarchy_pra_body,
         hier_assoc_pra_body,
     )
+
+
+@pytest.mark.asyncio()
+async def test_schemas(
+    respx_mock,
+    async_fmr,
+    query,
+    no_const_query,
+    no_hca_query,
+    body,
+    no_const_body,
+    no_hca_body,
+):
+    """Several schemas can be retrieved concurrently."""
+    await checks.check_schemas(
+        respx_mock,
+        async_fmr,
+        query,
+        no_const_query,
+        no_hca_query,
+        body,
+        no_const_body,
+        no_hca_body,
+    )
+
+
+@pytest.mark.asyncio()
+async def test_schemas_invalid_concurrency(async_fmr):
+    """The concurrency limit must be positive."""
+    await checks.check_schemas_invalid_concurrency(async_fmr)
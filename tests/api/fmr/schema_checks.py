@@ -1,8 +1,10 @@
 from datetime import datetime
 
 import httpx
+import pytest
 
 from pysdmx.api.fmr import AsyncRegistryClient, RegistryClient
+from pysdmx.errors import Invalid
 from pysdmx.model import (
     Codelist,
     Component,
@@ -553,3 +555,48 @@ def check_hierarchy_pra(
             )
         else:
             assert isinstance(d.enumeration, Codelist)
+
+
+async def check_schemas(
+    mock,
+    fmr: AsyncRegistryClient,
+    query,
+    no_const_query,
+    hca_query,
+    body,
+    no_const_body,
+    hca_body,
+):
+    """get_schemas() should return the schemas, in the requested order."""
+    hca_route = mock.get(hca_query).mock(
+        return_value=httpx.Response(200, content=hca_body)
+    )
+    route = mock.get(query).mock(
+        return_value=httpx.Response(200, content=body)
+    )
+    no_const_route = mock.get(no_const_query).mock(
+        return_value=httpx.Response(200, content=no_const_body)
+    )
+
+    schemas = await fmr.get_schemas(
+        [
+            ("datastructure", "BIS", "BIS_CBS", "1.0"),
+            ("dataflow", "BIS.CBS", "CBS", "1.0"),
+        ],
+        max_concurrency=1,
+    )
+
+    assert len(schemas) == 2
+    assert schemas[0].context == "datastructure"
+    assert schemas[0].id == "BIS_CBS"
+    assert schemas[1].context == "dataflow"
+    assert schemas[1].id == "CBS"
+    assert hca_route.call_count == 1
+    assert route.call_count == 1
+    assert no_const_route.call_count == 1
+
+
+async def check_schemas_invalid_concurrency(fmr: AsyncRegistryClient):
+    """get_schemas() needs a positive concurrency limit."""
+    with pytest.raises(Invalid, match="concurrency"):
+        await fmr.get_schemas([("dataflow", "BIS.CBS", "CBS", "1.0")], 0)
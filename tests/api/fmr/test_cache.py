@@ -0,0 +1,283 @@
+import time
+
+import httpx
+import pytest
+
+from pysdmx.api.fmr import AsyncRegistryClient, Format, RegistryClient
+from pysdmx.api.fmr.cache import (
+    Cache,
+    CacheEntry,
+    DiskCache,
+    MemoryCache,
+    TieredCache,
+)
+from pysdmx.errors import InternalError, Invalid
+
+ENDPOINT = "https://registry.sdmx.org/sdmx/v2"
+KEY = f"{Format.SDMX_JSON.value} {ENDPOINT}/structure/codelist/SDMX/CL_FREQ/"
+
+
+@pytest.fixture()
+def query() -> str:
+    return f"{ENDPOINT}/structure/codelist/SDMX/CL_FREQ/2.0"
+
+
+@pytest.fixture()
+def latest_query() -> str:
+    return f"{ENDPOINT}/structure/codelist/SDMX/CL_FREQ/+"
+
+
+@pytest.fixture()
+def body():
+    with open("tests/api/fmr/samples/code/freq.json", "rb") as f:
+        return f.read()
+
+
+@pytest.fixture()
+def final_body(body):
+    return body.replace(b'"isFinal": false', b'"isFinal": true')
+
+
+def test_memory_cache_lru():
+    cache = MemoryCache(2)
+    cache.set("a", CacheEntry(b"a", 0.0))
+    cache.set("b", CacheEntry(b"b", 0.0))
+    cache.get("a")
+    cache.set("c", CacheEntry(b"c", 0.0))
+
+    assert isinstance(cache, Cache)
+    assert len(cache) == 2
+    assert cache.get("a").content == b"a"
+    assert cache.get("b") is None
+    assert cache.get("c").content == b"c"
+
+
+def test_memory_cache_invalid_size():
+    with pytest.raises(Invalid, match="positive"):
+        MemoryCache(0)
+
+
+def test_disk_cache(tmp_path):
+    entry = CacheEntry(b"content", 1.0, '"etag"', "yesterday", True)
+    DiskCache(tmp_path / "cache").set("key", entry)
+
+    cache = DiskCache(tmp_path / "cache")
+
+    assert isinstance(cache, Cache)
+    assert cache.get("key") == entry
+    assert cache.get("other") is None
+    assert [p.suffix for p in (tmp_path / "cache").iterdir()] == [".msgpack"]
+
+
+def test_disk_cache_corrupted(tmp_path):
+    cache = DiskCache(tmp_path)
+    cache.set("key", CacheEntry(b"content", 1.0))
+    for p in tmp_path.iterdir():
+        p.write_bytes(b"garbage")
+
+    assert cache.get("key") is None
+
+
+def test_tiered_cache(tmp_path):
+    memory = MemoryCache()
+    disk = DiskCache(tmp_path)
+    disk.set("key", CacheEntry(b"content", 1.0))
+    cache = TieredCache(memory, disk)
+
+    assert cache.get("key").content == b"content"
+    assert memory.get("key").content == b"content"
+    assert cache.get("other") is None
+
+    cache.set("other", CacheEntry(b"other", 1.0))
+    assert memory.get("other").content == b"other"
+    assert disk.get("other").content == b"other"
+
+
+def test_no_cache_by_default(respx_mock, query, body):
+    route = respx_mock.get(query).mock(
+        return_value=httpx.Response(200, content=body)
+    )
+    fmr = RegistryClient(ENDPOINT)
+
+    fmr.get_codes("SDMX", "CL_FREQ", "2.0")
+    fmr.get_codes("SDMX", "CL_FREQ", "2.0")
+
+    assert route.call_count == 2
+
+
+def test_fresh_entries_reused(respx_mock, query, body):
+    route = respx_mock.get(query).mock(
+        return_value=httpx.Response(200, content=body)
+    )
+    cache = MemoryCache()
+    fmr = RegistryClient(ENDPOINT, cache=cache)
+
+    first = fmr.get_codes("SDMX", "CL_FREQ", "2.0")
+    second = fmr.get_codes("SDMX", "CL_FREQ", "2.0")
+
+    assert route.call_count == 1
+    assert first == second
+    assert len(cache) == 1
+    assert cache.get(f"{KEY}2.0").final is False
+
+
+def test_revalidation(respx_mock, query, body):
+    route = respx_mock.get(query).mock(
+        side_effect=[
+            httpx.Response(
+                200,
+                content=body,
+                headers={"ETag": '"v1"', "Last-Modified": "yesterday"},
+            ),
+            httpx.Response(304),
+        ]
+    )
+    cache = MemoryCache()
+    fmr = RegistryClient(ENDPOINT, cache=cache, cache_ttl=0)
+
+    first = fmr.get_codes("SDMX", "CL_FREQ", "2.0")
+    stored = cache.get(f"{KEY}2.0").stored
+    second = fmr.get_codes("SDMX", "CL_FREQ", "2.0")
+
+    assert route.call_count == 2
+    assert first == second
+    request = route.calls.last.request
+    assert request.headers["If-None-Match"] == '"v1"'
+    assert request.headers["If-Modified-Since"] == "yesterday"
+    assert cache.get(f"{KEY}2.0").stored >= stored
+
+
+def test_stale_entries_replaced(respx_mock, query, body):
+    route = respx_mock.get(query).mock(
+        return_value=httpx.Response(200, content=body)
+    )
+    cache = MemoryCache()
+    cache.set(f"{KEY}2.0", CacheEntry(b"outdated", time.time() - 10))
+    fmr = RegistryClient(ENDPOINT, cache=cache, cache_ttl=5)
+
+    codelist = fmr.get_codes("SDMX", "CL_FREQ", "2.0")
+
+    assert route.call_count == 1
+    assert "If-None-Match" not in route.calls.last.request.headers
+    assert len(codelist) > 0
+    assert cache.get(f"{KEY}2.0").content == body
+
+
+def test_final_artefacts_always_fresh(respx_mock, query, final_body):
+    route = respx_mock.get(query).mock(
+        return_value=httpx.Response(200, content=final_body)
+    )
+    cache = MemoryCache()
+    fmr = RegistryClient(ENDPOINT, cache=cache, cache_ttl=0)
+
+    fmr.get_codes("SDMX", "CL_FREQ", "2.0")
+    fmr.get_codes("SDMX", "CL_FREQ", "2.0")
+
+    assert route.call_count == 1
+    assert cache.get(f"{KEY}2.0").final is True
+
+
+def test_wildcard_versions_not_final(respx_mock, latest_query, final_body):
+    route = respx_mock.get(latest_query).mock(
+        return_value=httpx.Response(200, content=final_body)
+    )
+    cache = MemoryCache()
+    fmr = RegistryClient(ENDPOINT, cache=cache, cache_ttl=0)
+
+    fmr.get_codes("SDMX", "CL_FREQ")
+    fmr.get_codes("SDMX", "CL_FREQ")
+
+    assert route.call_count == 2
+    assert cache.get(f"{KEY}+").final is False
+
+
+def test_referencing_artefacts_not_final(respx_mock):
+    schema_query = f"{ENDPOINT}/schema/dataflow/BIS/TEST_DF/1.0"
+    hca_query = (
+        f"{ENDPOINT}/structure/dataflow/BIS/TEST_DF/1.0"
+        "?detail=referencepartial&references=all"
+    )
+    bodies = {}
+    for q, name in [(schema_query, "schema"), (hca_query, "hca")]:
+        with open(
+            f"tests/api/fmr/samples/df/hierarchy_{name}.json", "rb"
+        ) as f:
+            bodies[q] = f.read().replace(
+                b'"isFinal": false', b'"isFinal": true'
+            )
+    routes = [
+        respx_mock.get(q).mock(return_value=httpx.Response(200, content=b))
+        for q, b in bodies.items()
+    ]
+    cache = MemoryCache()
+    fmr = RegistryClient(ENDPOINT, cache=cache, cache_ttl=0)
+
+    fmr.get_schema("dataflow", "BIS", "TEST_DF", "1.0")
+    fmr.get_schema("dataflow", "BIS", "TEST_DF", "1.0")
+
+    assert [r.call_count for r in routes] == [2, 2]
+    assert len(cache) == 2
+    assert cache.get(f"{Format.SDMX_JSON.value} {hca_query}").final is False
+
+
+def test_stale_entries_when_unavailable(respx_mock, query, body):
+    respx_mock.get(query).mock(side_effect=httpx.ConnectError("Bad day"))
+    cache = MemoryCache()
+    cache.set(f"{KEY}2.0", CacheEntry(body, 0.0))
+    fmr = RegistryClient(ENDPOINT, cache=cache)
+
+    codelist = fmr.get_codes("SDMX", "CL_FREQ", "2.0")
+
+    assert len(codelist) > 0
+
+
+def test_client_errors_not_hidden(respx_mock, query, body):
+    respx_mock.get(query).mock(return_value=httpx.Response(409))
+    cache = MemoryCache()
+    cache.set(f"{KEY}2.0", CacheEntry(body, 0.0))
+    fmr = RegistryClient(ENDPOINT, cache=cache)
+
+    with pytest.raises(Invalid):
+        fmr.get_codes("SDMX", "CL_FREQ", "2.0")
+
+
+def test_errors_not_cached(respx_mock, query):
+    respx_mock.get(query).mock(return_value=httpx.Response(500))
+    cache = MemoryCache()
+    fmr = RegistryClient(ENDPOINT, cache=cache)
+
+    with pytest.raises(InternalError):
+        fmr.get_codes("SDMX", "CL_FREQ", "2.0")
+    assert len(cache) == 0
+
+
+def test_disk_cache_shared(respx_mock, tmp_path, query, body):
+    route = respx_mock.get(query).mock(
+        return_value=httpx.Response(200, content=body)
+    )
+
+    RegistryClient(ENDPOINT, cache=DiskCache(tmp_path)).get_codes(
+        "SDMX", "CL_FREQ", "2.0"
+    )
+    codelist = RegistryClient(ENDPOINT, cache=DiskCache(tmp_path)).get_codes(
+        "SDMX", "CL_FREQ", "2.0"
+    )
+
+    assert route.call_count == 1
+    assert len(codelist) > 0
+
+
+@pytest.mark.asyncio()
+async def test_async_cache(respx_mock, query, body):
+    route = respx_mock.get(query).mock(
+        return_value=httpx.Response(200, content=body, headers={"ETag": "1"})
+    )
+    cache = MemoryCache()
+
+    async with AsyncRegistryClient(ENDPOINT, cache=cache) as fmr:
+        first = await fmr.get_codes("SDMX", "CL_FREQ", "2.0")
+        second = await fmr.get_codes("SDMX", "CL_FREQ", "2.0")
+
+    assert route.call_count == 1
+    assert first == second
+    assert cache.get(f"{KEY}2.0").etag == "1"
@@ -0,0 +1,126 @@
+import httpx
+import pytest
+
+import pysdmx.api.fmr as fmr_module
+from pysdmx.api.fmr import AsyncRegistryClient, Format, RegistryClient
+from pysdmx.errors import Invalid
+
+ENDPOINT = "https://registry.sdmx.org/sdmx/v2"
+
+
+@pytest.fixture()
+def query() -> str:
+    return f"{ENDPOINT}/structure/agencyscheme/BIS"
+
+
+@pytest.fixture()
+def body():
+    with open("tests/api/fmr/samples/orgs/agencies.json", "rb") as f:
+        return f.read()
+
+
+@pytest.fixture()
+def clients(monkeypatch):
+    created = []
+
+    class SpyClient(httpx.Client):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            created.append((self, kwargs))
+
+    class SpyAsyncClient(httpx.AsyncClient):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            created.append((self, kwargs))
+
+    monkeypatch.setattr(fmr_module.httpx, "Client", SpyClient)
+    monkeypatch.setattr(fmr_module.httpx, "AsyncClient", SpyAsyncClient)
+    return created
+
+
+def test_connections_reused(respx_mock, clients, query, body):
+    route = respx_mock.get(query).mock(
+        return_value=httpx.Response(200, content=body)
+    )
+    fmr = RegistryClient(ENDPOINT, Format.SDMX_JSON)
+
+    fmr.get_agencies("BIS")
+    fmr.get_agencies("BIS")
+
+    assert route.call_count == 2
+    assert len(clients) == 1
+    fmr.close()
+
+
+def test_context_manager(respx_mock, clients, query, body):
+    respx_mock.get(query).mock(return_value=httpx.Response(200, content=body))
+
+    with RegistryClient(ENDPOINT) as fmr:
+        fmr.get_agencies("BIS")
+        client = clients[0][0]
+        assert not client.is_closed
+
+    assert client.is_closed
+
+
+def test_usable_after_close(respx_mock, clients, query, body):
+    respx_mock.get(query).mock(return_value=httpx.Response(200, content=body))
+    fmr = RegistryClient(ENDPOINT)
+    fmr.close()
+
+    fmr.get_agencies("BIS")
+    fmr.close()
+    fmr.get_agencies("BIS")
+
+    assert len(clients) == 2
+    assert clients[0][0].is_closed
+    fmr.close()
+
+
+def test_pool_options(respx_mock, clients, query, body):
+    respx_mock.get(query).mock(return_value=httpx.Response(200, content=body))
+    limits = httpx.Limits(max_connections=4, max_keepalive_connections=2)
+
+    with RegistryClient(ENDPOINT, timeout=3.0, limits=limits) as fmr:
+        fmr.get_agencies("BIS")
+
+    options = clients[0][1]
+    assert options["timeout"] == 3.0
+    assert options["limits"] == limits
+    assert options["http2"] is False
+
+
+def test_http2_requires_h2(monkeypatch):
+    monkeypatch.setattr(fmr_module, "find_spec", lambda _: None)
+
+    with pytest.raises(Invalid, match="h2"):
+        RegistryClient(ENDPOINT, http2=True)
+
+
+@pytest.mark.asyncio()
+async def test_async_connections_reused(respx_mock, clients, query, body):
+    route = respx_mock.get(query).mock(
+        return_value=httpx.Response(200, content=body)
+    )
+
+    async with AsyncRegistryClient(ENDPOINT) as fmr:
+        await fmr.get_agencies("BIS")
+        await fmr.get_agencies("BIS")
+
+    assert route.call_count == 2
+    assert len(clients) == 1
+    assert clients[0][0].is_closed
+
+
+@pytest.mark.asyncio()
+async def test_async_usable_after_close(respx_mock, clients, query, body):
+    respx_mock.get(query).mock(return_value=httpx.Response(200, content=body))
+    fmr = AsyncRegistryClient(ENDPOINT)
+
+    await fmr.get_agencies("BIS")
+    await fmr.aclose()
+    await fmr.get_agencies("BIS")
+
+    assert len(clients) == 2
+    assert clients[0][0].is_closed
+    await fmr.aclose()
@@ -0,0 +1,27 @@
+from pathlib import Path
+
+import pytest
+
+from pysdmx.io.json.fusion.reader import deserializers as fusion_readers
+from pysdmx.io.json.sdmxjson2.reader import deserializers as sdmx_readers
+
+SAMPLES = Path(__file__).parent / "samples" / "orgs"
+
+
+@pytest.mark.parametrize(
+    ("readers", "filename"),
+    [
+        (sdmx_readers, "agencies.json"),
+        (fusion_readers, "agencies.fusion.json"),
+    ],
+)
+def test_decoder_reused(readers, filename):
+    content = (SAMPLES / filename).read_bytes()
+
+    decoder = readers.decoder(readers.agencies)
+
+    assert readers.decoder(readers.agencies) is decoder
+    assert readers.decoder(readers.codes) is not decoder
+    agencies = decoder.decode(memoryview(content)).to_model()
+    assert agencies == decoder.decode(content).to_model()
+    assert len(agencies) > 0
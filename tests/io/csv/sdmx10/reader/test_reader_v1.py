@@ -1,9 +1,20 @@
 from pathlib import Path
 
+import pandas as pd
 import pytest
 
 from pysdmx.errors import Invalid
-from pysdmx.io.csv.sdmx10.reader import read
+from pysdmx.io.csv.sdmx10.reader import read, read_chunks
+from pysdmx.model import (
+    Code,
+    Codelist,
+    Component,
+    Components,
+    Concept,
+    DataType,
+    Role,
+    Schema,
+)
 
 
 @pytest.fixture()
@@ -24,6 +35,26 @@ def data_path_no_freq():
     return base_path
 
 
+@pytest.fixture()
+def schema():
+    components = [
+        Component("FREQ", True, Role.DIMENSION, Concept("FREQ")),
+        Component(
+            "TIME_PERIOD",
+            True,
+            Role.DIMENSION,
+            Concept("TIME_PERIOD", dtype=DataType.PERIOD),
+        ),
+        Component(
+            "OBS_VALUE",
+            False,
+            Role.MEASURE,
+            Concept("OBS_VALUE", dtype=DataType.DOUBLE),
+        ),
+    ]
+    return Schema("datastructure", "BIS", "BIS_DER", Components(components))
+
+
 def test_reading_data_v1(data_path):
     with open(data_path, "r") as f:
         infile = f.read()
@@ -49,3 +80,116 @@ def test_reading_no_freq_v1(data_path_no_freq):
     df = dataset_dict["DataFlow=WB:GCI(1.0):GlobalCompetitivenessIndex"].data
     assert len(df) == 7
     assert "DATAFLOW" not in df.columns
+
+
+def test_reading_chunks_v1(data_path):
+    with open(data_path, "r") as f:
+        expected = read(f.read())["DataFlow=BIS:BIS_DER(1.0)"]
+
+    chunks = list(read_chunks(Path(data_path), chunksize=5000))
+
+    assert len(chunks) == 1
+    assert chunks[0].short_urn == "DataFlow=BIS:BIS_DER(1.0)"
+    assert chunks[0].attributes == {}
+    data = chunks[0].data.drop(columns=list(expected.attributes))
+    pd.testing.assert_frame_equal(data, expected.data)
+
+
+def test_reading_chunks_v1_same_columns(data_path):
+    with open(data_path, "rb") as f:
+        chunks = list(read_chunks(f, chunksize=10))
+
+    assert len(chunks) == 100
+    assert all(len(c.data) == 10 for c in chunks)
+    # Columns constant in some chunks only are kept in all chunks
+    columns = list(chunks[0].data.columns)
+    assert "DER_CURR_LEG1" in columns
+    assert all(list(c.data.columns) == columns for c in chunks)
+    assert all(c.attributes == {} for c in chunks)
+
+
+def test_reading_chunks_v1_dataset_attributes(data_path, schema):
+    availability = Component(
+        "AVAILABILITY",
+        False,
+        Role.ATTRIBUTE,
+        Concept("AVAILABILITY"),
+        attachment_level="D",
+    )
+    schema = Schema(
+        "datastructure",
+        "BIS",
+        "BIS_DER",
+        Components([*schema.components, availability]),
+    )
+
+    chunks = list(read_chunks(Path(data_path), chunksize=300, schema=schema))
+
+    assert all(c.attributes == {"AVAILABILITY": "K"} for c in chunks)
+    assert all("AVAILABILITY" not in c.data.columns for c in chunks)
+    assert all("FREQ" in c.data.columns for c in chunks)
+
+
+def test_reading_chunks_v1_invalid_dataset_attribute(data_path, schema):
+    obs_status = Component(
+        "OBS_STATUS",
+        False,
+        Role.ATTRIBUTE,
+        Concept("OBS_STATUS"),
+        attachment_level="D",
+    )
+    schema = Schema(
+        "datastructure",
+        "BIS",
+        "BIS_DER",
+        Components([*schema.components, obs_status]),
+    )
+
+    with pytest.raises(Invalid, match="OBS_STATUS"):
+        list(read_chunks(Path(data_path), chunksize=5000, schema=schema))
+
+
+def test_reading_chunks_v1_exception(data_path_exception):
+    with pytest.raises(Invalid, match="Invalid SDMX-CSV 1.0"):
+        list(read_chunks(Path(data_path_exception)))
+
+
+def test_reading_chunks_v1_invalid_chunksize(data_path):
+    with pytest.raises(Invalid, match="chunksize"):
+        list(read_chunks(Path(data_path), chunksize=0))
+
+
+def test_reading_with_schema(data_path, schema):
+    dataset_dict = read(Path(data_path), schema=schema)
+    df = dataset_dict["DataFlow=BIS:BIS_DER(1.0)"].data
+    assert str(df["OBS_VALUE"].dtype) == "float64"
+    assert df["OBS_VALUE"].isna().any()
+    assert df["TIME_PERIOD"].iloc[0] == "2002"
+    assert not (df == "nan").any().any()
+
+
+def test_read_chunks_with_schema(data_path, schema):
+    chunks = list(read_chunks(Path(data_path), chunksize=300, schema=schema))
+    assert all(str(c.data["OBS_VALUE"].dtype) == "float64" for c in chunks)
+
+
+def test_reading_with_schema_categorical(data_path, schema):
+    status = Codelist(
+        "CL_OBS_STATUS",
+        name="Observation status",
+        agency="BIS",
+        items=[Code("A"), Code("E"), Code("M")],
+    )
+    obs_status = Component(
+        "OBS_STATUS",
+        True,
+        Role.ATTRIBUTE,
+        Concept("OBS_STATUS", codes=status),
+    )
+    components = Components([*schema.components, obs_status])
+    schema = Schema("datastructure", "BIS", "BIS_DER", components)
+
+    dataset_dict = read(Path(data_path), schema=schema)
+    df = dataset_dict["DataFlow=BIS:BIS_DER(1.0)"].data
+    assert df["OBS_STATUS"].cat.categories.tolist() == ["A", "E", "M"]
+    assert set(df["OBS_STATUS"].cat.codes) == {0, 2}
@@ -1,9 +1,19 @@
 from pathlib import Path
 
+import pandas as pd
 import pytest
 
 from pysdmx.errors import Invalid
-from pysdmx.io.csv.sdmx20.reader import read
+from pysdmx.io.csv.sdmx20.reader import read, read_chunks
+from pysdmx.model import (
+    Component,
+    Components,
+    Concept,
+    DataType,
+    Role,
+    Schema,
+)
+from pysdmx.model.message import ActionType
 
 
 @pytest.fixture()
@@ -64,6 +74,26 @@ def data_path_invalid_action():
     return base_path
 
 
+@pytest.fixture()
+def schema():
+    components = [
+        Component("FREQ", True, Role.DIMENSION, Concept("FREQ")),
+        Component(
+            "TIME_PERIOD",
+            True,
+            Role.DIMENSION,
+            Concept("TIME_PERIOD", dtype=DataType.PERIOD),
+        ),
+        Component(
+            "OBS_VALUE",
+            False,
+            Role.MEASURE,
+            Concept("OBS_VALUE", dtype=DataType.DOUBLE),
+        ),
+    ]
+    return Schema("datastructure", "BIS", "BIS_DER", Components(components))
+
+
 def test_reading_data_v2(data_path):
     with open(data_path, "r") as f:
         infile = f.read()
@@ -144,3 +174,84 @@ def test_reading_invalid_action(data_path_invalid_action):
         infile = f.read()
     with pytest.raises(Invalid, match="proper values on ACTION column"):
         read(infile)
+
+
+def test_reading_chunks_v2(data_path):
+    with open(data_path, "r") as f:
+        expected = read(f.read())["DataFlow=BIS:BIS_DER(1.0)"]
+
+    chunks = list(read_chunks(data_path, chunksize=5000))
+
+    assert len(chunks) == 1
+    assert chunks[0].attributes == {}
+    data = chunks[0].data.drop(columns=list(expected.attributes))
+    pd.testing.assert_frame_equal(data, expected.data)
+
+
+def test_reading_chunks_v2_pieces(data_path):
+    with open(data_path, "rb") as f:
+        chunks = list(read_chunks(f, chunksize=300))
+
+    assert [len(c.data) for c in chunks] == [300, 300, 300, 100]
+    assert all(c.short_urn == "DataFlow=BIS:BIS_DER(1.0)" for c in chunks)
+    columns = list(chunks[0].data.columns)
+    assert all(list(c.data.columns) == columns for c in chunks)
+    assert all(c.attributes == {} for c in chunks)
+
+
+def test_reading_chunks_v2_dataset_attributes(data_path, schema):
+    availability = Component(
+        "AVAILABILITY",
+        False,
+        Role.ATTRIBUTE,
+        Concept("AVAILABILITY"),
+        attachment_level="D",
+    )
+    schema = Schema(
+        "datastructure",
+        "BIS",
+        "BIS_DER",
+        Components([*schema.components, availability]),
+    )
+
+    chunks = list(read_chunks(data_path, chunksize=300, schema=schema))
+
+    assert all(c.attributes == {"AVAILABILITY": "K"} for c in chunks)
+    assert all("AVAILABILITY" not in c.data.columns for c in chunks)
+
+
+def test_reading_chunks_more_structures(data_path_structures):
+    chunks = list(read_chunks(data_path_structures, chunksize=2))
+
+    assert [c.short_urn for c in chunks] == [
+        "DataFlow=ESTAT:DF_A(1.6.0)",
+        "DataStructure=ESTAT:DSD_B(1.7.0)",
+        "ProvisionAgreement=ESTAT:DPA_C(1.8.0)",
+    ]
+
+
+def test_reading_chunks_two_actions(data_path_two_actions):
+    chunks = list(read_chunks(data_path_two_actions))
+
+    assert len(chunks) == 1
+    assert chunks[0].action == ActionType.Replace
+    assert len(chunks[0].data) == 2
+
+
+def test_reading_chunks_invalid_action(data_path_invalid_action):
+    with pytest.raises(Invalid, match="proper values on ACTION column"):
+        list(read_chunks(data_path_invalid_action))
+
+
+def test_reading_with_schema(data_path, schema):
+    dataset_dict = read(data_path, schema=schema)
+    df = dataset_dict["DataFlow=BIS:BIS_DER(1.0)"].data
+    assert str(df["OBS_VALUE"].dtype) == "float64"
+    assert df["OBS_VALUE"].isna().any()
+    assert df["TIME_PERIOD"].iloc[0] == "2002"
+    assert not (df == "nan").any().any()
+
+
+def test_read_chunks_with_schema(data_path, schema):
+    chunks = list(read_chunks(data_path, chunksize=300, schema=schema))
+    assert all(str(c.data["OBS_VALUE"].dtype) == "float64" for c in chunks)
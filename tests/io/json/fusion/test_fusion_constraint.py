@@ -0,0 +1,26 @@
+from pysdmx.io.json.fusion.messages.constraint import (
+    FusionContentConstraint,
+    FusionKeyValue,
+)
+from pysdmx.util._value_selection import ValueSelection
+
+
+def test_include_and_exclude_cubes():
+    constraint = FusionContentConstraint(
+        includeCube={"FREQ": FusionKeyValue(["A", "M"])},
+        excludeCube={"FREQ": FusionKeyValue(["M"])},
+    )
+
+    assert constraint.to_map() == {"FREQ": ValueSelection.of(["A"])}
+
+
+def test_empty_values_not_constrained():
+    constraint = FusionContentConstraint(
+        includeCube={
+            "FREQ": FusionKeyValue([]),
+            "AREA": FusionKeyValue(["BE"]),
+        },
+        excludeCube={"AREA": FusionKeyValue([])},
+    )
+
+    assert constraint.to_map() == {"AREA": ValueSelection.of(["BE"])}
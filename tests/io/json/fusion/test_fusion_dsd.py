@@ -0,0 +1,14 @@
+import pytest
+
+from pysdmx.errors import NotFound
+from pysdmx.io.json.fusion.messages.dsd import _find_concept
+
+URN = (
+    "urn:sdmx:org.sdmx.infomodel.conceptscheme."
+    "Concept=BIS:CS_TEST(1.0).FREQ"
+)
+
+
+def test_find_concept_not_found():
+    with pytest.raises(NotFound, match=r"CS_TEST\(1.0\).FREQ"):
+        _find_concept({}, URN)
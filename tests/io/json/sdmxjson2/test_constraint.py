@@ -0,0 +1,49 @@
+from pysdmx.io.json.sdmxjson2.messages.constraint import (
+    JsonCubeRegion,
+    JsonDataConstraint,
+    JsonKeyValue,
+    JsonValue,
+)
+from pysdmx.util._value_selection import ValueSelection
+
+
+def _kv(id_, values, include=True):
+    return JsonKeyValue(id_, [JsonValue(v) for v in values], include)
+
+
+def test_merge_cube_regions():
+    regions = [
+        JsonCubeRegion([_kv("FREQ", ["A"]), _kv("AREA", ["BE"], False)]),
+        JsonCubeRegion([_kv("FREQ", ["M"]), _kv("AREA", ["FR"], False)]),
+        JsonCubeRegion([_kv("FREQ", ["M"])], include=False),
+    ]
+    constraint = JsonDataConstraint(
+        "CONS", "Constraint", "BIS", cubeRegions=regions
+    )
+
+    cons = constraint.to_map()
+
+    assert cons["FREQ"] == ValueSelection.of(["A"])
+    # Each region excludes a different area, i.e. all areas are allowed
+    assert "AREA" not in cons
+
+
+def test_empty_values_not_constrained():
+    regions = [
+        JsonCubeRegion([_kv("FREQ", []), _kv("AREA", ["BE"])]),
+        JsonCubeRegion([_kv("AREA", [])], include=False),
+    ]
+    constraint = JsonDataConstraint(
+        "CONS", "Constraint", "BIS", cubeRegions=regions
+    )
+
+    cons = constraint.to_map()
+
+    assert "FREQ" not in cons
+    assert cons["AREA"] == ValueSelection.of(["BE"])
+
+
+def test_no_cube_regions():
+    constraint = JsonDataConstraint("CONS", "Constraint", "BIS")
+
+    assert constraint.to_map() == {}
@@ -1,10 +1,16 @@
 from io import BytesIO
+import mmap
 from pathlib import Path
 
+import msgspec
 import pytest
 
 from pysdmx.errors import Invalid, NotImplemented
-from pysdmx.io.input_processor import process_string_to_read
+from pysdmx.io.csv.sdmx10.reader import read as read_csv_v1
+from pysdmx.io.input_processor import (
+    process_file_to_read,
+    process_string_to_read,
+)
 from pysdmx.io.xml.sdmx21.reader import read_xml
 
 
@@ -104,3 +110,73 @@ def test_process_string_to_read_invalid_allowed_error(invalid_message_xml):
     message = "Cannot parse input as SDMX."
     with pytest.raises(NotImplemented, match=message):
         read_xml(invalid_message_xml, validate=False)
+
+
+def test_process_string_to_read_csv():
+    infile, filetype = process_string_to_read("DATAFLOW,FREQ\nBIS:X(1.0),A\n")
+    assert filetype == "csv"
+
+
+def test_process_file_to_read_path():
+    path = Path(__file__).parent / "xml" / "sdmx21" / "reader" / "samples"
+    infile, filetype = process_file_to_read(path / "codelists.xml")
+    assert filetype == "xml"
+    assert isinstance(infile, mmap.mmap)
+    result = read_xml(infile, validate=True)
+    assert len(result["Codelists"]) == 5
+
+
+def test_process_file_to_read_bytes(valid_xml, valid_xml_bytes):
+    infile, filetype = process_file_to_read(valid_xml_bytes)
+    assert filetype == "xml"
+    assert infile is valid_xml_bytes
+    assert infile.tell() == 0
+
+
+def test_process_file_to_read_str(valid_xml):
+    infile, filetype = process_file_to_read(valid_xml)
+    assert infile == valid_xml
+    assert filetype == "xml"
+
+
+def test_process_file_to_read_bom(tmp_path):
+    path = tmp_path / "bom.xml"
+    path.write_bytes(b'\xef\xbb\xbf<?xml version="1.0"?><a/>')
+    _, filetype = process_file_to_read(path)
+    assert filetype == "xml"
+
+
+def test_process_file_to_read_json_bom(tmp_path):
+    path = tmp_path / "bom.json"
+    path.write_bytes(b'\xef\xbb\xbf{"key": "value"}')
+    infile, filetype = process_file_to_read(path)
+    assert filetype == "json"
+    assert msgspec.json.decode(infile) == {"key": "value"}
+
+
+def test_process_file_to_read_csv(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_bytes(
+        b"DATAFLOW,FREQ,OBS_VALUE\nBIS:X(1.0),A,1\nBIS:X(1.0),M,2\n"
+    )
+    infile, filetype = process_file_to_read(path)
+    assert filetype == "csv"
+    result = read_csv_v1(infile)
+    assert len(result["DataFlow=BIS:X(1.0)"].data) == 2
+
+
+def test_process_file_to_read_empty(tmp_path):
+    path = tmp_path / "empty.xml"
+    path.write_bytes(b"")
+    with pytest.raises(Invalid, match="Cannot parse empty file"):
+        process_file_to_read(path)
+
+
+def test_process_file_to_read_invalid():
+    with pytest.raises(Invalid, match="Cannot parse input as SDMX."):
+        process_file_to_read(BytesIO(b"Not SDMX"))
+
+
+def test_process_file_to_read_invalid_type():
+    with pytest.raises(Invalid, match="Cannot parse input of type"):
+        process_file_to_read(123)
@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+
+from pysdmx.io.xml.sdmx21.reader.data_read import ColumnarBuilder
+
+
+def test_empty():
+    builder = ColumnarBuilder()
+
+    assert len(builder) == 0
+    assert builder.to_frame().empty
+
+
+def test_rows_only():
+    builder = ColumnarBuilder()
+    builder.add_row({"A": "1", "B": "x"})
+    builder.add_row({"A": "2", "B": "y"})
+
+    df = builder.to_frame()
+
+    assert len(builder) == 2
+    expected = pd.DataFrame({"A": ["1", "2"], "B": ["x", "y"]})
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def test_keys_are_broadcast():
+    builder = ColumnarBuilder()
+    builder.set_keys({"FREQ": "A", "REF_AREA": "CH"})
+    builder.add_row({"TIME_PERIOD": "2020", "OBS_VALUE": "1"})
+    builder.add_row({"TIME_PERIOD": "2021", "OBS_VALUE": "2"})
+    builder.set_keys({"FREQ": "M", "REF_AREA": "DE"})
+    builder.add_row({"TIME_PERIOD": "2020-01", "OBS_VALUE": "3"})
+
+    df = builder.to_frame()
+
+    assert list(df.columns) == ["FREQ", "REF_AREA", "TIME_PERIOD", "OBS_VALUE"]
+    assert list(df["FREQ"]) == ["A", "A", "M"]
+    assert list(df["REF_AREA"]) == ["CH", "CH", "DE"]
+    assert list(df["OBS_VALUE"]) == ["1", "2", "3"]
+
+
+def test_series_without_observations():
+    builder = ColumnarBuilder()
+    builder.set_keys({"FREQ": "A"})
+    builder.add_row({})
+    builder.set_keys({"FREQ": "M"})
+    builder.add_row({"OBS_VALUE": "1"})
+
+    df = builder.to_frame()
+
+    assert list(df["FREQ"]) == ["A", "M"]
+    assert np.isnan(df["OBS_VALUE"][0])
+    assert df["OBS_VALUE"][1] == "1"
+
+
+def test_missing_values_same_as_records():
+    rows = [
+        {"A": "1"},
+        {"A": "2", "B": "x"},
+        {"B": "y"},
+        {"A": "4", "C": "z"},
+    ]
+    builder = ColumnarBuilder()
+    for r in rows:
+        builder.add_row(r)
+
+    pd.testing.assert_frame_equal(builder.to_frame(), pd.DataFrame(rows))
+
+
+def test_row_values_override_keys():
+    builder = ColumnarBuilder()
+    builder.set_keys({"A": "key"})
+    builder.add_row({"A": "row"})
+    builder.add_row({})
+
+    df = builder.to_frame()
+
+    assert list(df["A"]) == ["row", "key"]
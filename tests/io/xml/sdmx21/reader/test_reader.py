@@ -1,13 +1,24 @@
 from pathlib import Path
 
+import pandas as pd
 import pytest
 
 import pysdmx
-from pysdmx.errors import Invalid, NotImplemented
+from pysdmx.errors import Invalid, NotFound, NotImplemented
 from pysdmx.io.input_processor import process_string_to_read
 from pysdmx.io.xml.enums import MessageType
-from pysdmx.io.xml.sdmx21.reader import read_xml
-from pysdmx.model import Contact
+from pysdmx.io.xml.sdmx21.reader import read_xml, read_xml_chunks
+from pysdmx.model import (
+    Code,
+    Codelist,
+    Component,
+    Components,
+    Concept,
+    Contact,
+    DataType,
+    Role,
+    Schema,
+)
 from pysdmx.model.message import SubmissionResult
 
 
@@ -39,6 +50,26 @@ def samples_folder():
     return Path(__file__).parent / "samples"
 
 
+@pytest.fixture()
+def schema():
+    components = [
+        Component("FREQ", True, Role.DIMENSION, Concept("FREQ")),
+        Component(
+            "TIME_PERIOD",
+            True,
+            Role.DIMENSION,
+            Concept("TIME_PERIOD", dtype=DataType.PERIOD),
+        ),
+        Component(
+            "OBS_VALUE",
+            False,
+            Role.MEASURE,
+            Concept("OBS_VALUE", dtype=DataType.DOUBLE),
+        ),
+    ]
+    return Schema("datastructure", "BIS", "BIS_DER", Components(components))
+
+
 @pytest.fixture()
 def error_304_path():
     return Path(__file__).parent / "samples" / "error_304.xml"
@@ -285,3 +316,125 @@ def test_chunks(samples_folder, filename):
     expected_num_columns = 20
     assert num_rows == expected_num_rows
     assert num_columns == expected_num_columns
+
+
+@pytest.mark.parametrize(
+    "filename",
+    [
+        "gen_all.xml",
+        "gen_ser.xml",
+        "str_all.xml",
+        "str_ser.xml",
+        "str_ser_group.xml",
+        "gen_ser_no_obs.xml",
+        "str_ser_no_obs.xml",
+        "dataflow.xml",
+    ],
+)
+def test_read_chunks(samples_folder, filename):
+    data_path = samples_folder / filename
+    input_str, _ = process_string_to_read(data_path)
+    expected = list(read_xml(input_str, validate=False).values())[0]
+
+    chunks = list(read_xml_chunks(data_path, chunksize=300))
+
+    assert all(len(c.data) <= 300 for c in chunks)
+    assert all(c.short_urn == expected.short_urn for c in chunks)
+    df = pd.concat([c.data for c in chunks], ignore_index=True)
+    pd.testing.assert_frame_equal(
+        df.sort_index(axis=1), expected.data.sort_index(axis=1)
+    )
+
+
+def test_read_chunks_attributes(samples_folder):
+    data_path = samples_folder / "gen_ser.xml"
+    with open(data_path, "rb") as f:
+        chunks = list(read_xml_chunks(f, chunksize=400))
+    assert [len(c.data) for c in chunks] == [400, 400, 200]
+    for c in chunks:
+        assert c.attributes == {
+            "DECIMALS": "3",
+            "UNIT_MULT": "6",
+            "UNIT_MEASURE": "USD",
+        }
+
+
+def test_read_chunks_from_str(samples_folder):
+    input_str, _ = process_string_to_read(samples_folder / "str_ser.xml")
+    chunks = list(read_xml_chunks(input_str))
+    assert len(chunks) == 1
+    assert chunks[0].data.shape == (1000, 20)
+
+
+def test_read_chunks_not_data(codelist_path):
+    with pytest.raises(NotImplemented, match="Only data messages"):
+        list(read_xml_chunks(codelist_path))
+
+
+def test_read_chunks_unknown_structure(samples_folder):
+    data_path = samples_folder / "str_dif_ref_and_ID.xml"
+    with pytest.raises(NotFound, match="structure reference"):
+        list(read_xml_chunks(data_path))
+
+
+def test_read_chunks_invalid_chunksize(samples_folder):
+    with pytest.raises(Invalid, match="chunksize"):
+        list(read_xml_chunks(samples_folder / "str_ser.xml", chunksize=0))
+
+
+@pytest.mark.parametrize(
+    "filename",
+    [
+        "gen_all.xml",
+        "gen_ser.xml",
+        "str_all.xml",
+        "str_ser.xml",
+    ],
+)
+def test_read_with_schema(samples_folder, filename, schema):
+    input_str, _ = process_string_to_read(samples_folder / filename)
+    result = read_xml(input_str, validate=False, schema=schema)
+    df = result["DataStructure=BIS:BIS_DER(1.0)"].data
+    assert str(df["OBS_VALUE"].dtype) == "float64"
+    assert pd.api.types.is_object_dtype(df["TIME_PERIOD"])
+    assert not (df["OBS_VALUE"] == "").any()
+    assert "OBSVALUE" not in df.columns
+    assert "ObsDimension" not in df.columns
+
+
+@pytest.mark.parametrize(
+    "filename",
+    [
+        "gen_all.xml",
+        "gen_ser.xml",
+        "str_all.xml",
+    ],
+)
+def test_read_chunks_with_schema(samples_folder, filename, schema):
+    data_path = samples_folder / filename
+    chunks = list(read_xml_chunks(data_path, chunksize=300, schema=schema))
+    assert all(str(c.data["OBS_VALUE"].dtype) == "float64" for c in chunks)
+    assert all("TIME_PERIOD" in c.data.columns for c in chunks)
+
+
+def test_read_with_schema_categorical(samples_folder, schema):
+    freq = Codelist(
+        "CL_FREQ", name="Frequency", agency="BIS", items=[Code("M"), Code("A")]
+    )
+    components = list(schema.components)
+    components[0] = Component(
+        "FREQ", True, Role.DIMENSION, Concept("FREQ", codes=freq)
+    )
+    schema = Schema("datastructure", "BIS", "BIS_DER", Components(components))
+    input_str, _ = process_string_to_read(samples_folder / "str_ser.xml")
+
+    result = read_xml(input_str, validate=False, schema=schema)
+    df = result["DataStructure=BIS:BIS_DER(1.0)"].data
+    assert df["FREQ"].cat.categories.tolist()[:2] == ["M", "A"]
+    assert (df["FREQ"] == "A").all()
+
+    result = read_xml(
+        input_str, validate=False, schema=schema, categorical=False
+    )
+    df = result["DataStructure=BIS:BIS_DER(1.0)"].data
+    assert pd.api.types.is_object_dtype(df["FREQ"])
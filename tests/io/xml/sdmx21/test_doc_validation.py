@@ -0,0 +1,35 @@
+from pathlib import Path
+
+import pytest
+
+from pysdmx.errors import Invalid
+from pysdmx.io.xml.sdmx21.doc_validation import get_schema, validate_doc
+
+SAMPLES = Path(__file__).parent / "reader" / "samples"
+
+
+def test_schema_is_compiled_once():
+    assert get_schema() is get_schema()
+
+
+def test_validate_returns_document():
+    with open(SAMPLES / "codelists.xml", "r", encoding="utf-8") as f:
+        infile = f.read()
+
+    doc = validate_doc(infile)
+
+    assert doc.getroot().tag.endswith("Structure")
+
+
+def test_validate_file_like_position_is_restored():
+    with open(SAMPLES / "str_ser.xml", "rb") as f:
+        validate_doc(f)
+        assert f.tell() == 0
+
+
+def test_validate_invalid():
+    infile = (Path(__file__).parents[2] / "samples" / "invalid.xml").read_text(
+        encoding="utf-8"
+    )
+    with pytest.raises(Invalid, match="This element is not expected."):
+        validate_doc(infile)
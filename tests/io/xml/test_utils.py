@@ -0,0 +1,54 @@
+from pathlib import Path
+
+from lxml import etree
+import pytest
+import xmltodict
+
+from pysdmx.io.xml.sdmx21.__parsing_config import NAMESPACES_21, XML_OPTIONS
+from pysdmx.io.xml.utils import etree_to_dict
+
+SAMPLES = Path(__file__).parent / "sdmx21" / "reader" / "samples"
+
+
+@pytest.mark.parametrize(
+    "filename",
+    [
+        "codelists.xml",
+        "error_304.xml",
+        "gen_all.xml",
+        "gen_ser.xml",
+        "item_scheme.xml",
+        "str_all.xml",
+        "str_ser_group.xml",
+        "submission_append.xml",
+    ],
+)
+def test_same_as_xmltodict(filename):
+    path = SAMPLES / filename
+    with open(path, "rb") as f:
+        expected = xmltodict.parse(f.read(), **XML_OPTIONS)
+
+    doc = etree.parse(str(path), parser=etree.ETCompatXMLParser())
+
+    assert etree_to_dict(doc.getroot(), NAMESPACES_21) == expected
+
+
+def test_text_attributes_and_lists():
+    xml = (
+        b'<a xmlns="urn:x" xmlns:o="urn:o" k="v">'
+        b"<b>1</b><b>2</b><c lang='en'> txt </c><o:d/><e>  </e></a>"
+    )
+    root = etree.fromstring(xml)
+
+    result = etree_to_dict(root, {"urn:x": None})
+
+    assert result == {
+        "a": {
+            "k": "v",
+            "xmlns": {"": "urn:x", "o": "urn:o"},
+            "b": ["1", "2"],
+            "c": {"lang": "en", "#text": "txt"},
+            "urn:o:d": None,
+            "e": None,
+        }
+    }
@@ -141,3 +141,15 @@ def test_dataflows(id, name, agency):
     assert df2 in flows
     assert df3 in flows
     assert df4 in flows
+
+
+def test_category_ids(id, name, agency):
+    child = Category(id="child21", name="Child 2.1")
+    cats = [
+        Category(id="child1", name="Child 1"),
+        Category(id="child2", name="Child 2", categories=[child]),
+    ]
+    cs = CategoryScheme(id=id, name=name, agency=agency, items=cats)
+
+    assert cs.ids == frozenset({"child1", "child2", "child2.child21"})
+    assert "child21" not in cs
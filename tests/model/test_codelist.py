@@ -1,5 +1,6 @@
 from typing import Iterable, Sized
 
+import msgspec
 import pytest
 
 from pysdmx.model.code import Code, Codelist
@@ -109,3 +110,24 @@ def test_get_code(id, name, agency):
     assert id1 in cl
     assert resp2 is None
     assert id3 not in cl
+
+
+def test_code_ids(id, name, agency):
+    codes = [Code(id="child1"), Code(id="child2"), Code(id="child1")]
+    cl = Codelist(id=id, name=name, agency=agency, items=codes)
+
+    assert cl.ids == frozenset({"child1", "child2"})
+    assert cl["child1"] is codes[0]
+
+
+def test_index_not_serialized(id, name, agency):
+    codes = [Code(id="child1"), Code(id="child2")]
+    cl = Codelist(id=id, name=name, agency=agency, items=codes)
+    before = msgspec.json.encode(cl)
+
+    assert "child1" in cl
+
+    assert msgspec.json.encode(cl) == before
+    assert msgspec.json.decode(before, type=Codelist).ids == cl.ids
+    with pytest.raises(TypeError):
+        cl._index["child3"] = Code(id="child3")
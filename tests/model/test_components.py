@@ -1,3 +1,5 @@
+import copy
+
 import pytest
 
 from pysdmx.errors import Invalid
@@ -213,3 +215,99 @@ def test_get_attributes(components):
     assert len(attrs) == 1
     for attr in attrs:
         assert attr.id in expected
+
+
+def test_roles_are_lists(components):
+    dims = components.dimensions
+    dims.append(components["VALUE"])
+
+    assert isinstance(components.measures, list)
+    assert isinstance(components.attributes, list)
+    assert len(components.dimensions) == 3
+
+
+def test_roles_refreshed_on_append(components):
+    assert len(components.attributes) == 1
+    nf = Component("ZZZ", False, Role.ATTRIBUTE, DataType.STRING)
+
+    components.append(nf)
+
+    assert [a.id for a in components.attributes] == ["CONF", "ZZZ"]
+    assert components["ZZZ"] == nf
+
+
+def test_index_refreshed_on_insert(components):
+    assert components["VALUE"] == components[3]
+    nf = Component("ZZZ", False, Role.ATTRIBUTE, DataType.STRING)
+
+    components.insert(0, nf)
+
+    assert components["ZZZ"] == nf
+    assert components["VALUE"] == components[4]
+
+
+def test_index_refreshed_on_removal(components):
+    assert components["FREQ"] is not None
+
+    del components[0]
+    components.pop()
+    components.remove(components["VALUE"])
+
+    assert components["FREQ"] is None
+    assert components["CONF"] is None
+    assert components["VALUE"] is None
+    assert components["PERIOD"] == components[1]
+    assert [d.id for d in components.dimensions] == ["INDICATOR", "PERIOD"]
+    assert len(components.measures) == 0
+    assert len(components.attributes) == 0
+
+
+def test_index_refreshed_on_setitem(components):
+    assert components["FREQ"] is not None
+    nf = Component("ZZZ", False, Role.ATTRIBUTE, DataType.STRING)
+
+    components[0] = nf
+
+    assert components["FREQ"] is None
+    assert components["ZZZ"] == nf
+    assert len(components.dimensions) == 2
+    assert len(components.attributes) == 2
+
+
+def test_index_refreshed_on_reorder(components):
+    assert components["CONF"] == components[4]
+
+    components.reverse()
+    assert components["CONF"] == components[0]
+
+    components.sort(key=lambda c: c.id)
+    assert components["CONF"] == components[0]
+    assert components["VALUE"] == components[4]
+
+    components.clear()
+    assert components["CONF"] is None
+    assert len(components.dimensions) == 0
+
+
+def test_iadd_is_checked(components):
+    nf = Component("ZZZ", False, Role.ATTRIBUTE, DataType.STRING)
+
+    components += [nf]
+
+    assert components["ZZZ"] == nf
+    with pytest.raises(Invalid):
+        components += [nf]
+
+
+def test_copy_does_not_share_index(components):
+    assert components["FREQ"] is not None
+    nf = Component("ZZZ", False, Role.ATTRIBUTE, DataType.STRING)
+
+    other = copy.copy(components)
+    other.append(nf)
+
+    assert other["ZZZ"] == nf
+    assert components["ZZZ"] is None
+    components.append(nf)
+    assert components["ZZZ"] == nf
+    assert len(components.attributes) == 2
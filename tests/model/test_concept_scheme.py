@@ -91,3 +91,10 @@ def test_get_concept(id, name, agency):
     assert "child1" in cs
     assert resp2 is None
     assert "child3" not in cs
+
+
+def test_concept_ids(id, name, agency):
+    concepts = [Concept(id="child1"), Concept(id="child2")]
+    cs = ConceptScheme(id=id, name=name, agency=agency, items=concepts)
+
+    assert cs.ids == frozenset({"child1", "child2"})
@@ -95,3 +95,12 @@ def test_tostr_name(id, name):
     s = str(c)
 
     assert s == f"{id} ({name})"
+
+
+def test_hashable(id, name):
+    c1 = HierarchicalCode(id, name, codes=[HierarchicalCode("child")])
+    c2 = HierarchicalCode(id, name, codes=[HierarchicalCode("child")])
+    c3 = HierarchicalCode(id, name)
+
+    assert hash(c1) == hash(c2)
+    assert len({c1, c2, c3}) == 2
@@ -196,3 +196,50 @@ def test_all_codes(id, name, agency):
 
     m = h.all_codes()
     assert len(m) == 7
+
+
+@pytest.fixture()
+def groups(id, name, agency):
+    fr = HierarchicalCode("FR", "France")
+    de = HierarchicalCode("DE", "Germany")
+    us = HierarchicalCode("US", "United States")
+    ea = HierarchicalCode("EA", "Euro area", codes=[fr, de])
+    eu = HierarchicalCode("EU", "European Union", codes=[ea])
+    g7 = HierarchicalCode("G7", "G7", codes=[fr, de, us])
+    world = HierarchicalCode("W", "World", codes=[eu, g7])
+    return Hierarchy(id, name, agency, codes=[world])
+
+
+def test_paths(groups):
+    assert groups.paths("FR") == ("W.EU.EA.FR", "W.G7.FR")
+    assert groups.paths("W") == ("W",)
+    assert groups.paths("XX") == ()
+    assert groups["W.G7.FR"].id == "FR"
+    assert "W.EU.EA.DE" in groups
+
+
+def test_parents_and_children(groups):
+    assert groups.parents("FR") == {"EA", "G7"}
+    assert groups.parents("W") == frozenset()
+    assert groups.children("W") == {"EU", "G7"}
+    assert groups.children("FR") == frozenset()
+
+
+def test_ancestors_and_descendants(groups):
+    assert groups.ancestors("FR") == {"EA", "EU", "G7", "W"}
+    assert groups.ancestors("US") == {"G7", "W"}
+    assert groups.ancestors("XX") == frozenset()
+    assert groups.descendants("EU") == {"EA", "FR", "DE"}
+    assert groups.descendants("W") == {"EU", "EA", "G7", "FR", "DE", "US"}
+
+
+def test_first_sibling_reached_by_path(id, name, agency):
+    first = HierarchicalCode("A", "First")
+    second = HierarchicalCode("A", "Second", codes=[HierarchicalCode("B")])
+    h = Hierarchy(id, name, agency, codes=[first, second])
+
+    assert h["A"] == first
+    assert "A.B" not in h
+    assert h.ancestors("B") == {"A"}
+    assert len(h) == 3
+    assert len(h.by_id("A")) == 2
@@ -1,3 +1,5 @@
+from datetime import datetime, timedelta, timezone
+import re
 from typing import Iterable, Sized
 
 import pytest
@@ -101,3 +103,36 @@ def test_sized(id, name, agency, source, target, mappings):
 
     assert isinstance(sm, Sized)
     assert len(sm) == len(mappings)
+
+
+def test_match(id, name, agency, source, target):
+    maps = [
+        MultiValueMap(["DE", "LC"], ["EUR"]),
+        MultiValueMap([re.compile("D(.)"), re.compile("L(.)")], ["\\1\\2"]),
+        MultiValueMap(["CH", re.compile(".*")], ["CHF", "Swiss franc"]),
+        MultiValueMap(["DE", "LC"], ["DEM"]),
+    ]
+    rm = MultiRepresentationMap(id, name, agency, source, target, maps)
+
+    assert rm.match(["DE", "LC"]) == ("EUR",)
+    assert rm.match(["DK", "LX"]) == ("KX",)
+    assert rm.match(("CH", "anything")) == ("CHF", "Swiss franc")
+    assert rm.match(["FR", "LC"]) is None
+    assert rm.match(["DE"]) is None
+
+
+def test_match_valid_at(id, name, agency, source, target):
+    t1 = datetime(1998, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
+    t2 = datetime(1999, 1, 1, tzinfo=timezone.utc)
+    maps = [
+        MultiValueMap(["DE", "LC"], ["DEM"], valid_to=t1),
+        MultiValueMap(["DE", "LC"], ["EUR"], valid_from=t2),
+    ]
+    rm = MultiRepresentationMap(id, name, agency, source, target, maps)
+
+    assert rm.match(["DE", "LC"], datetime(1990, 1, 1)) == ("DEM",)
+    assert rm.match(["DE", "LC"], datetime(2000, 1, 1)) == ("EUR",)
+    assert rm.intervals(["DE", "LC"]) == (
+        (None, t1 + timedelta(microseconds=1), ("DEM",)),
+        (t2, None, ("EUR",)),
+    )
@@ -1,3 +1,5 @@
+from datetime import datetime, timedelta, timezone
+import re
 from typing import Iterable, Sized
 
 import pytest
@@ -98,3 +100,89 @@ def test_sized(id, name, agency, source, target, mappings):
 
     assert isinstance(sm, Sized)
     assert len(sm) == len(mappings)
+
+
+def test_match(id, name, agency, source, target):
+    maps = [
+        ValueMap(re.compile("[A-Z]{2}"), "OTHER"),
+        ValueMap("BE", "BEL"),
+        ValueMap(re.compile("X(\\d)"), "Y\\1"),
+        ValueMap(re.compile("X\\d+"), "Z"),
+        ValueMap("BE", "BELGIUM"),
+    ]
+    rm = RepresentationMap(id, name, agency, source, target, maps)
+
+    assert rm.match("BE") == "BEL"
+    assert rm.match("CH") == "OTHER"
+    assert rm.match("X1") == "Y1"
+    assert rm.match("X12") == "Z"
+    assert rm.match("abc") is None
+
+
+def test_match_unsupported_alternation(id, name, agency, source, target):
+    maps = [
+        ValueMap(re.compile("(?i)be"), "BEL"),
+        ValueMap(re.compile("(.)\\1"), "DOUBLE"),
+    ]
+    rm = RepresentationMap(id, name, agency, source, target, maps)
+
+    assert rm.match("Be") == "BEL"
+    assert rm.match("AA") == "DOUBLE"
+    assert rm.match("ab") is None
+
+
+def test_match_memoised(id, name, agency, source, target):
+    rm = RepresentationMap(
+        id, name, agency, source, target, [ValueMap(re.compile("A+"), "A")]
+    )
+
+    for _ in range(3):
+        rm.match("AAA")
+
+    assert rm._matcher.match.cache_info().hits == 2
+
+
+def test_match_valid_at(id, name, agency, source, target):
+    t1 = datetime(1998, 12, 31, 23, 59, 59)
+    t2 = datetime(1999, 1, 1, tzinfo=timezone.utc)
+    maps = [
+        ValueMap("DE", "DEM", valid_to=t1),
+        ValueMap("DE", "EUR", valid_from=t2),
+        ValueMap(re.compile("D."), "OTHER", valid_from=datetime(2100, 1, 1)),
+    ]
+    rm = RepresentationMap(id, name, agency, source, target, maps)
+
+    assert rm.match("DE") == "DEM"
+    assert rm.match("DE", datetime(1998, 1, 1)) == "DEM"
+    assert rm.match("DE", datetime(1998, 12, 31, 23, 59, 59, 1)) is None
+    assert rm.match("DE", datetime(2000, 1, 1, tzinfo=timezone.utc)) == "EUR"
+    assert rm.match("DK", datetime(2000, 1, 1)) is None
+    assert rm.match("DK", datetime(2100, 1, 1)) == "OTHER"
+
+
+def test_match_open_ended(id, name, agency, source, target):
+    maps = [ValueMap("DE", "EUR", valid_to=datetime.max)]
+    rm = RepresentationMap(id, name, agency, source, target, maps)
+
+    assert rm.match("DE") == "EUR"
+    assert rm.match("DE", datetime(2100, 1, 1)) == "EUR"
+    assert rm.intervals("DE") == ((None, None, "EUR"),)
+
+
+def test_intervals(id, name, agency, source, target):
+    t1 = datetime(1999, 1, 1, tzinfo=timezone.utc)
+    t2 = datetime(2001, 1, 1, tzinfo=timezone.utc)
+    maps = [
+        ValueMap("DE", "EUR", valid_from=t1, valid_to=t2),
+        ValueMap("DE", "OLD"),
+        ValueMap("CH", "CHF"),
+    ]
+    rm = RepresentationMap(id, name, agency, source, target, maps)
+
+    assert rm.intervals("DE") == (
+        (None, t1, "OLD"),
+        (t1, t2 + timedelta(microseconds=1), "EUR"),
+        (t2 + timedelta(microseconds=1), None, "OLD"),
+    )
+    assert rm.intervals("CH") == ((None, None, "CHF"),)
+    assert rm.intervals("FR") == ()
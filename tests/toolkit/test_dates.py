@@ -0,0 +1,87 @@
+import pandas as pd
+import pytest
+
+from pysdmx.errors import Invalid, NotImplemented
+from pysdmx.model import DatePatternMap
+from pysdmx.toolkit.dates import DateConverter, format_periods
+
+
+@pytest.fixture()
+def dates():
+    return pd.Series(pd.to_datetime(["2023-09-15", "2024-01-01", None]))
+
+
+@pytest.mark.parametrize(
+    ("frequency", "expected"),
+    [
+        ("A", ["2023", "2024"]),
+        ("S", ["2023-S2", "2024-S1"]),
+        ("Q", ["2023-Q3", "2024-Q1"]),
+        ("M", ["2023-09", "2024-01"]),
+        ("W", ["2023-W37", "2024-W01"]),
+        ("D", ["2023-09-15", "2024-01-01"]),
+    ],
+)
+def test_format_periods(dates, frequency, expected):
+    out = format_periods(dates, frequency)
+
+    assert out.tolist()[:2] == expected
+    assert pd.isna(out[2])
+
+
+def test_format_periods_per_row(dates):
+    out = format_periods(dates, pd.Series(["A", None, "M"]))
+
+    assert out[0] == "2023"
+    assert pd.isna(out[1])
+    assert pd.isna(out[2])
+
+
+def test_format_periods_unsupported_frequency(dates):
+    with pytest.raises(Invalid, match="frequency H"):
+        format_periods(dates, "H")
+
+
+@pytest.mark.parametrize(
+    ("pattern", "locale", "values"),
+    [
+        ("MMM yy", "en", ["Sep 23", "sep 23", "Sept 23"]),
+        ("MMMM yyyy", "en_US", ["September 2023", "SEPTEMBER 2023"]),
+        ("MMM yy", "fr", ["sept. 23", "Sept 23", "sep 23"]),
+        ("MMMM yyyy", "fr-CH", ["septembre 2023"]),
+        ("dd MMMM yyyy", "de", ["01 September 2023"]),
+        ("MMM yyyy", "es", ["sept 2023", "sep 2023"]),
+        ("MMMM yyyy", "pt", ["setembro 2023"]),
+        ("yyyy-MM", "ja", ["2023-09"]),
+        ("yyyy-ww", "en", ["2023-36"]),
+    ],
+)
+def test_convert(pattern, locale, values):
+    converter = DateConverter(pattern, locale)
+
+    out = converter.convert(pd.Series(values), "M")
+
+    assert out.tolist() == ["2023-09"] * len(values)
+
+
+def test_convert_distinct_values():
+    converter = DateConverter.from_map(
+        DatePatternMap("D", "T", "MMM yy", "Q", locale="fr")
+    )
+    values = pd.Series(["mars 24", None, "janv. 24", "bad", "mars 24"])
+
+    out = converter.convert(values, "Q")
+
+    assert out.tolist()[::2] == ["2024-Q1", "2024-Q1", "2024-Q1"]
+    assert out.isna().tolist() == [False, True, False, True, False]
+
+
+def test_unsupported_locale():
+    with pytest.raises(Invalid, match="xx"):
+        DateConverter("MMM yy", "xx")
+
+
+def test_day_names_only_in_english():
+    assert DateConverter("EEEE dd MMMM yyyy").format == "%A %d %m %Y"
+    with pytest.raises(NotImplemented):
+        DateConverter("EEEE dd MMMM yyyy", "fr")
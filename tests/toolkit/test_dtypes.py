@@ -0,0 +1,153 @@
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from pysdmx.model import (
+    Code,
+    Codelist,
+    Component,
+    Components,
+    Concept,
+    DataType,
+    HierarchicalCode,
+    Hierarchy,
+    Role,
+    Schema,
+)
+from pysdmx.toolkit.dtypes import (
+    cast,
+    cast_columns,
+    to_categorical,
+    to_pandas_dtype,
+)
+
+
+@pytest.mark.parametrize(
+    ("dtype", "expected"),
+    [
+        (DataType.INTEGER, "Int64"),
+        (DataType.LONG, "Int64"),
+        (DataType.DOUBLE, "float64"),
+        (DataType.DECIMAL, "float64"),
+        (DataType.BOOLEAN, "boolean"),
+        (DataType.STRING, "object"),
+        (DataType.PERIOD, "object"),
+    ],
+)
+def test_to_pandas_dtype(dtype, expected):
+    assert to_pandas_dtype(dtype) == expected
+
+
+def test_cast_integers():
+    out = cast(pd.Series(["1", "2.0", "2.5", "abc", None]), DataType.INTEGER)
+
+    assert str(out.dtype) == "Int64"
+    assert out.tolist()[:2] == [1, 2]
+    assert out.isna().tolist() == [False, False, True, True, True]
+
+
+def test_cast_floats():
+    out = cast(pd.Series(["1.5", "abc", None]), DataType.DOUBLE)
+
+    assert str(out.dtype) == "float64"
+    assert out[0] == 1.5
+    assert out.isna().tolist() == [False, True, True]
+
+
+def test_cast_booleans():
+    out = cast(pd.Series(["true", "False", "1", "x", None]), DataType.BOOLEAN)
+
+    assert str(out.dtype) == "boolean"
+    assert out.tolist()[:3] == [True, False, True]
+    assert out.isna().tolist() == [False, False, False, True, True]
+
+
+def test_cast_strings_keep_missing_values():
+    out = cast(pd.Series([1.0, None]), DataType.STRING)
+
+    assert out[0] == "1.0"
+    assert pd.isna(out[1])
+
+
+def test_cast_same_type_unchanged():
+    series = pd.Series(["A", "B"])
+
+    assert cast(series, DataType.STRING) is series
+
+
+def test_cast_columns():
+    components = [
+        Component("FREQ", True, Role.DIMENSION, Concept("FREQ")),
+        Component(
+            "OBS_VALUE",
+            False,
+            Role.MEASURE,
+            Concept("OBS_VALUE", dtype=DataType.DOUBLE),
+        ),
+    ]
+    schema = Schema("datastructure", "BIS", "TEST", Components(components))
+    data = pd.DataFrame(
+        {"FREQ": ["A", "A"], "OBS_VALUE": ["1.5", None], "OTHER": ["1", "2"]}
+    )
+
+    out = cast_columns(data, schema)
+
+    assert str(out["OBS_VALUE"].dtype) == "float64"
+    assert out["FREQ"].tolist() == ["A", "A"]
+    assert out["OTHER"].tolist() == ["1", "2"]
+    assert data["OBS_VALUE"].tolist() == ["1.5", None]
+
+
+def test_to_categorical():
+    cl = Codelist(
+        "CL_FREQ",
+        name="Frequency",
+        agency="SDMX",
+        items=[Code("M"), Code("A")],
+    )
+    freq = Component("FREQ", True, Role.DIMENSION, Concept("FREQ", codes=cl))
+
+    out = to_categorical(pd.Series(["A", "X", None, "A"]), freq)
+
+    assert out.cat.categories.tolist() == ["M", "A", "X"]
+    assert out.cat.codes.tolist() == [1, 2, -1, 1]
+
+
+def test_to_categorical_hierarchy():
+    # The relationships of DE with its parents differ
+    de_eu = HierarchicalCode("DE")
+    de_ea = HierarchicalCode("DE", rel_valid_from=datetime(1999, 1, 1))
+    h = Hierarchy(
+        "H_AREA",
+        name="Areas",
+        agency="BIS",
+        codes=[
+            HierarchicalCode("EU", codes=[de_eu, HierarchicalCode("SE")]),
+            HierarchicalCode("EA", codes=[de_ea]),
+        ],
+    )
+    area = Component("AREA", True, Role.DIMENSION, Concept("AREA", codes=h))
+
+    out = to_categorical(pd.Series(["DE", "EA"]), area)
+
+    assert out.cat.categories.tolist() == ["EU", "DE", "SE", "EA"]
+    assert out.cat.codes.tolist() == [1, 3]
+
+
+def test_cast_columns_categorical():
+    cl = Codelist(
+        "CL_FREQ", name="Frequency", agency="SDMX", items=[Code("A")]
+    )
+    components = [
+        Component("FREQ", True, Role.DIMENSION, Concept("FREQ", codes=cl)),
+        Component("TITLE", False, Role.ATTRIBUTE, Concept("TITLE")),
+    ]
+    schema = Schema("datastructure", "BIS", "TEST", Components(components))
+    data = pd.DataFrame({"FREQ": ["A", "A"], "TITLE": ["A", "B"]})
+
+    out = cast_columns(data, schema, categorical=True)
+
+    assert isinstance(out["FREQ"].dtype, pd.CategoricalDtype)
+    assert pd.api.types.is_object_dtype(out["TITLE"])
+    assert pd.api.types.is_object_dtype(cast_columns(data, schema)["FREQ"])
@@ -0,0 +1,313 @@
+from datetime import datetime, timezone
+import re
+
+import pandas as pd
+import pytest
+
+from pysdmx.errors import Invalid
+from pysdmx.model import (
+    Component,
+    ComponentMap,
+    Components,
+    Concept,
+    DataType,
+    DatePatternMap,
+    FixedValueMap,
+    ImplicitComponentMap,
+    MultiComponentMap,
+    MultiRepresentationMap,
+    MultiValueMap,
+    RepresentationMap,
+    Role,
+    Schema,
+    StructureMap,
+    ValueMap,
+)
+from pysdmx.model.dataset import ActionType, PandasDataset
+from pysdmx.toolkit.mapping import StructureMapper
+
+TARGET = "urn:sdmx:org.sdmx.infomodel.datastructure.DataStructure=BIS:TGT(1.0)"
+
+
+def structure_map(*maps):
+    return StructureMap("SM", "Structure map", "BIS", "SRC", TARGET, maps)
+
+
+def country_map(*maps):
+    return ComponentMap(
+        "COUNTRY",
+        "REF_AREA",
+        RepresentationMap("RM", "Countries", "BIS", None, None, maps),
+    )
+
+
+def currency_map(*maps):
+    return MultiComponentMap(
+        ["COUNTRY", "CURRENCY"],
+        ["CURRENCY"],
+        MultiRepresentationMap("MRM", "Currencies", "BIS", [], [], maps),
+    )
+
+
+@pytest.fixture()
+def dataset():
+    data = pd.DataFrame(
+        {
+            "COUNTRY": ["BE", "CH", "DE", "XX", None],
+            "CURRENCY": ["LC", "LC", "LC", "USD", "LC"],
+            "DATE": ["2023-09", "2023-10", "2024-01", "bad", None],
+            "VALUE": ["1", "2", "3", "4", "5"],
+        },
+        index=[10, 11, 12, 13, 14],
+    )
+    return PandasDataset(
+        structure="SRC",
+        data=data,
+        attributes={"SOURCE": "survey"},
+        action=ActionType.Append,
+    )
+
+
+@pytest.fixture()
+def schema():
+    components = [
+        Component("REF_AREA", True, Role.DIMENSION, Concept("REF_AREA")),
+        Component(
+            "OBS_VALUE",
+            False,
+            Role.MEASURE,
+            Concept("OBS_VALUE"),
+            local_dtype=DataType.INTEGER,
+        ),
+        Component("CONF_STATUS", True, Role.ATTRIBUTE, Concept("CONF")),
+    ]
+    return Schema("datastructure", "BIS", "TGT", Components(components))
+
+
+def test_component_map(dataset):
+    sm = structure_map(
+        country_map(
+            ValueMap("BE", "BEL"),
+            ValueMap("CH", "CHE"),
+            ValueMap("BE", "BELGIUM"),
+        )
+    )
+
+    out = StructureMapper(sm).apply(dataset)
+
+    assert out.structure == TARGET
+    assert out.action == ActionType.Append
+    assert list(out.data.index) == [10, 11, 12, 13, 14]
+    assert out.data["REF_AREA"].tolist()[:2] == ["BEL", "CHE"]
+    assert out.data["REF_AREA"].isna().tolist()[2:] == [True, True, True]
+
+
+def test_component_map_regex(dataset):
+    sm = structure_map(
+        country_map(
+            ValueMap(re.compile("[A-Z]{2}"), "OTHER"),
+            ValueMap("BE", "BEL"),
+            ValueMap(re.compile("X+"), "UNKNOWN"),
+        )
+    )
+
+    out = StructureMapper(sm).apply(dataset).data["REF_AREA"]
+
+    assert out.tolist()[:4] == ["BEL", "OTHER", "OTHER", "OTHER"]
+    assert pd.isna(out[14])
+
+
+def test_implicit_and_fixed_maps(dataset):
+    sm = structure_map(
+        ImplicitComponentMap("VALUE", "OBS_VALUE"),
+        ImplicitComponentMap("SOURCE", "SOURCE_AGENCY"),
+        FixedValueMap("CONF_STATUS", "F"),
+        FixedValueMap("IGNORED", "X", located_in="source"),
+    )
+
+    out = StructureMapper(sm).apply(dataset).data
+
+    assert list(out.columns) == ["OBS_VALUE", "SOURCE_AGENCY", "CONF_STATUS"]
+    assert out["OBS_VALUE"].tolist() == ["1", "2", "3", "4", "5"]
+    assert set(out["SOURCE_AGENCY"]) == {"survey"}
+    assert set(out["CONF_STATUS"]) == {"F"}
+
+
+def test_multi_component_map(dataset):
+    sm = structure_map(
+        currency_map(
+            MultiValueMap(["DE", "LC"], ["EUR"]),
+            MultiValueMap(["CH", "LC"], ["CHF"]),
+            MultiValueMap(["DE", "LC"], ["DEM"]),
+        )
+    )
+
+    out = StructureMapper(sm).apply(dataset).data["CURRENCY"]
+
+    assert list(out.index) == [10, 11, 12, 13, 14]
+    assert out[11] == "CHF"
+    assert out[12] == "EUR"
+    assert out.isna().tolist() == [True, False, False, True, True]
+
+
+def test_multi_component_map_regex(dataset):
+    sm = structure_map(
+        currency_map(
+            MultiValueMap(["CH", "LC"], ["CHF"]),
+            MultiValueMap([re.compile("B.|D."), "LC"], ["EUR"]),
+            MultiValueMap([re.compile(".*"), re.compile(".*")], ["N/A"]),
+        )
+    )
+
+    out = StructureMapper(sm).apply(dataset).data["CURRENCY"]
+
+    assert out.tolist()[:4] == ["EUR", "CHF", "EUR", "N/A"]
+    assert pd.isna(out[14])
+
+
+def test_first_value_wins(dataset):
+    sm = structure_map(
+        country_map(ValueMap("BE", "BEL")),
+        FixedValueMap("REF_AREA", "_Z"),
+        country_map(ValueMap("CH", "CHE")),
+    )
+
+    out = StructureMapper(sm).apply(dataset).data["REF_AREA"]
+
+    assert out.tolist() == ["BEL", "_Z", "_Z", "_Z", "_Z"]
+
+
+@pytest.mark.parametrize(
+    ("frequency", "expected"),
+    [
+        ("A", ["2023", "2023", "2024"]),
+        ("S", ["2023-S2", "2023-S2", "2024-S1"]),
+        ("Q", ["2023-Q3", "2023-Q4", "2024-Q1"]),
+        ("M", ["2023-09", "2023-10", "2024-01"]),
+        ("W", ["2023-W35", "2023-W39", "2024-W01"]),
+        ("D", ["2023-09-01", "2023-10-01", "2024-01-01"]),
+    ],
+)
+def test_date_pattern_map(dataset, frequency, expected):
+    sm = structure_map(
+        DatePatternMap("DATE", "TIME_PERIOD", "yyyy-MM", frequency)
+    )
+
+    out = StructureMapper(sm).apply(dataset).data["TIME_PERIOD"]
+
+    assert out.tolist()[:3] == expected
+    assert out.isna().tolist()[3:] == [True, True]
+
+
+def test_date_pattern_map_unsupported_frequency(dataset):
+    sm = structure_map(DatePatternMap("DATE", "TIME_PERIOD", "yyyy-MM", "H"))
+
+    with pytest.raises(Invalid, match="frequency H"):
+        StructureMapper(sm).apply(dataset)
+
+
+def test_variable_date_pattern_map(dataset):
+    sm = structure_map(
+        DatePatternMap(
+            "DATE", "TIME_PERIOD", "yyyy-MM", "FREQ", pattern_type="variable"
+        ),
+        ComponentMap(
+            "COUNTRY",
+            "FREQ",
+            RepresentationMap(
+                "CL_FREQ",
+                "Frequencies",
+                "BIS",
+                None,
+                None,
+                [ValueMap("BE", "Q"), ValueMap(re.compile(".*"), "A")],
+            ),
+        ),
+    )
+
+    out = StructureMapper(sm).apply(dataset).data
+
+    assert list(out.columns) == ["FREQ", "TIME_PERIOD"]
+    assert out["TIME_PERIOD"].tolist()[:3] == ["2023-Q3", "2023", "2024"]
+    assert out["TIME_PERIOD"].isna().tolist()[3:] == [True, True]
+
+
+def test_missing_source_component(dataset):
+    sm = structure_map(ImplicitComponentMap("MISSING", "OBS_VALUE"))
+
+    with pytest.raises(Invalid, match="MISSING"):
+        StructureMapper(sm).apply(dataset)
+
+
+def test_schema_order_and_types(dataset, schema):
+    sm = structure_map(
+        FixedValueMap("CONF_STATUS", "F"),
+        FixedValueMap("EXTRA", "X"),
+        ImplicitComponentMap("VALUE", "OBS_VALUE"),
+        country_map(ValueMap("BE", "BEL")),
+    )
+
+    out = StructureMapper(sm, schema).apply(dataset)
+
+    assert out.structure == schema
+    assert list(out.data.columns) == [
+        "REF_AREA",
+        "OBS_VALUE",
+        "CONF_STATUS",
+        "EXTRA",
+    ]
+    assert str(out.data["OBS_VALUE"].dtype) == "Int64"
+    assert out.data["OBS_VALUE"].tolist() == [1, 2, 3, 4, 5]
+
+
+def test_mapper_reusable(dataset):
+    mapper = StructureMapper(
+        structure_map(country_map(ValueMap(re.compile("C."), "CHE")))
+    )
+
+    first = mapper.apply(dataset).data
+    second = mapper.apply(dataset).data
+
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_dated_maps():
+    t1 = datetime(1998, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
+    t2 = datetime(1999, 1, 1, tzinfo=timezone.utc)
+    sm = structure_map(
+        currency_map(
+            MultiValueMap(["DE", "LC"], ["DEM"], valid_to=t1),
+            MultiValueMap(["DE", "LC"], ["EUR"], valid_from=t2),
+            MultiValueMap(["CH", "LC"], ["CHF"]),
+        ),
+        country_map(
+            ValueMap("DE", "DEU", valid_from=datetime(1990, 10, 3)),
+            ValueMap(re.compile("D."), "DDR", valid_to=datetime(1990, 10, 2)),
+        ),
+    )
+    data = pd.DataFrame(
+        {
+            "COUNTRY": ["DE", "DE", "DE", "CH", "DE", "DE"],
+            "CURRENCY": ["LC", "LC", "LC", "LC", "LC", "LC"],
+            "TIME_PERIOD": ["1990", "1998-12", "1999-Q1", "1980", None, "x"],
+        }
+    )
+    dataset = PandasDataset(structure="SRC", data=data)
+
+    out = StructureMapper(sm).apply(dataset).data
+
+    assert out["CURRENCY"].tolist() == ["DEM", "DEM", "EUR", "CHF", None, None]
+    assert out["REF_AREA"].tolist() == ["DDR", "DEU", "DEU", None, None, None]
+
+
+def test_dated_maps_without_time_period(dataset):
+    sm = structure_map(
+        country_map(
+            ValueMap("BE", "BEL", valid_to=datetime(2000, 1, 1)),
+            ValueMap("BE", "BELGIUM", valid_from=datetime(2000, 1, 1)),
+        )
+    )
+
+    out = StructureMapper(sm).apply(dataset).data["REF_AREA"]
+
+    assert out[10] == "BEL"
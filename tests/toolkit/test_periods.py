@@ -0,0 +1,33 @@
+import pandas as pd
+import pytest
+
+from pysdmx.toolkit.periods import period_start
+
+
+@pytest.mark.parametrize(
+    ("period", "expected"),
+    [
+        ("2024", "2024-01-01"),
+        ("2024-A1", "2024-01-01"),
+        ("2024-S2", "2024-07-01"),
+        ("2024-T3", "2024-09-01"),
+        ("2024-Q4", "2024-10-01"),
+        ("2024-M03", "2024-03-01"),
+        ("2024-W05", "2024-01-29"),
+        ("2024-D100", "2024-04-09"),
+        ("2024-03", "2024-03-01"),
+        ("2024-03-05", "2024-03-05"),
+        ("2024-03-05T12:00:00+02:00", "2024-03-05T10:00:00"),
+    ],
+)
+def test_period_start(period, expected):
+    out = period_start(pd.Series([period]))
+
+    assert out[0] == pd.Timestamp(expected, tz="UTC")
+
+
+def test_invalid_periods():
+    out = period_start(pd.Series(["bad", None, "2024-Q5", "2024-W60"]))
+
+    assert str(out.dtype) == "datetime64[ns, UTC]"
+    assert out.isna().all()
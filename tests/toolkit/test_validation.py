@@ -0,0 +1,297 @@
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from pysdmx.errors import Invalid
+from pysdmx.model import (
+    Code,
+    Codelist,
+    Component,
+    Components,
+    Concept,
+    DataType,
+    Facets,
+    HierarchicalCode,
+    Hierarchy,
+    Role,
+    Schema,
+)
+from pysdmx.model.dataset import PandasDataset
+from pysdmx.toolkit.validation import (
+    AttachmentChecker,
+    FacetChecker,
+    Rule,
+    Validator,
+)
+
+
+@pytest.fixture()
+def schema():
+    freq = Codelist(
+        "CL_FREQ", name="Frequency", agency="SDMX", items=[Code("A")]
+    )
+    areas = Hierarchy(
+        "H_AREA",
+        name="Areas",
+        agency="BIS",
+        codes=[HierarchicalCode("EU", codes=[HierarchicalCode("BE")])],
+    )
+    components = [
+        Component("FREQ", True, Role.DIMENSION, Concept("FREQ", codes=freq)),
+        Component(
+            "AREA", True, Role.DIMENSION, Concept("A"), local_codes=areas
+        ),
+        Component(
+            "OBS_VALUE",
+            False,
+            Role.MEASURE,
+            Concept("OBS_VALUE", dtype=DataType.DOUBLE),
+        ),
+        Component(
+            "OBS_COUNT",
+            False,
+            Role.ATTRIBUTE,
+            Concept("OBS_COUNT"),
+            local_dtype=DataType.INTEGER,
+        ),
+        Component("COMMENT", False, Role.ATTRIBUTE, Concept("COMMENT")),
+        Component("UNIT", True, Role.ATTRIBUTE, Concept("UNIT")),
+        Component("SOURCE", True, Role.ATTRIBUTE, Concept("SOURCE")),
+    ]
+    return Schema("datastructure", "BIS", "TEST", Components(components))
+
+
+def test_valid_dataset(schema):
+    data = pd.DataFrame(
+        {
+            "FREQ": ["A", "A"],
+            "AREA": ["EU", "BE"],
+            "OBS_VALUE": ["1.5", None],
+            "OBS_COUNT": [1, 2],
+            "UNIT": ["EUR", "EUR"],
+        }
+    )
+    ds = PandasDataset(structure=schema, data=data, attributes={"SOURCE": "X"})
+
+    errors = Validator(schema).validate(ds)
+
+    assert list(errors.columns) == ["row", "component", "rule"]
+    assert errors.empty
+
+
+def test_all_violations_reported(schema):
+    data = pd.DataFrame(
+        {
+            "FREQ": ["A", "M", None, "Q"],
+            "AREA": ["EU", "FR", "BE", "BE"],
+            "OBS_VALUE": ["1.5", "abc", None, "2"],
+            "OBS_COUNT": ["1", "1.5", "x", None],
+            "UNIT": ["EUR", None, "EUR", "EUR"],
+        },
+        index=["a", "b", "c", "d"],
+    )
+    ds = PandasDataset(structure=schema, data=data)
+
+    errors = Validator(schema).validate(ds)
+
+    actual = {(r.row, r.component, r.rule) for r in errors.itertuples()}
+    assert actual == {
+        ("b", "FREQ", Rule.ENUMERATION),
+        ("c", "FREQ", Rule.MANDATORY),
+        ("d", "FREQ", Rule.ENUMERATION),
+        ("b", "AREA", Rule.ENUMERATION),
+        ("b", "OBS_VALUE", Rule.DTYPE),
+        ("b", "OBS_COUNT", Rule.DTYPE),
+        ("c", "OBS_COUNT", Rule.DTYPE),
+        ("b", "UNIT", Rule.MANDATORY),
+        (None, "SOURCE", Rule.MISSING),
+    }
+    assert isinstance(errors["component"].dtype, pd.CategoricalDtype)
+
+
+def test_dataset_level_attributes(schema):
+    data = pd.DataFrame({"FREQ": ["A"], "AREA": ["BE"], "SOURCE": ["X"]})
+    attributes = {"FREQ": "M", "OBS_COUNT": "many", "UNIT": None}
+    ds = PandasDataset(structure=schema, data=data, attributes=attributes)
+
+    errors = Validator(schema).validate(ds)
+
+    assert errors.to_dict("list") == {
+        "row": [None, None],
+        "component": ["OBS_COUNT", "UNIT"],
+        "rule": ["dtype", "mandatory"],
+    }
+
+
+def test_categorical_and_numeric_codes():
+    codes = Codelist("CL", name="CL", agency="BIS", items=[Code("1")])
+    schema = Schema(
+        "datastructure",
+        "BIS",
+        "TEST",
+        Components(
+            [Component("C", True, Role.DIMENSION, Concept("C", codes=codes))]
+        ),
+    )
+    for values in (
+        pd.Series(["1", "2"], dtype="category"),
+        pd.Series([1, 2]),
+    ):
+        data = pd.DataFrame({"C": values})
+        ds = PandasDataset(structure=schema, data=data)
+
+        errors = Validator(schema).validate(ds)
+
+        assert errors["row"].tolist() == [1]
+
+
+@pytest.mark.parametrize(
+    ("facets", "values", "expected"),
+    [
+        (Facets(min_length=2, max_length=3), ["A", "AB", "ABCD"], [0, 2]),
+        (Facets(min_value=0, max_value=10), [-1, 10, "11", "x"], [0, 2]),
+        (Facets(pattern="[A-Z]{2}"), ["AB", "ABC", "ab"], [1, 2]),
+        (Facets(decimals=2), ["1.25", 1.1, "1.001", 0.0001], [2, 3]),
+        (
+            Facets(
+                start_time=datetime(2000, 1, 1),
+                end_time=datetime(2009, 12, 31),
+            ),
+            ["1999", "2000-Q1", "2009-12", "2010-01-01", "x"],
+            [0, 3],
+        ),
+    ],
+)
+def test_facet_checker(facets, values, expected):
+    checker = FacetChecker(facets)
+
+    violations = list(checker.violations(pd.Series(values + [None])))
+
+    assert len(checker) == 1
+    assert len(violations) == 1
+    assert violations[0][1].nonzero()[0].tolist() == expected
+
+
+def test_facets_validated():
+    facets = Facets(max_length=2, pattern="[A-Z]+")
+    schema = Schema(
+        "datastructure",
+        "BIS",
+        "TEST",
+        Components(
+            [
+                Component(
+                    "C",
+                    False,
+                    Role.ATTRIBUTE,
+                    Concept("C"),
+                    local_facets=facets,
+                )
+            ]
+        ),
+    )
+    data = pd.DataFrame({"C": ["AB", "abc", None, "A1"]})
+    ds = PandasDataset(structure=schema, data=data)
+
+    errors = Validator(schema).validate(ds)
+
+    assert errors.to_dict("list") == {
+        "row": [1, 1, 3],
+        "component": ["C", "C", "C"],
+        "rule": ["length", "pattern", "pattern"],
+    }
+
+
+@pytest.fixture()
+def series_schema():
+    components = [
+        Component("FREQ", True, Role.DIMENSION, Concept("FREQ")),
+        Component("AREA", True, Role.DIMENSION, Concept("AREA")),
+        Component("TIME_PERIOD", True, Role.DIMENSION, Concept("TP")),
+        Component(
+            "TITLE",
+            False,
+            Role.ATTRIBUTE,
+            Concept("TITLE"),
+            attachment_level="FREQ,AREA",
+        ),
+        Component(
+            "UNIT",
+            False,
+            Role.ATTRIBUTE,
+            Concept("UNIT"),
+            attachment_level="FREQ, AREA",
+        ),
+        Component(
+            "DECIMALS",
+            False,
+            Role.ATTRIBUTE,
+            Concept("DECIMALS"),
+            attachment_level="AREA",
+        ),
+        Component(
+            "STATUS",
+            False,
+            Role.ATTRIBUTE,
+            Concept("STATUS"),
+            attachment_level="O",
+        ),
+    ]
+    return Schema("datastructure", "BIS", "TEST", Components(components))
+
+
+@pytest.fixture()
+def series_dataset(series_schema):
+    data = pd.DataFrame(
+        {
+            "FREQ": ["A", "A", "A", "M", "M"],
+            "AREA": ["BE", "BE", "CH", "BE", "BE"],
+            "TIME_PERIOD": ["2023", "2024", "2024", "2024-01", "2024-02"],
+            "TITLE": ["Belgium", None, "Swiss", "Belgium", "Belgium"],
+            "UNIT": ["EUR", "EUR", "CHF", "EUR", "USD"],
+            "DECIMALS": ["2", "2", "2", "2", "2"],
+            "STATUS": ["A", "B", "A", "A", "A"],
+        }
+    )
+    return PandasDataset(structure=series_schema, data=data)
+
+
+def test_attachment_inconsistencies(series_schema, series_dataset):
+    checker = AttachmentChecker(series_schema)
+
+    out = checker.inconsistencies(series_dataset)
+
+    assert list(out) == ["UNIT"]
+    assert out["UNIT"].to_dict("list") == {"FREQ": ["M"], "AREA": ["BE"]}
+
+
+def test_attachment_validated(series_schema, series_dataset):
+    errors = Validator(series_schema).validate(series_dataset)
+
+    assert errors.to_dict("list") == {
+        "row": [3, 4],
+        "component": ["UNIT", "UNIT"],
+        "rule": ["attachment", "attachment"],
+    }
+
+
+def test_attachment_collapse(series_schema, series_dataset):
+    checker = AttachmentChecker(series_schema)
+    data = series_dataset.data.drop(columns="UNIT")
+    dataset = PandasDataset(structure=series_schema, data=data)
+
+    out = checker.collapse(dataset)
+
+    assert list(out) == ["FREQ,AREA", "AREA"]
+    assert out["FREQ,AREA"].to_dict("list") == {
+        "FREQ": ["A", "A", "M"],
+        "AREA": ["BE", "CH", "BE"],
+        "TITLE": ["Belgium", "Swiss", "Belgium"],
+    }
+    assert out["AREA"].to_dict("list") == {
+        "AREA": ["BE", "CH"],
+        "DECIMALS": ["2", "2"],
+    }
+    with pytest.raises(Invalid, match="UNIT"):
+        checker.collapse(series_dataset)
@@ -137,3 +137,13 @@ def test_week_in_month():
 def test_empty():
     with pytest.raises(Invalid):
         convert_dpm("")
+
+
+def test_translations_cached():
+    convert_dpm.cache_clear()
+
+    first = convert_dpm("MMM yy")
+    second = convert_dpm("MMM yy")
+
+    assert first == second == "%b %y"
+    assert convert_dpm.cache_info().hits == 1
@@ -2,7 +2,8 @@ import pytest
 
 from pysdmx.errors import NotFound
 from pysdmx.io.json.sdmxjson2.messages.code import JsonCodelist
-from pysdmx.util import find_by_urn
+from pysdmx.model import Agency, Codelist
+from pysdmx.util import ArtefactIndex, find_by_urn
 
 
 @pytest.fixture()
@@ -27,3 +28,45 @@ def test_match(codelists):
     assert m.agency == "BIS"
     assert m.id == "CL_FREQ"
     assert m.version == "1.0"
+
+
+def test_match_with_index(codelists):
+    good = "urn:sdmx:org.sdmx.infomodel.codelist.Codelist=BIS:CL_AREA(1.0)"
+
+    m = find_by_urn(ArtefactIndex(codelists), good)
+
+    assert m is codelists[1]
+
+
+def test_no_match_with_index(codelists):
+    bad = "urn:sdmx:org.sdmx.infomodel.codelist.Codelist=SDMX:CL_FREQ(1.0)"
+    with pytest.raises(NotFound, match="CL_FREQ"):
+        find_by_urn(ArtefactIndex(codelists), bad)
+
+
+def test_index_is_a_sequence(codelists):
+    index = ArtefactIndex(codelists)
+
+    assert len(index) == 2
+    assert list(index) == codelists
+    assert index[0] is codelists[0]
+
+
+def test_index_short_urn(codelists):
+    index = ArtefactIndex(codelists)
+
+    assert index.find("Codelist=BIS:CL_FREQ(1.0)") is codelists[0]
+    assert index.find("ValueList=BIS:CL_FREQ(1.0)") is codelists[0]
+    assert index.get("BIS", "CL_AREA", "1.0") is codelists[1]
+    assert index.get("BIS", "CL_AREA", "2.0") is None
+    with pytest.raises(NotFound):
+        index.find("Codelist=BIS:CL_AREA(2.0)")
+    with pytest.raises(NotFound):
+        index.find("CL_AREA")
+
+
+def test_index_agency_object():
+    cl = Codelist("CL_FREQ", agency=Agency("BIS"))
+    index = ArtefactIndex([cl])
+
+    assert index.find("Codelist=BIS:CL_FREQ(1.0)") is cl
@@ -1,7 +1,7 @@
 import pytest
 
 from pysdmx.errors import NotFound
-from pysdmx.util import ItemReference, parse_item_urn
+from pysdmx.util import ItemReference, parse_item_urn, parse_item_urns
 
 
 def test_no_match():
@@ -20,3 +20,29 @@ def test_match():
     assert m.id == "CL_FREQ"
     assert m.version == "1.0"
     assert m.item_id == "A"
+
+
+def test_match_dotted_item():
+    cl = "urn:sdmx:org.sdmx.infomodel.codelist.Code=SDMX:CL_X(1.0).A.B"
+
+    m = parse_item_urn(cl)
+
+    assert m.id == "CL_X"
+    assert m.version == "1.0"
+    assert m.item_id == "A.B"
+
+
+def test_no_match_maintainable():
+    with pytest.raises(NotFound):
+        parse_item_urn(
+            "urn:sdmx:org.sdmx.infomodel.codelist.Codelist=SDMX:CL_FREQ(1.0)"
+        )
+
+
+def test_parse_item_urns():
+    prefix = "urn:sdmx:org.sdmx.infomodel.datastructure.Dimension=BIS:DSD(1.0)"
+
+    refs = parse_item_urns([f"{prefix}.FREQ", f"{prefix}.AREA"])
+
+    assert [r.item_id for r in refs] == ["FREQ", "AREA"]
+    assert all(r.id == "DSD" for r in refs)
@@ -1,7 +1,7 @@
 import pytest
 
 from pysdmx.errors import NotFound
-from pysdmx.util import parse_urn, Reference
+from pysdmx.util import parse_urn, parse_urns, Reference
 
 
 def test_no_match():
@@ -19,3 +19,52 @@ def test_match():
     assert m.agency == "SDMX"
     assert m.id == "CL_FREQ"
     assert m.version == "1.0"
+
+
+def test_no_match_short_urn():
+    with pytest.raises(NotFound):
+        parse_urn("Codelist=SDMX:CL_FREQ(1.0)")
+
+
+@pytest.mark.parametrize(
+    "urn",
+    [
+        "urn:sdmx:org.sdmx.infomodel.codelist.Codelist=SDMX:CL=X(1.0)",
+        "urn:sdmx:org.sdmx.infomodel.codelist.Codelist=SDMX:CL_X((1.0)",
+    ],
+)
+def test_no_match_malformed(urn):
+    with pytest.raises(NotFound):
+        parse_urn(urn)
+
+
+def test_match_dotted_agency():
+    cl = "urn:sdmx:org.sdmx.infomodel.codelist.Codelist=BIS.MU:CL_X(1.0.0)"
+
+    m = parse_urn(cl)
+
+    assert m.sdmx_type == "Codelist"
+    assert m.agency == "BIS.MU"
+    assert m.id == "CL_X"
+    assert m.version == "1.0.0"
+
+
+def test_parse_cached():
+    cl = "urn:sdmx:org.sdmx.infomodel.codelist.Codelist=SDMX:CL_FREQ(1.0)"
+
+    assert parse_urn(cl) is parse_urn(cl)
+
+
+def test_parse_urns():
+    cl1 = "urn:sdmx:org.sdmx.infomodel.codelist.Codelist=SDMX:CL_FREQ(1.0)"
+    cl2 = "urn:sdmx:org.sdmx.infomodel.codelist.Codelist=BIS:CL_AREA(2.0)"
+
+    refs = parse_urns(iter([cl1, cl2, cl1]))
+
+    assert [r.id for r in refs] == ["CL_FREQ", "CL_AREA", "CL_FREQ"]
+    assert refs[0] is refs[2]
+
+
+def test_parse_urns_invalid():
+    with pytest.raises(NotFound):
+        parse_urns(["test"])
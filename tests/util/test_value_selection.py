@@ -0,0 +1,67 @@
+from pysdmx.util._value_selection import merge_cube_regions, ValueSelection
+
+
+def test_all_by_default():
+    s = ValueSelection()
+
+    assert s.is_all
+    assert "A" in s
+
+
+def test_include_exclude():
+    included = ValueSelection.of(["A", "M"])
+    excluded = ValueSelection.of(["A"], include=False)
+
+    assert "A" in included
+    assert "Q" not in included
+    assert "A" not in excluded
+    assert "Q" in excluded
+    assert not excluded.is_all
+
+
+def test_union_and_intersection():
+    am = ValueSelection.of(["A", "M"])
+    not_m = ValueSelection.of(["M"], include=False)
+
+    assert am | not_m == ValueSelection()
+    assert am & not_m == ValueSelection.of(["A"])
+    assert ~am == ValueSelection.of(["A", "M"], include=False)
+
+
+def test_merge_included_regions():
+    merged = merge_cube_regions(
+        [
+            (
+                True,
+                {
+                    "FREQ": ValueSelection.of(["A"]),
+                    "AREA": ValueSelection.of(["BE"]),
+                },
+            ),
+            (True, {"FREQ": ValueSelection.of(["M"])}),
+        ]
+    )
+
+    assert merged == {"FREQ": ValueSelection.of(["A", "M"])}
+
+
+def test_merge_excluded_regions():
+    merged = merge_cube_regions(
+        [
+            (True, {"FREQ": ValueSelection.of(["A", "M"])}),
+            (False, {"FREQ": ValueSelection.of(["M"])}),
+            (False, {"AREA": ValueSelection.of(["BE"])}),
+            (
+                False,
+                {
+                    "FREQ": ValueSelection.of(["A"]),
+                    "AREA": ValueSelection.of(["FR"]),
+                },
+            ),
+        ]
+    )
+
+    assert merged == {
+        "FREQ": ValueSelection.of(["A"]),
+        "AREA": ValueSelection.of(["BE"], include=False),
+    }